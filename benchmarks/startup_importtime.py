@@ -0,0 +1,99 @@
+"""
+Startup benchmark for the `leetcode` CLI.
+
+Runs `python -X importtime -m leetcode_cli.cli <command> --help` for every subcommand and
+reports how much time each one spends importing modules, how many modules it loads and
+which heavy dependencies (requests, bs4, yaml) it pulls in.
+
+Usage:
+    python benchmarks/startup_importtime.py [--repeat N] [--json] [COMMAND ...]
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+sys.path.insert(0, SRC_DIR)
+
+from leetcode_cli.cli import LAZY_COMMANDS  # noqa: E402
+
+HEAVY_MODULES = ("requests", "urllib3", "bs4", "yaml")
+
+# "import time:       196 |      23343 |       importlib.resources"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def measure(command: str | None) -> dict:
+    """
+    Runs one `--help` invocation under -X importtime and summarises its stderr.
+    """
+    argv = [sys.executable, "-X", "importtime", "-m", "leetcode_cli.cli"]
+    if command:
+        argv.append(command)
+    argv.append("--help")
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [SRC_DIR, os.environ.get("PYTHONPATH")])))
+
+    start = time.perf_counter()
+    completed = subprocess.run(argv, capture_output=True, text=True, env=env, check=False)
+    wall = time.perf_counter() - start
+
+    if completed.returncode != 0:
+        raise RuntimeError(f"'{' '.join(argv)}' failed:\n{completed.stderr}")
+
+    modules = {}
+    for line in completed.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, _, _, name = match.groups()
+            modules[name] = int(self_us)
+
+    return {
+        "import_ms": sum(modules.values()) / 1000,
+        "modules": len(modules),
+        "heavy": sorted(name for name in HEAVY_MODULES if name in modules),
+        "wall_ms": wall * 1000,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("commands", nargs="*", help="Subcommands to measure (default: all, plus the bare group).")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per command; the median is reported.")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON for tracking over time.")
+    args = parser.parse_args()
+
+    commands = args.commands or [None, *LAZY_COMMANDS]
+    results = {}
+
+    for command in commands:
+        runs = [measure(command) for _ in range(max(args.repeat, 1))]
+        results[command or "(group)"] = {
+            "import_ms": round(statistics.median(r["import_ms"] for r in runs), 2),
+            "wall_ms": round(statistics.median(r["wall_ms"] for r in runs), 2),
+            "modules": runs[-1]["modules"],
+            "heavy": runs[-1]["heavy"],
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"{'command':<20} {'imports (ms)':>12} {'wall (ms)':>10} {'modules':>8}  heavy deps")
+    for name, r in results.items():
+        print(
+            f"{name:<20} {r['import_ms']:>12.2f} {r['wall_ms']:>10.2f} {r['modules']:>8}  {', '.join(r['heavy']) or '-'}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
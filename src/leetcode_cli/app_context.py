@@ -0,0 +1,86 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from leetcode_cli.managers.auth_service import AuthService
+from leetcode_cli.managers.config_manager import ConfigManager
+
+if TYPE_CHECKING:
+    from leetcode_cli.managers.code_manager import CodeManager
+    from leetcode_cli.managers.formatting_config_manager import FormattingConfigManager
+    from leetcode_cli.managers.local_runner import LocalRunner
+    from leetcode_cli.managers.problem_manager import ProblemManager
+    from leetcode_cli.managers.problemset_manager import ProblemSetManager
+    from leetcode_cli.managers.stats_manager import StatsManager
+    from leetcode_cli.managers.theme_manager import ThemeManager
+    from leetcode_cli.models.formatting_config import FormattingConfig
+
+
+class AppContext:
+    """
+    Shared managers for one CLI invocation, created in `cli()` and stored in `ctx.obj`.
+
+    Every manager is built on first access and reused afterwards, so config.json is read once
+    and the formatting config is parsed once per process. Manager modules are imported inside
+    the properties so commands only load the managers they actually use.
+    """
+
+    def __init__(self, config_manager: ConfigManager | None = None):
+        self._config_manager = config_manager
+
+    @cached_property
+    def config_manager(self) -> ConfigManager:
+        return self._config_manager or ConfigManager()
+
+    @cached_property
+    def auth_service(self) -> AuthService:
+        return AuthService(self.config_manager)
+
+    @cached_property
+    def code_manager(self) -> "CodeManager":
+        from leetcode_cli.managers.code_manager import CodeManager
+
+        return CodeManager(self.config_manager)
+
+    @cached_property
+    def problemset_manager(self) -> "ProblemSetManager":
+        from leetcode_cli.managers.problemset_manager import ProblemSetManager
+
+        return ProblemSetManager(self.config_manager, self.auth_service)
+
+    @cached_property
+    def problem_manager(self) -> "ProblemManager":
+        from leetcode_cli.data_fetchers.problem_archive import get_problem_archive
+        from leetcode_cli.managers.problem_manager import ProblemManager
+
+        return ProblemManager(self.config_manager, self.auth_service, self.problemset_manager, get_problem_archive())
+
+    @cached_property
+    def local_runner(self) -> "LocalRunner":
+        from leetcode_cli.managers.local_runner import LocalRunner
+
+        return LocalRunner(self.problem_manager)
+
+    @cached_property
+    def stats_manager(self) -> "StatsManager":
+        from leetcode_cli.managers.stats_manager import StatsManager
+
+        return StatsManager(self.config_manager, self.auth_service)
+
+    @cached_property
+    def theme_manager(self) -> "ThemeManager":
+        from leetcode_cli.managers.theme_manager import ThemeManager
+
+        return ThemeManager(self.config_manager)
+
+    @cached_property
+    def formatting_config_manager(self) -> "FormattingConfigManager":
+        from leetcode_cli.managers.formatting_config_manager import FormattingConfigManager
+
+        return FormattingConfigManager(self.config_manager)
+
+    @cached_property
+    def formatting_config(self) -> "FormattingConfig":
+        """
+        The parsed formatting_config.yaml. Raises ConfigError if it cannot be loaded.
+        """
+        return self.formatting_config_manager.load_formatting_config()
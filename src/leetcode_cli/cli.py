@@ -1,24 +1,82 @@
+import importlib
 import logging
+import os
 
 import click
 
-from leetcode_cli.commands.config import config_cmd
-from leetcode_cli.commands.create_solution import create_cmd
-from leetcode_cli.commands.download_problems import download_problems_cmd
-from leetcode_cli.commands.list_problems import list_cmd
-from leetcode_cli.commands.show_problem import show_cmd
-from leetcode_cli.commands.show_random import random_cmd
-from leetcode_cli.commands.stats import stats_cmd
-from leetcode_cli.commands.submit import submit_cmd
-from leetcode_cli.commands.test_solution import test_cmd
-from leetcode_cli.commands.theme import theme_cmd
+from leetcode_cli.app_context import AppContext
+from leetcode_cli.data_fetchers.problem_archive import PROBLEM_ARCHIVE_FILENAME, configure_problem_archive
+from leetcode_cli.data_fetchers.response_cache import configure_response_cache
 from leetcode_cli.init_app_files import initialize_leetcode_cli
 
+# Subcommands in display order, as ("module:attribute" import path, short help). The short help
+# is repeated here so that `leetcode --help` can list the commands without importing any of them;
+# keep it in sync with each command's `short_help`.
+LAZY_COMMANDS = {
+    "list": ("leetcode_cli.commands.list_problems:list_cmd", "List LeetCode problems with optional filters"),
+    "show": ("leetcode_cli.commands.show_problem:show_cmd", "Show problem details"),
+    "random": ("leetcode_cli.commands.show_random:random_cmd", "Show a random problem"),
+    "create": ("leetcode_cli.commands.create_solution:create_cmd", "Create a solution file for a LeetCode problem"),
+    "test": ("leetcode_cli.commands.test_solution:test_cmd", "Test solution files"),
+    "submit": ("leetcode_cli.commands.submit:submit_cmd", "Submit solution files to LeetCode"),
+    "stats": ("leetcode_cli.commands.stats:stats_cmd", "Display user statistics from LeetCode"),
+    "config": ("leetcode_cli.commands.config:config_cmd", "Configure user settings"),
+    "theme": ("leetcode_cli.commands.theme:theme_cmd", "Change or list themes"),
+    "download-problems": (
+        "leetcode_cli.commands.download_problems:download_problems_cmd",
+        "Download all problems metadata",
+    ),
+}
+
+
+class LazyGroup(click.Group):
+    """
+    Group that imports a subcommand's module only when that subcommand is resolved.
+
+    Command modules pull in managers, formatters, requests, bs4 and yaml, so importing all of
+    them up front made every invocation (even `leetcode config`) pay for every command. The
+    group's own help lists the stored short help instead of resolving each command.
+    """
+
+    def __init__(self, *args, lazy_commands: dict[str, tuple[str, str]] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
 
-class OrderedGroup(click.Group):
     def list_commands(self, ctx):
-        """List commands in the order they were added."""
-        return self.commands.keys()
+        """List commands in the order they were registered."""
+        return [*self.lazy_commands, *(name for name in self.commands if name not in self.lazy_commands)]
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            self.add_command(self._load_command(cmd_name), cmd_name)
+
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        """List commands with their short help, without importing the ones not loaded yet."""
+        cmd_names = self.list_commands(ctx)
+        limit = formatter.width - 6 - max((len(name) for name in cmd_names), default=0)
+
+        rows = []
+        for cmd_name in cmd_names:
+            command = self.commands.get(cmd_name)
+            if command is None:
+                rows.append((cmd_name, self.lazy_commands[cmd_name][1]))
+            elif not command.hidden:
+                rows.append((cmd_name, command.get_short_help_str(limit)))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        module_name, attr_name = self.lazy_commands[cmd_name][0].split(":")
+        command = getattr(importlib.import_module(module_name), attr_name)
+
+        if not isinstance(command, click.Command):
+            raise TypeError(f"Lazy command '{cmd_name}' does not resolve to a click command.")
+
+        return command
 
 
 VERBOSITY_LEVELS = {
@@ -39,7 +97,8 @@ def configure_logging(verbosity: int = 0):
 
 
 @click.group(
-    cls=OrderedGroup,
+    cls=LazyGroup,
+    lazy_commands=LAZY_COMMANDS,
     context_settings=dict(help_option_names=["-h", "--help"], max_content_width=200),
 )
 @click.option("-v", "--verbose", count=True, help="Increase log verbosity: -v (warnings), -vv (info), -vvv (debug).")
@@ -51,23 +110,14 @@ def cli(ctx, verbose):
     Manage your LeetCode activities directly from the command line.
     """
     configure_logging(verbose)
-    initialize_leetcode_cli()
+    config_manager = initialize_leetcode_cli()
+    configure_response_cache(os.path.join(config_manager.config_dir, "cache"))
+    configure_problem_archive(os.path.join(config_manager.config_dir, PROBLEM_ARCHIVE_FILENAME))
+    ctx.obj = AppContext(config_manager)
     if ctx.invoked_subcommand is None:
         click.echo(cli.get_help(ctx))
 
 
-cli.add_command(list_cmd, "list")
-cli.add_command(show_cmd, "show")
-cli.add_command(random_cmd, "random")
-cli.add_command(create_cmd, "create")
-cli.add_command(test_cmd, "test")
-cli.add_command(submit_cmd, "submit")
-cli.add_command(stats_cmd, "stats")
-cli.add_command(config_cmd, "config")
-cli.add_command(theme_cmd, "theme")
-cli.add_command(download_problems_cmd, "download-problems")
-
-
 def main():
     cli()
 
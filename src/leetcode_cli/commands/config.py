@@ -2,8 +2,8 @@ import logging
 
 import click
 
+from leetcode_cli.app_context import AppContext
 from leetcode_cli.exceptions.exceptions import ConfigError
-from leetcode_cli.managers.config_manager import ConfigManager
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +11,8 @@ logger = logging.getLogger(__name__)
 @click.command(short_help="Configure user settings")
 @click.argument("key", required=False)
 @click.argument("value", required=False)
-def config_cmd(key, value):
+@click.pass_context
+def config_cmd(ctx, key, value):
     """
     Configure or view user settings.
 
@@ -22,7 +23,8 @@ def config_cmd(key, value):
     valid_keys = ["cookie", "username", "language"]
 
     try:
-        config_manager = ConfigManager()
+        app = ctx.ensure_object(AppContext)
+        config_manager = app.config_manager
 
         # If no key was provided, just print out the current config
         if not key:
@@ -2,30 +2,34 @@ import logging
 
 import click
 
+from leetcode_cli.app_context import AppContext
+from leetcode_cli.concurrency import run_concurrently
+from leetcode_cli.data_fetchers.problem_archive import bypass_problem_archive
+from leetcode_cli.data_fetchers.response_cache import bypass_response_cache
 from leetcode_cli.exceptions.exceptions import CodeError, ConfigError, ProblemError
-from leetcode_cli.managers.auth_service import AuthService
-from leetcode_cli.managers.code_manager import CodeManager
-from leetcode_cli.managers.config_manager import ConfigManager
-from leetcode_cli.managers.problem_manager import ProblemManager
-from leetcode_cli.managers.problemset_manager import ProblemSetManager
 
 logger = logging.getLogger(__name__)
 
 
 @click.command(short_help="Create a solution file for a LeetCode problem")
 @click.argument("title_slug_or_id", required=False, metavar="TITLE_SLUG_OR_ID")
-def create_cmd(title_slug_or_id):
+@click.option("--no-cache", is_flag=True, default=False, help="Ignore cached problem data and fetch it again.")
+@click.pass_context
+def create_cmd(ctx, title_slug_or_id, no_cache):
     """
     Create a solution file for the specified LeetCode problem.
 
     Usage Examples: leetcode create, leetcode create .cpp, leetcode create two-sum.py, leetcode create 1.two-sum.py, leetcode create two-sum, leetcode create 1, leetcode create 1.cpp
     """
+    if no_cache:
+        bypass_response_cache()
+        bypass_problem_archive()
+
     try:
-        config_manager = ConfigManager()
-        auth_service = AuthService(config_manager)
-        code_manager = CodeManager(config_manager)
-        problemset_manager = ProblemSetManager(config_manager, auth_service)
-        problem_manager = ProblemManager(config_manager, auth_service, problemset_manager)
+        app = ctx.ensure_object(AppContext)
+        config_manager = app.config_manager
+        code_manager = app.code_manager
+        problem_manager = app.problem_manager
 
         # If user doesn't provide an argument => use the chosen problem
         if not title_slug_or_id:
@@ -48,11 +52,13 @@ def create_cmd(title_slug_or_id):
                 return
 
             try:
-                frontend_id = problem_manager.get_problem_frontend_id(title_slug)
                 # Let code_manager handle extension -> lang
                 lang_slug, file_extension = code_manager.infer_lang_and_ext(user_ext=file_ext)
-                code_manager.create_solution_file_with_snippet(frontend_id, title_slug, lang_slug, file_extension)
-                click.echo(f"Solution file '{frontend_id}.{title_slug}.{file_extension}' created successfully.")
+                frontend_id, code_snippet = _resolve_frontend_id_and_snippet(app, title_slug, lang_slug)
+                file_name = code_manager.create_solution_file_with_snippet(
+                    frontend_id, title_slug, lang_slug, file_extension, code_snippet
+                )
+                click.echo(f"Solution file '{file_name}' created successfully.")
                 return
 
             except (ProblemError, CodeError) as e:
@@ -97,9 +103,11 @@ def create_cmd(title_slug_or_id):
                 title_slug, user_ext = parts[0], parts[1]
                 lang_slug, file_extension = code_manager.infer_lang_and_ext(user_ext=user_ext)
                 try:
-                    frontend_id = problem_manager.get_problem_frontend_id(title_slug)
-                    code_manager.create_solution_file_with_snippet(frontend_id, title_slug, lang_slug, file_extension)
-                    click.echo(f"Solution file '{frontend_id}.{title_slug}.{file_extension}' created successfully.")
+                    frontend_id, code_snippet = _resolve_frontend_id_and_snippet(app, title_slug, lang_slug)
+                    file_name = code_manager.create_solution_file_with_snippet(
+                        frontend_id, title_slug, lang_slug, file_extension, code_snippet
+                    )
+                    click.echo(f"Solution file '{file_name}' created successfully.")
                 except (ProblemError, CodeError) as e:
                     click.echo(f"Error: {e}")
             else:
@@ -130,14 +138,13 @@ def create_cmd(title_slug_or_id):
                 # e.g. "two-sum"
                 try:
                     # We only have the slug => retrieve the frontend ID from problem_manager
-                    frontend_id = problem_manager.get_problem_frontend_id(title_slug_or_id)
+                    # while the snippet is being fetched
                     lang_slug, file_extension = code_manager.infer_lang_and_ext()
-                    code_manager.create_solution_file_with_snippet(
-                        frontend_id, title_slug_or_id, lang_slug, file_extension
-                    )
-                    click.echo(
-                        f"Solution file '{frontend_id}.{title_slug_or_id}.{file_extension}' created successfully."
+                    frontend_id, code_snippet = _resolve_frontend_id_and_snippet(app, title_slug_or_id, lang_slug)
+                    file_name = code_manager.create_solution_file_with_snippet(
+                        frontend_id, title_slug_or_id, lang_slug, file_extension, code_snippet
                     )
+                    click.echo(f"Solution file '{file_name}' created successfully.")
 
                 except (ProblemError, CodeError) as e:
                     click.echo(f"Error: {e}")
@@ -149,3 +156,14 @@ def create_cmd(title_slug_or_id):
     except Exception:
         logger.exception("An unexpected error occurred during solution creation.")
         click.echo("An unexpected error occurred. Please try again.", err=True)
+
+
+def _resolve_frontend_id_and_snippet(app: AppContext, title_slug: str, lang_slug: str) -> tuple[str, str]:
+    """
+    Looks up the frontend ID of a problem while its code snippet is being fetched.
+    """
+    frontend_id, code_snippet = run_concurrently(
+        lambda: app.problem_manager.get_problem_frontend_id(title_slug),
+        lambda: app.code_manager.get_code_snippet(title_slug, lang_slug),
+    )
+    return str(frontend_id), code_snippet
@@ -2,47 +2,77 @@ import logging
 
 import click
 
-from leetcode_cli.data_fetchers.problemset_data_fetcher import fetch_problemset_metadata
+from leetcode_cli.app_context import AppContext
+from leetcode_cli.data_fetchers.graphql_queries import POOL_SIZE
 from leetcode_cli.exceptions.exceptions import ConfigError, ProblemSetError
-from leetcode_cli.managers.auth_service import AuthService
-from leetcode_cli.managers.config_manager import ConfigManager
-from leetcode_cli.managers.problemset_manager import ProblemSetManager
+from leetcode_cli.managers.problem_manager import DEFAULT_ARCHIVE_WORKERS
 
 logger = logging.getLogger(__name__)
 
+# Failed problems listed by name after a full download; the rest are only counted.
+MAX_LISTED_FAILURES = 10
+
 
 @click.command(short_help="Download all problems metadata")
-def download_problems_cmd():
+@click.option(
+    "--sync",
+    is_flag=True,
+    default=False,
+    help="Only fetch problems added since the last download and merge them into the local metadata.",
+)
+@click.option(
+    "--full",
+    is_flag=True,
+    default=False,
+    help="Also archive every problem's description, code snippets and testcases for offline use.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(1, POOL_SIZE),
+    default=DEFAULT_ARCHIVE_WORKERS,
+    show_default=True,
+    help="Number of problems fetched at once with --full.",
+)
+@click.option(
+    "--refresh", is_flag=True, default=False, help="With --full, fetch problems that are already archived again."
+)
+@click.pass_context
+def download_problems_cmd(ctx, sync, full, workers, refresh):
     """
     Download all LeetCode problems metadata and save locally in order to speed up some commands and enable showing/creating by ID
+
+    With --sync, only the problems added since the last download are fetched, which is
+    what periodic refreshes should use.
+
+    With --full, every problem is also archived locally, so show, random, create and
+    test --local work offline. An interrupted full download resumes where it stopped.
     """
     try:
         # Initialize managers
-        config_manager = ConfigManager()
-        auth_service = AuthService(config_manager)
-        problemset_manager = ProblemSetManager(config_manager, auth_service)
+        app = ctx.ensure_object(AppContext)
+        problemset_manager = app.problemset_manager
 
-        # Fetch problemset metadata
+        # Download (or sync) the problemset into the local catalogue and metadata file
         try:
-            problems_data = fetch_problemset_metadata()
-            if not problems_data:
-                click.echo("Error: Failed to fetch problems metadata.")
-                return
+            problems_path = problemset_manager.get_problems_data_path()
+            if sync:
+                added, total = problemset_manager.sync_problemset()
+                click.echo(f"Problems metadata synced to '{problems_path}' ({added} new, {total} problems).")
+            else:
+                count = problemset_manager.download_problemset()
+                click.echo(f"Problems metadata downloaded to '{problems_path}' ({count} problems).")
+
+        except ProblemSetError as e:
+            click.echo(f"Error: {e}")
+            return
 
         except Exception as e:
             logger.error(f"Failed to fetch problemset metadata: {e}")
             click.echo(f"Error: Failed to fetch problems metadata. {e}")
             return
 
-        # Save problemset metadata
-        try:
-            problemset_manager.save_problemset_metadata(problems_data)
-            problems_path = problemset_manager.get_problems_data_path()
-            click.echo(f"Problems metadata downloaded to '{problems_path}'.")
-
-        except ProblemSetError as e:
-            click.echo(f"Error: {e}")
-            return
+        if full:
+            _download_archive(app, workers, refresh)
 
     except ConfigError as e:
         logger.error(e)
@@ -51,3 +81,47 @@ def download_problems_cmd():
     except Exception:
         logger.exception("An unexpected error occurred during problems metadata download.")
         click.echo("An unexpected error occurred. Please try again.", err=True)
+
+
+def _download_archive(app: AppContext, workers: int, refresh: bool) -> None:
+    """
+    Archives the full data of every problem in the freshly downloaded metadata, with a progress bar.
+    """
+    problem_manager = app.problem_manager
+    title_slugs = [slug for slug in app.problemset_manager.get_snapshot().title_slugs() if slug]
+    todo = title_slugs if refresh else problem_manager.get_unarchived_slugs(title_slugs)
+
+    already_archived = len(title_slugs) - len(todo)
+    if not todo:
+        click.echo(f"All {len(title_slugs)} problems are already archived.")
+        return
+
+    failures = []
+    try:
+        with click.progressbar(length=len(todo), label="Archiving problems", show_pos=True) as bar:
+            for title_slug, error in problem_manager.archive_problems(todo, workers):
+                if error is not None:
+                    failures.append((title_slug, error))
+                bar.update(1)
+
+    except ProblemSetError as e:
+        click.echo(f"Error: {e}")
+        return
+
+    except KeyboardInterrupt:
+        click.echo("\nInterrupted, run the command again to resume.")
+        return
+
+    archived = len(todo) - len(failures)
+    archive_path = problem_manager.problem_archive.db_path
+    summary = f"Archived {archived} problems to '{archive_path}'"
+    if already_archived:
+        summary += f" ({already_archived} were already archived)"
+    click.echo(f"{summary}.")
+
+    if failures:
+        click.echo(f"{len(failures)} problems failed, run the command again to retry them:")
+        for title_slug, error in failures[:MAX_LISTED_FAILURES]:
+            click.echo(f"  {title_slug}: {error}")
+        if len(failures) > MAX_LISTED_FAILURES:
+            click.echo(f"  ... and {len(failures) - MAX_LISTED_FAILURES} more.")
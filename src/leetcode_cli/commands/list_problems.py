@@ -2,13 +2,10 @@ import logging
 
 import click
 
+from leetcode_cli.app_context import AppContext
 from leetcode_cli.constants.problem_constants import POSSIBLE_TAGS
 from leetcode_cli.exceptions.exceptions import ConfigError, ProblemSetError, ThemeError
 from leetcode_cli.formatters.problemset_data_formatter import ProblemSetFormatter
-from leetcode_cli.managers.auth_service import AuthService
-from leetcode_cli.managers.config_manager import ConfigManager
-from leetcode_cli.managers.problemset_manager import ProblemSetManager
-from leetcode_cli.managers.theme_manager import ThemeManager
 
 logger = logging.getLogger(__name__)
 
@@ -47,22 +44,33 @@ logger = logging.getLogger(__name__)
     metavar="PAGE",
     help="Page number to display (default: 1).",
 )
+@click.option(
+    "--online",
+    "-o",
+    is_flag=True,
+    default=False,
+    help="Fetch from LeetCode even if the downloaded catalogue is fresh.",
+)
 @click.option("-r", "--raw-style", is_flag=True, default=False, help="Show theme style keys instead of colors.")
-def list_cmd(difficulty, tag, limit, page, raw_style):
+@click.pass_context
+def list_cmd(ctx, difficulty, tag, limit, page, online, raw_style):
     """
     List LeetCode problems with optional filters.
+
+    Answered from the local catalogue created by 'leetcode download-problems' while it is fresh, otherwise from LeetCode.
     """
     try:
         # Initialize managers
-        config_manager = ConfigManager()
-        auth_service = AuthService(config_manager)
-        problemset_manager = ProblemSetManager(config_manager, auth_service)
-        theme_manager = ThemeManager(config_manager)
+        app = ctx.ensure_object(AppContext)
+        problemset_manager = app.problemset_manager
+        theme_manager = app.theme_manager
         theme_manager.raw_style = raw_style
 
         # Get problemset data
         try:
-            problemset = problemset_manager.get_problemset(tags=tag, difficulty=difficulty, limit=limit, page=page)
+            problemset = problemset_manager.get_problemset(
+                tags=tag, difficulty=difficulty, limit=limit, page=page, online=online
+            )
 
         except Exception as e:
             click.echo(f"Error: {e}")
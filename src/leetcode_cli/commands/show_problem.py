@@ -2,18 +2,15 @@ import logging
 
 import click
 
+from leetcode_cli.app_context import AppContext
+from leetcode_cli.data_fetchers.problem_archive import bypass_problem_archive
+from leetcode_cli.data_fetchers.response_cache import bypass_response_cache
 from leetcode_cli.exceptions.exceptions import (
     ConfigError,
     ProblemError,
     ThemeError,
 )
 from leetcode_cli.formatters.problem_data_formatter import ProblemFormatter
-from leetcode_cli.managers.auth_service import AuthService
-from leetcode_cli.managers.config_manager import ConfigManager
-from leetcode_cli.managers.formatting_config_manager import FormattingConfigManager
-from leetcode_cli.managers.problem_manager import ProblemManager
-from leetcode_cli.managers.problemset_manager import ProblemSetManager
-from leetcode_cli.managers.theme_manager import ThemeManager
 
 logger = logging.getLogger(__name__)
 
@@ -31,25 +28,29 @@ logger = logging.getLogger(__name__)
     metavar="SECTION",
     help="Sections to display. Overrides formatting_config.",
 )
+@click.option("--no-cache", is_flag=True, default=False, help="Ignore cached problem data and fetch it again.")
 @click.option("-r", "--raw-style", is_flag=True, default=False, help="Show theme style keys instead of colors.")
-def show_cmd(title_slug_or_frontend_id, include, raw_style):
+@click.pass_context
+def show_cmd(ctx, title_slug_or_frontend_id, include, no_cache, raw_style):
     """
     Show specific problem details.
 
     By default, which sections are displayed depends on formatting_config.yaml
     ("problem_show" section). Use --include to override and show only specific sections.
     """
+    if no_cache:
+        bypass_response_cache()
+        bypass_problem_archive()
+
     try:
         # Initialize managers
-        config_manager = ConfigManager()
-        auth_service = AuthService(config_manager)
-        formatting_config_manager = FormattingConfigManager(config_manager)
-        problemset_manager = ProblemSetManager(config_manager, auth_service)
-        problem_manager = ProblemManager(config_manager, auth_service, problemset_manager)
-        theme_manager = ThemeManager(config_manager)
+        app = ctx.ensure_object(AppContext)
+        config_manager = app.config_manager
+        problem_manager = app.problem_manager
+        theme_manager = app.theme_manager
         theme_manager.raw_style = raw_style
 
-        formatting_config = formatting_config_manager.load_formatting_config()
+        formatting_config = app.formatting_config
 
         # Override formatting configuration if --include is used
         format_conf = formatting_config.problem_show
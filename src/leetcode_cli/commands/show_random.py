@@ -2,19 +2,16 @@ import logging
 
 import click
 
+from leetcode_cli.app_context import AppContext
 from leetcode_cli.constants.problem_constants import POSSIBLE_TAGS
+from leetcode_cli.data_fetchers.problem_archive import bypass_problem_archive
+from leetcode_cli.data_fetchers.response_cache import bypass_response_cache
 from leetcode_cli.exceptions.exceptions import (
     ConfigError,
     ProblemError,
     ThemeError,
 )
 from leetcode_cli.formatters.problem_data_formatter import ProblemFormatter
-from leetcode_cli.managers.auth_service import AuthService
-from leetcode_cli.managers.config_manager import ConfigManager
-from leetcode_cli.managers.formatting_config_manager import FormattingConfigManager
-from leetcode_cli.managers.problem_manager import ProblemManager
-from leetcode_cli.managers.problemset_manager import ProblemSetManager
-from leetcode_cli.managers.theme_manager import ThemeManager
 
 logger = logging.getLogger(__name__)
 
@@ -46,25 +43,29 @@ logger = logging.getLogger(__name__)
     metavar="SECTION",
     help="Sections to display. Overrides formatting_config.",
 )
+@click.option("--no-cache", is_flag=True, default=False, help="Ignore cached problem data and fetch it again.")
 @click.option("-r", "--raw-style", is_flag=True, default=False, help="Show theme style keys instead of colors.")
-def random_cmd(difficulty, tag, include, raw_style):
+@click.pass_context
+def random_cmd(ctx, difficulty, tag, include, no_cache, raw_style):
     """
     Show random problem details.
 
     By default, which sections are displayed depends on formatting_config.yaml
     ("problem_show" section). Use --include to override and show only specific sections.
     """
+    if no_cache:
+        bypass_response_cache()
+        bypass_problem_archive()
+
     try:
-        config_manager = ConfigManager()
-        auth_service = AuthService(config_manager)
-        formatting_config_manager = FormattingConfigManager(config_manager)
-        theme_manager = ThemeManager(config_manager)
+        app = ctx.ensure_object(AppContext)
+        config_manager = app.config_manager
+        theme_manager = app.theme_manager
         theme_manager.raw_style = raw_style
-        problemset_manager = ProblemSetManager(config_manager, auth_service)
-        problem_manager = ProblemManager(config_manager, auth_service, problemset_manager)
+        problem_manager = app.problem_manager
 
         # Load format config
-        formatting_config = formatting_config_manager.load_formatting_config()
+        formatting_config = app.formatting_config
         format_conf = formatting_config.problem_show
 
         # Override problem_show sections if user specified --include
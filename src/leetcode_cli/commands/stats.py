@@ -3,12 +3,9 @@ from datetime import datetime
 
 import click
 
+from leetcode_cli.app_context import AppContext
 from leetcode_cli.exceptions.exceptions import ConfigError, StatsError, ThemeError
 from leetcode_cli.formatters.stats_data_formatter import StatsFormatter
-from leetcode_cli.managers.auth_service import AuthService
-from leetcode_cli.managers.config_manager import ConfigManager
-from leetcode_cli.managers.stats_manager import StatsManager
-from leetcode_cli.managers.theme_manager import ThemeManager
 
 logger = logging.getLogger(__name__)
 
@@ -23,18 +20,39 @@ logger = logging.getLogger(__name__)
     metavar="SECTION",
     help="Sections to display. e.g. --include stats --include calendar",
 )
+@click.option(
+    "--users",
+    "-u",
+    multiple=True,
+    metavar="USERS",
+    help="Comma-separated usernames to compare in one table. e.g. --users alice,bob",
+)
+@click.option(
+    "--users-file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="File with usernames to compare, one per line ('#' starts a comment).",
+)
 @click.option("-r", "--raw-style", is_flag=True, default=False, help="Show theme style keys instead of colors.")
-def stats_cmd(username, include, raw_style):
+@click.pass_context
+def stats_cmd(ctx, username, include, users, users_file, raw_style):
     """
     Show user stats and/or calendar activity, with color gradients for daily squares.
+
+    With --users or --users-file, all users are fetched concurrently and shown in one
+    comparative table instead.
     """
     try:
-        config_manager = ConfigManager()
-        auth_service = AuthService(config_manager)
-        stats_manager = StatsManager(config_manager, auth_service)
-        theme_manager = ThemeManager(config_manager)
+        app = ctx.ensure_object(AppContext)
+        config_manager = app.config_manager
+        stats_manager = app.stats_manager
+        theme_manager = app.theme_manager
         theme_manager.raw_style = raw_style
 
+        usernames = _collect_usernames(username, users, users_file)
+        if usernames:
+            _show_users_table(stats_manager, theme_manager, usernames, include)
+            return
+
         if not username:
             username = config_manager.get_username()
             if not username:
@@ -45,22 +63,21 @@ def stats_cmd(username, include, raw_style):
         if not include:
             include = ("stats", "calendar")
 
-        # 1) Fetch user stats
-        try:
-            user_stats = stats_manager.get_user_stats(username)
-        except StatsError as e:
-            click.echo(f"Failed to fetch stats: {e}")
+        # 1) Fetch user stats and, optionally, the activity calendar (concurrently)
+        current_year = datetime.now().year
+        prev_year = current_year - 1
+        user_stats, user_activity = stats_manager.get_stats_and_activity(
+            username, prev_year, current_year, include_activity="calendar" in include
+        )
+
+        if isinstance(user_stats, StatsError):
+            click.echo(f"Failed to fetch stats: {user_stats}")
             return
 
-        # 2) Optionally fetch activity calendar
-        user_activity = None
-        if "calendar" in include:
-            try:
-                current_year = datetime.now().year
-                prev_year = current_year - 1
-                user_activity = stats_manager.get_joined_activity(username, prev_year, current_year)
-            except StatsError as e:
-                click.echo(f"Failed to fetch user activity: {e}")
+        # 2) A failed calendar only drops that section
+        if isinstance(user_activity, StatsError):
+            click.echo(f"Failed to fetch user activity: {user_activity}")
+            user_activity = None
 
         # 3) Format the output
         formatter = StatsFormatter(theme_manager)
@@ -79,10 +96,45 @@ def stats_cmd(username, include, raw_style):
         click.echo("\n\n".join(final_output_lines))
         click.echo()
 
-    except (ConfigError, ThemeError, StatsError) as e:
+    except (ConfigError, ThemeError, StatsError, OSError) as e:
         logger.error(e)
         click.echo(f"Error: {e}", err=True)
 
     except Exception as e:
         logger.exception("An unexpected error occurred while fetching statistics.")
         click.echo(f"An unexpected error occurred: {e}", err=True)
+
+
+def _collect_usernames(username: str | None, users: tuple[str, ...], users_file: str | None) -> list[str]:
+    """
+    Usernames of the multi-user mode in the order given, or an empty list for the
+    single-user mode (no --users / --users-file).
+    """
+    if not users and not users_file:
+        return []
+
+    usernames = [username] if username else []
+    for value in users:
+        usernames.extend(name.strip() for name in value.split(","))
+
+    if users_file:
+        with open(users_file, encoding="utf-8") as f:
+            for line in f:
+                usernames.extend(name.strip() for name in line.split("#", 1)[0].split(","))
+
+    return list(dict.fromkeys(name for name in usernames if name))
+
+
+def _show_users_table(stats_manager, theme_manager, usernames: list[str], include: tuple[str, ...]) -> None:
+    """
+    Fetches all users concurrently and prints the comparative table.
+    """
+    current_year = datetime.now().year
+    results = stats_manager.get_many_stats_and_activity(
+        usernames, current_year - 1, current_year, include_activity=not include or "calendar" in include
+    )
+
+    formatter = StatsFormatter(theme_manager)
+    click.echo()
+    click.echo(formatter.format_users_table(results))
+    click.echo()
@@ -2,6 +2,8 @@ import logging
 
 import click
 
+from leetcode_cli.app_context import AppContext
+from leetcode_cli.constants.batch_constants import DEFAULT_SUBMISSIONS_PER_MINUTE
 from leetcode_cli.exceptions.exceptions import (
     CodeError,
     ConfigError,
@@ -9,19 +11,13 @@ from leetcode_cli.exceptions.exceptions import (
     ThemeError,
 )
 from leetcode_cli.formatters.submission_result_formatter import SubmissionFormatter
-from leetcode_cli.managers.auth_service import AuthService
-from leetcode_cli.managers.code_manager import CodeManager
-from leetcode_cli.managers.config_manager import ConfigManager
-from leetcode_cli.managers.formatting_config_manager import FormattingConfigManager
-from leetcode_cli.managers.problem_manager import ProblemManager
-from leetcode_cli.managers.problemset_manager import ProblemSetManager
-from leetcode_cli.managers.theme_manager import ThemeManager
+from leetcode_cli.models.submission import SubmissionRun
 
 logger = logging.getLogger(__name__)
 
 
-@click.command(short_help="Submit a solution file to LeetCode")
-@click.argument("file_path", required=True, type=click.Path(exists=True))
+@click.command(short_help="Submit solution files to LeetCode")
+@click.argument("file_paths", nargs=-1, required=True, type=click.Path(), metavar="FILE_PATH...")
 @click.option(
     "--include",
     "-i",
@@ -42,23 +38,46 @@ logger = logging.getLogger(__name__)
     metavar="SECTION",
     help="Sections to display. Overrides formatting_config.",
 )
+@click.option(
+    "--batch",
+    "-b",
+    is_flag=True,
+    default=False,
+    help="Submit many files (directories and quoted globs allowed) as a rate-limited, resumable batch.",
+)
+@click.option(
+    "--per-minute",
+    type=click.FloatRange(min=0, min_open=True),
+    default=DEFAULT_SUBMISSIONS_PER_MINUTE,
+    show_default=True,
+    help="Maximum number of batch submissions sent per minute.",
+)
+@click.option(
+    "--no-resume",
+    is_flag=True,
+    default=False,
+    help="Ignore the batch journal and submit every file again.",
+)
 @click.option("-r", "--raw-style", is_flag=True, default=False, help="Show theme style keys instead of colors.")
-def submit_cmd(file_path, include, raw_style):
+@click.pass_context
+def submit_cmd(ctx, file_paths, include, batch, per_minute, no_resume, raw_style):
     """
     Submit a solution file to LeetCode.
+
+    With --batch, every given file is queued and submitted at most --per-minute times a
+    minute while all outstanding submissions are polled together. Progress is journaled in
+    the config directory, so rerunning an interrupted batch skips files that were already
+    accepted and keeps polling submissions that were in flight.
     """
     try:
-        config_manager = ConfigManager()
-        auth_service = AuthService(config_manager)
-        formatting_config_manager = FormattingConfigManager(config_manager)
-        code_manager = CodeManager(config_manager)
-        theme_manager = ThemeManager(config_manager)
+        app = ctx.ensure_object(AppContext)
+        code_manager = app.code_manager
+        theme_manager = app.theme_manager
         theme_manager.raw_style = raw_style
-        problemset_manager = ProblemSetManager(config_manager, auth_service)
-        problem_manager = ProblemManager(config_manager, auth_service, problemset_manager)
+        problem_manager = app.problem_manager
 
         # Load formatting config
-        formatting_config = formatting_config_manager.load_formatting_config()
+        formatting_config = app.formatting_config
         format_conf = formatting_config.submission
 
         # override if user passed --include
@@ -83,6 +102,17 @@ def submit_cmd(file_path, include, raw_style):
                 elif item == "expected_output":
                     format_conf["show_expected_output"] = True
 
+        if batch:
+            solution_paths = code_manager.expand_solution_paths(file_paths)
+            _submit_batch(app, solution_paths, format_conf, per_minute, resume=not no_resume)
+            return
+
+        if len(file_paths) != 1:
+            click.echo("Error: Submit one file at a time, or use --batch to submit many.")
+            return
+
+        file_path = file_paths[0]
+
         # Parse path => (id, slug, ext)
         _, title_slug, file_extension = problem_manager.problem_data_from_path(file_path)
 
@@ -107,3 +137,48 @@ def submit_cmd(file_path, include, raw_style):
     except Exception as e:
         logger.exception("Unexpected error in submit_cmd.")
         click.echo(f"An unexpected error occurred: {e}", err=True)
+
+
+def _submit_batch(app: AppContext, solution_paths: list[str], format_conf: dict, per_minute: float, resume: bool):
+    """
+    Submits many solution files through the manager's rate-limited queue and prints each
+    result as it completes, followed by a one-line summary.
+    """
+    code_manager = app.code_manager
+    problem_manager = app.problem_manager
+
+    runs = []
+    failed = 0
+    for file_path in solution_paths:
+        try:
+            _, title_slug, file_extension = problem_manager.problem_data_from_path(file_path)
+            code = code_manager.read_code_from_file(file_path)
+            lang_slug = code_manager.determine_language_from_extension(file_extension)
+            runs.append(SubmissionRun(file_path, title_slug, code, lang_slug))
+
+        except (CodeError, ProblemError) as e:
+            click.echo(f"{file_path}: Error: {e}")
+            failed += 1
+
+    accepted = skipped = 0
+    for run in problem_manager.run_submissions(runs, per_minute=per_minute, resume=resume):
+        if run.skipped:
+            click.echo(f"{run.file_path}: already accepted, skipped.")
+            skipped += 1
+            continue
+
+        click.echo(f"\n{run.file_path}")
+
+        if run.error is not None:
+            click.echo(f"Error: {run.error}")
+            failed += 1
+            continue
+
+        formatter = SubmissionFormatter(run.result, format_conf, app.theme_manager)
+        click.echo(formatter.get_formatted_submission())
+        if run.result.status_msg == "Accepted":
+            accepted += 1
+
+    click.echo(
+        f"\n{accepted + skipped}/{len(solution_paths)} accepted ({skipped} in earlier runs), {failed} failed to submit."
+    )
@@ -1,29 +1,31 @@
 import logging
+import threading
+from datetime import datetime
 
 import click
 
+from leetcode_cli.app_context import AppContext
+from leetcode_cli.constants.batch_constants import DEFAULT_TEST_PARALLELISM
 from leetcode_cli.exceptions.exceptions import (
     CodeError,
     ConfigError,
+    FetchingError,
+    ParsingError,
+    PollCancelledError,
     ProblemError,
     ThemeError,
 )
+from leetcode_cli.file_watcher import FileWatcher
 from leetcode_cli.formatters.interpretation_result_formatter import (
     InterpretationFormatter,
 )
-from leetcode_cli.managers.auth_service import AuthService
-from leetcode_cli.managers.code_manager import CodeManager
-from leetcode_cli.managers.config_manager import ConfigManager
-from leetcode_cli.managers.formatting_config_manager import FormattingConfigManager
-from leetcode_cli.managers.problem_manager import ProblemManager
-from leetcode_cli.managers.problemset_manager import ProblemSetManager
-from leetcode_cli.managers.theme_manager import ThemeManager
+from leetcode_cli.models.interpretation import InterpretationRun
 
 logger = logging.getLogger(__name__)
 
 
-@click.command(short_help="Test a solution file")
-@click.argument("file_path", required=True, type=click.Path(exists=True))
+@click.command(short_help="Test solution files")
+@click.argument("file_paths", nargs=-1, required=True, type=click.Path(), metavar="FILE_PATH...")
 @click.option(
     "--include",
     "-i",
@@ -43,24 +45,53 @@ logger = logging.getLogger(__name__)
     metavar="SECTION",
     help="Sections to display. Overrides formatting_config.",
 )
+@click.option(
+    "--parallel",
+    "-p",
+    type=click.IntRange(min=1),
+    default=DEFAULT_TEST_PARALLELISM,
+    show_default=True,
+    help="Maximum number of solutions run at once when testing many files.",
+)
+@click.option(
+    "--watch",
+    "-w",
+    is_flag=True,
+    default=False,
+    help="Re-run the test whenever the file is saved, until Ctrl+C.",
+)
+@click.option(
+    "--local",
+    "-l",
+    is_flag=True,
+    default=False,
+    help="Run Python 3 solutions on this machine instead of on LeetCode.",
+)
 @click.option("-r", "--raw-style", is_flag=True, default=False, help="Show theme style keys instead of colors.")
-def test_cmd(file_path, include, raw_style):
+@click.pass_context
+def test_cmd(ctx, file_paths, include, parallel, watch, local, raw_style):
     """
-    Test a solution file with example testcases.
+    Test solution files with example testcases.
+
+    FILE_PATH can be a file, a directory (every solution file in it) or a quoted glob
+    such as "*.py". Many files are run concurrently and printed as they finish.
+
+    With --watch, a single file is tested again on every save; a run still waiting for its
+    result is cancelled when the file changes again.
+
+    With --local, Python 3 solutions run against the example testcases in local, isolated
+    interpreters: sub-second feedback that works offline once the problem is cached.
     """
     try:
         # 1) Setup
-        config_manager = ConfigManager()
-        auth_service = AuthService(config_manager)
-        code_manager = CodeManager(config_manager)
-        problemset_manager = ProblemSetManager(config_manager, auth_service)
-        problem_manager = ProblemManager(config_manager, auth_service, problemset_manager)
-        formatting_config_manager = FormattingConfigManager(config_manager)
-        theme_manager = ThemeManager(config_manager)
+        app = ctx.ensure_object(AppContext)
+        code_manager = app.code_manager
+        problem_manager = app.problem_manager
+        theme_manager = app.theme_manager
         theme_manager.raw_style = raw_style
 
         # 2) Load format config
-        formatting_config = formatting_config_manager.load_formatting_config()
+        formatting_config = app.formatting_config
         format_conf = formatting_config.interpretation
 
         # 3) Override formatting sections if needed
@@ -83,6 +114,20 @@ def test_cmd(file_path, include, raw_style):
                 elif item == "detailed_error_messages":
                     format_conf["show_detailed_error_messages"] = True
 
+        solution_paths = app.code_manager.expand_solution_paths(file_paths)
+        if watch:
+            if len(solution_paths) != 1:
+                click.echo("Error: --watch takes a single solution file.")
+                return
+            _watch(app, solution_paths[0], format_conf, local)
+            return
+
+        if len(solution_paths) != 1:
+            _test_many(app, solution_paths, format_conf, parallel, local)
+            return
+
+        file_path = solution_paths[0]
+
         # 4) Parse local file => question_id, slug, extension
         _, title_slug, file_extension = problem_manager.problem_data_from_path(file_path)
 
@@ -92,16 +137,22 @@ def test_cmd(file_path, include, raw_style):
         # 6) Determine lang
         lang_slug = code_manager.determine_language_from_extension(file_extension)
 
-        # 7) Get example testcases from the manager (optional approach)
-        testcases_str = problem_manager.get_example_testcases(title_slug)
+        if local:
+            # 7-8) Run the example testcases on this machine
+            interpretation_res, testcases_str = app.local_runner.run(title_slug, code, lang_slug)
 
-        # 8) Retrieve interpretation result from manager
-        interpretation_res = problem_manager.get_interpretation_result(
-            title_slug=title_slug,
-            code=code,
-            lang_slug=lang_slug,
-            testcases=testcases_str,
-        )
+        else:
+            # 7) Get example testcases and the question id (fetched concurrently)
+            testcases_str, question_id = problem_manager.get_test_prerequisites(title_slug)
+
+            # 8) Retrieve interpretation result from manager
+            interpretation_res = problem_manager.get_interpretation_result(
+                title_slug=title_slug,
+                code=code,
+                lang_slug=lang_slug,
+                testcases=testcases_str,
+                question_id=question_id,
+            )
 
         # 9) Format
         formatter = InterpretationFormatter(
@@ -122,3 +173,105 @@ def test_cmd(file_path, include, raw_style):
     except Exception as e:
         logger.exception("Unexpected error in test_cmd.")
         click.echo(f"An unexpected error occurred: {e}", err=True)
+
+
+def _test_many(app: AppContext, solution_paths: list[str], format_conf: dict, parallel: int, local: bool) -> None:
+    """
+    Runs many solution files concurrently (on LeetCode, or locally with `local`) and prints
+    each result as it completes, followed by a one-line summary.
+    """
+    code_manager = app.code_manager
+    problem_manager = app.problem_manager
+
+    runs = []
+    failed = 0
+    for file_path in solution_paths:
+        try:
+            _, title_slug, file_extension = problem_manager.problem_data_from_path(file_path)
+            code = code_manager.read_code_from_file(file_path)
+            lang_slug = code_manager.determine_language_from_extension(file_extension)
+            runs.append(InterpretationRun(file_path, title_slug, code, lang_slug))
+
+        except (CodeError, ProblemError) as e:
+            click.echo(f"{file_path}: Error: {e}")
+            failed += 1
+
+    passed = 0
+    completed = app.local_runner.run_many(runs) if local else problem_manager.run_interpretations(runs, parallel)
+    for run in completed:
+        click.echo(f"\n{run.file_path}")
+
+        if run.error is not None:
+            click.echo(f"Error: {run.error}")
+            failed += 1
+            continue
+
+        formatter = InterpretationFormatter(run.result, run.testcases, format_conf, app.theme_manager)
+        click.echo(formatter.get_formatted_interpretation())
+        if run.result.correct_answer:
+            passed += 1
+
+    click.echo(f"\n{passed}/{len(solution_paths)} passed, {failed} failed to run.")
+
+
+def _watch(app: AppContext, file_path: str, format_conf: dict, local: bool) -> None:
+    """
+    Tests a file on start and after every (debounced) save. The question id, example
+    testcases, theme and formatting config are resolved once, so each run costs only the
+    interpret round trip (or a local run). A run still polling when the file changes again
+    is cancelled.
+    """
+    code_manager = app.code_manager
+    problem_manager = app.problem_manager
+
+    _, title_slug, file_extension = problem_manager.problem_data_from_path(file_path)
+    lang_slug = code_manager.determine_language_from_extension(file_extension)
+    if not local:
+        testcases_str, question_id = problem_manager.get_test_prerequisites(title_slug)
+
+    def run_once(cancel: threading.Event) -> None:
+        click.echo(f"\n[{datetime.now():%H:%M:%S}] Testing {file_path}")
+        try:
+            code = code_manager.read_code_from_file(file_path)
+            if local:
+                interpretation_res, testcases = app.local_runner.run(title_slug, code, lang_slug)
+            else:
+                testcases = testcases_str
+                interpretation_res = problem_manager.get_interpretation_result(
+                    title_slug=title_slug,
+                    code=code,
+                    lang_slug=lang_slug,
+                    testcases=testcases_str,
+                    question_id=question_id,
+                    cancel=cancel,
+                )
+            formatter = InterpretationFormatter(interpretation_res, testcases, format_conf, app.theme_manager)
+            click.echo(formatter.get_formatted_interpretation())
+
+        except PollCancelledError:
+            click.echo("Cancelled: the file changed again.")
+
+        except (CodeError, FetchingError, ParsingError) as e:
+            click.echo(f"Error: {e}")
+
+        except Exception as e:
+            logger.exception("Unexpected error in watched test run.")
+            click.echo(f"An unexpected error occurred: {e}", err=True)
+
+    watcher = FileWatcher([file_path])
+    click.echo(f"Watching {file_path} for changes. Press Ctrl+C to stop.")
+
+    cancel = threading.Event()
+    try:
+        while True:
+            cancel = threading.Event()
+            run = threading.Thread(target=run_once, args=(cancel,), name="leetcode-watch-run", daemon=True)
+            run.start()
+
+            watcher.wait_for_change()
+            cancel.set()
+            run.join()
+
+    except KeyboardInterrupt:
+        cancel.set()
+        click.echo("\nStopped watching.")
@@ -2,16 +2,16 @@ import logging
 
 import click
 
+from leetcode_cli.app_context import AppContext
 from leetcode_cli.exceptions.exceptions import ConfigError, ThemeError
-from leetcode_cli.managers.config_manager import ConfigManager
-from leetcode_cli.managers.theme_manager import ThemeManager
 
 logger = logging.getLogger(__name__)
 
 
 @click.command(short_help="Change or list themes")
 @click.argument("theme_name", required=False)
-def theme_cmd(theme_name):
+@click.pass_context
+def theme_cmd(ctx, theme_name):
     """
     Show or change the current theme.
 
@@ -19,8 +19,8 @@ def theme_cmd(theme_name):
     """
     try:
         # Initialize managers
-        config_manager = ConfigManager()
-        theme_manager = ThemeManager(config_manager)
+        app = ctx.ensure_object(AppContext)
+        theme_manager = app.theme_manager
 
         if not theme_name:
             # Display current theme and list available themes
@@ -0,0 +1,47 @@
+import atexit
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any
+
+from leetcode_cli.data_fetchers.graphql_queries import POOL_SIZE
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Returns the process-wide thread pool used for concurrent network calls.
+    It is sized like the HTTP connection pool, so every worker can hold a connection.
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix="leetcode-fetch")
+            atexit.register(_executor.shutdown, wait=False, cancel_futures=True)
+
+        return _executor
+
+
+def run_concurrently(*calls: Callable[[], Any]) -> list[Any]:
+    """
+    Runs independent zero-argument callables on the shared thread pool.
+
+    Waits for all of them, so the total latency is that of the slowest call, and returns
+    their results in the order the callables were given. If any call raised, the exception
+    of the first failing call (in argument order) is re-raised after all calls finished.
+    """
+    if len(calls) <= 1:
+        return [call() for call in calls]
+
+    futures = [get_executor().submit(call) for call in calls]
+    wait(futures)
+
+    for future in futures:
+        error = future.exception()
+        if error is not None:
+            raise error
+
+    return [future.result() for future in futures]
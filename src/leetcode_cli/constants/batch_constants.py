@@ -0,0 +1,4 @@
+# Default number of 'Run Code' jobs a batch test keeps in flight at once.
+DEFAULT_TEST_PARALLELISM = 4
+# Default budget of batch submissions sent per minute.
+DEFAULT_SUBMISSIONS_PER_MINUTE = 6
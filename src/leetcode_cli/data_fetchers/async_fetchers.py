@@ -0,0 +1,35 @@
+"""
+asyncio variants of the data fetchers.
+
+Each coroutine runs its synchronous fetcher on the shared fetch thread pool, so all of them
+use the one pooled HTTP client, the response cache and request coalescing, and raise the
+same FetchingError. Concurrency is bounded by the pool size (POOL_SIZE), which matches the
+number of HTTP connections kept alive. This lets managers `asyncio.gather` many calls.
+
+Only the fetchers a manager gathers have a variant here; any other fetcher can be awaited
+with `run_in_fetch_pool`.
+"""
+
+import asyncio
+import functools
+from collections.abc import Callable
+from typing import Any
+
+from leetcode_cli.concurrency import get_executor
+from leetcode_cli.data_fetchers.stats_data_fetcher import fetch_user_activity, fetch_user_stats
+
+
+async def run_in_fetch_pool(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Awaits a blocking call on the shared fetch thread pool.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), functools.partial(func, *args, **kwargs))
+
+
+async def fetch_user_stats_async(username):
+    return await run_in_fetch_pool(fetch_user_stats, username)
+
+
+async def fetch_user_activity_async(username, year):
+    return await run_in_fetch_pool(fetch_user_activity, username, year)
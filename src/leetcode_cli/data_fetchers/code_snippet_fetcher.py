@@ -2,7 +2,8 @@ import logging
 
 import requests
 
-from leetcode_cli.data_fetchers.graphql_queries import GRAPHQL_QUERIES, GRAPHQL_URL, REQUEST_TIMEOUT
+from leetcode_cli.data_fetchers.graphql_client import execute_graphql
+from leetcode_cli.data_fetchers.graphql_queries import GRAPHQL_QUERIES
 from leetcode_cli.exceptions.exceptions import FetchingError
 
 logger = logging.getLogger(__name__)
@@ -14,9 +15,7 @@ def fetch_code_snippet(title_slug, lang_slug):
     payload = {"query": query, "variables": {"titleSlug": title_slug}}
 
     try:
-        response = requests.post(GRAPHQL_URL, json=payload, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        result = response.json()
+        result = execute_graphql("code_snippets", payload)
 
     except requests.RequestException as e:
         logger.error(
@@ -0,0 +1,67 @@
+import logging
+
+from leetcode_cli.data_fetchers.graphql_queries import GRAPHQL_URL
+from leetcode_cli.data_fetchers.http_client import get_http_client
+from leetcode_cli.data_fetchers.problem_archive import get_problem_archive
+from leetcode_cli.data_fetchers.request_coalescer import UNCOALESCED_QUERIES, get_request_coalescer, request_key
+from leetcode_cli.data_fetchers.response_cache import get_response_cache
+
+logger = logging.getLogger(__name__)
+
+
+def execute_graphql(query_name: str, payload: dict, headers: dict | None = None, cache_variant: str = "") -> dict:
+    """
+    Posts a GraphQL payload through the shared HTTP client and returns the decoded JSON.
+
+    Identical requests in one process are coalesced: concurrent duplicates share one request
+    and later duplicates reuse its result. Single-problem queries are answered from the problem
+    archive when it holds the problem (`download-problems --full`). Responses to queries listed
+    in the response cache's TTL table are also served from and written to the on-disk cache
+    when one is configured.
+
+    Args:
+        query_name (str): Key of the query in GRAPHQL_QUERIES, used as the cache namespace.
+        payload (dict): The GraphQL payload ("query", "variables", optional "operationName").
+        headers (dict | None): Extra request headers (e.g. authentication).
+        cache_variant (str): Distinguishes cache entries of one query name whose query text
+            varies (e.g. the field list of a composite query).
+
+    Returns:
+        dict: The decoded JSON response. It may be shared with other callers; do not mutate it.
+
+    Raises:
+        requests.RequestException: On network or HTTP errors.
+        ValueError: If the response is not valid JSON.
+    """
+    if query_name in UNCOALESCED_QUERIES:
+        return _execute(query_name, payload, headers, cache_variant)
+
+    key = request_key(query_name, payload, headers, cache_variant)
+    return get_request_coalescer().run(key, lambda: _execute(query_name, payload, headers, cache_variant))
+
+
+def _execute(query_name: str, payload: dict, headers: dict | None, cache_variant: str) -> dict:
+    variables = payload.get("variables", {})
+
+    archive = get_problem_archive()
+    if archive is not None:
+        archived = archive.answer(query_name, variables, variant=cache_variant)
+        if archived is not None:
+            return archived
+
+    cache = get_response_cache()
+
+    if cache is not None:
+        cached = cache.get(query_name, variables, variant=cache_variant)
+        if cached is not None:
+            return cached
+
+    response = get_http_client().post(GRAPHQL_URL, json=payload, headers=headers)
+    response.raise_for_status()
+    result = response.json()
+
+    # Never cache GraphQL-level errors (e.g. unknown slug), only real answers.
+    if cache is not None and not result.get("errors"):
+        cache.put(query_name, variables, result, variant=cache_variant)
+
+    return result
@@ -1,7 +1,13 @@
-GRAPHQL_URL = "https://leetcode.com/graphql"
+from collections.abc import Iterable
+
+BASE_URL = "https://leetcode.com"
+GRAPHQL_URL = f"{BASE_URL}/graphql"
 
 REQUEST_TIMEOUT = 30
 POLL_TIMEOUT = 120
+POOL_SIZE = 10
+
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36"
 
 GRAPHQL_QUERIES = {
     "user_problem_stats": """
@@ -71,23 +77,6 @@ GRAPHQL_QUERIES = {
           }
         }
     """,
-    "problemset_metadata": """
-        query problemsetQuestionList($categorySlug: String, $limit: Int, $skip: Int, $filters: QuestionListFilterInput) {
-          problemsetQuestionList: questionList(
-            categorySlug: $categorySlug
-            limit: $limit
-            skip: $skip
-            filters: $filters
-          ) {
-            total: totalNum
-            questions: data {
-              questionId
-              frontendQuestionId: questionFrontendId
-              titleSlug
-            }
-          }
-        }
-    """,
     "code_snippets": """
         query getQuestionDetail($titleSlug: String!) {
           question(titleSlug: $titleSlug) {
@@ -159,3 +148,28 @@ GRAPHQL_QUERIES = {
         }
     """,
 }
+
+# Sub-selections for `question` fields that are objects rather than scalars.
+QUESTION_FIELD_SELECTIONS = {
+    "codeSnippets": "codeSnippets { lang langSlug code }",
+    "topicTags": "topicTags { name slug }",
+    "solution": "solution { id paidOnly hasVideoSolution canSeeDetail }",
+}
+
+
+def build_question_query(fields: Iterable[str]) -> str:
+    """
+    Builds a single `question(titleSlug:)` query selecting all of `fields`, so a command that
+    needs several pieces of one problem pays for one round trip.
+
+    Fields are deduplicated and sorted, so the same set always yields the same query text.
+    Object fields listed in QUESTION_FIELD_SELECTIONS are expanded to their sub-selection.
+    """
+    selections = "\n            ".join(QUESTION_FIELD_SELECTIONS.get(field, field) for field in sorted(set(fields)))
+    return f"""
+        query questionFields($titleSlug: String!) {{
+          question(titleSlug: $titleSlug) {{
+            {selections}
+          }}
+        }}
+    """
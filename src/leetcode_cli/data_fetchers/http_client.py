@@ -0,0 +1,167 @@
+import atexit
+import logging
+import threading
+from dataclasses import dataclass
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from leetcode_cli.data_fetchers.graphql_queries import BASE_URL, POOL_SIZE, REQUEST_TIMEOUT, USER_AGENT
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ConnectionStats:
+    """
+    Counts requests sent through the shared client and the TCP/TLS connections opened for them.
+    Every request that did not need a new connection reused a pooled keep-alive one.
+    """
+
+    requests: int = 0
+    opened: int = 0
+
+    @property
+    def reused(self) -> int:
+        return max(self.requests - self.opened, 0)
+
+
+class _CountingHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connection pools report every newly opened connection to a ConnectionStats.
+    """
+
+    def __init__(self, stats: ConnectionStats, pool_size: int):
+        # Must be set before super().__init__, which builds the pool manager.
+        self.stats = stats
+        self._stats_lock = threading.Lock()
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": self._counting_pool(HTTPConnectionPool),
+            "https": self._counting_pool(HTTPSConnectionPool),
+        }
+
+    def send(self, request, **kwargs):
+        with self._stats_lock:
+            self.stats.requests += 1
+        return super().send(request, **kwargs)
+
+    def _counting_pool(self, base_pool: type) -> type:
+        adapter = self
+
+        class CountingConnectionPool(base_pool):
+            def _new_conn(self):
+                with adapter._stats_lock:
+                    adapter.stats.opened += 1
+                logger.debug("Opening new connection to %s.", self.host)
+                return super()._new_conn()
+
+        return CountingConnectionPool
+
+
+class HttpClient:
+    """
+    Process-wide HTTP client shared by every data fetcher.
+
+    Wraps a single keep-alive `requests.Session` so consecutive calls to leetcode.com
+    reuse pooled connections instead of paying a TLS handshake each time. Carries the
+    headers common to all LeetCode requests; per-request headers are merged on top.
+    """
+
+    def __init__(self, pool_size: int = POOL_SIZE):
+        self.pool_size = pool_size
+        self.stats = ConnectionStats()
+
+        self.session = requests.Session()
+        self.session.headers.update(
+            {
+                "Content-Type": "application/json",
+                "User-Agent": USER_AGENT,
+                "Referer": f"{BASE_URL}/",
+            }
+        )
+
+        adapter = _CountingHTTPAdapter(self.stats, pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    #
+    # ──────────────────────────────────────────────────────
+    #   PUBLIC METHODS
+    # ──────────────────────────────────────────────────────
+    #
+
+    def post(self, url: str, json=None, headers: dict | None = None, timeout: float = REQUEST_TIMEOUT):
+        return self.session.post(url, json=json, headers=headers, timeout=timeout)
+
+    def get(self, url: str, headers: dict | None = None, timeout: float = REQUEST_TIMEOUT):
+        return self.session.get(url, headers=headers, timeout=timeout)
+
+    def close(self) -> None:
+        logger.debug(
+            "HTTP client closing: %d requests, %d connections opened, %d reused.",
+            self.stats.requests,
+            self.stats.opened,
+            self.stats.reused,
+        )
+        self.session.close()
+
+
+_client: HttpClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """
+    Returns the shared HttpClient, creating it on first use.
+    """
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient()
+                atexit.register(lambda: _client and _client.close())
+
+    return _client
+
+
+def configure_http_client(pool_size: int) -> HttpClient:
+    """
+    Replaces the shared HttpClient with one whose connection pool holds `pool_size` connections.
+    Used by commands that issue many concurrent requests.
+    """
+    global _client
+
+    with _client_lock:
+        if _client is not None and _client.pool_size == pool_size:
+            return _client
+
+        if _client is not None:
+            _client.close()
+        else:
+            atexit.register(lambda: _client and _client.close())
+
+        _client = HttpClient(pool_size=pool_size)
+
+    return _client
+
+
+def build_auth_headers(cookie: str | None, csrf_token: str | None, referer: str | None = None) -> dict[str, str]:
+    """
+    Builds the per-request authentication headers that override the shared client's defaults.
+    """
+    headers = {}
+
+    if cookie:
+        headers["Cookie"] = cookie
+    if csrf_token:
+        headers["x-csrftoken"] = csrf_token
+    if referer:
+        headers["Referer"] = referer
+
+    return headers
@@ -1,9 +1,11 @@
 import logging
-import time
+import threading
 
 import requests
 
-from leetcode_cli.data_fetchers.graphql_queries import POLL_TIMEOUT, REQUEST_TIMEOUT
+from leetcode_cli.data_fetchers.graphql_queries import BASE_URL
+from leetcode_cli.data_fetchers.http_client import build_auth_headers, get_http_client
+from leetcode_cli.data_fetchers.result_poller import poll_check_result
 from leetcode_cli.exceptions.exceptions import FetchingError
 
 logger = logging.getLogger(__name__)
@@ -17,6 +19,7 @@ def fetch_interpretation_result(
     language: str,
     testcases: str,
     question_id: int,
+    cancel: threading.Event | None = None,
 ) -> dict:
     """
     Fetch the 'Run Code' / interpretation result from LeetCode for a given problem.
@@ -29,14 +32,49 @@ def fetch_interpretation_result(
         language (str): The programming language of the submission.
         testcases (str): Testcases input as a string.
         question_id (int): The unique identifier for the problem.
+        cancel (threading.Event | None): Stops waiting for the result as soon as it is set.
 
     Returns:
         Dict: The interpretation result.
 
     Raises:
+        PollCancelledError: If `cancel` was set before the result arrived.
         FetchingError: If any step in the process fails.
     """
-    submit_url = f"https://leetcode.com/problems/{title_slug}/interpret_solution/"
+    check_url, headers = start_interpretation(cookie, csrf_token, title_slug, code, language, testcases, question_id)
+    result, _ = poll_check_result(check_url, headers, label="interpretation", cancel=cancel)
+    logger.info("Interpretation completed for '%s'.", title_slug)
+    return result
+
+
+def start_interpretation(
+    cookie: str,
+    csrf_token: str,
+    title_slug: str,
+    code: str,
+    language: str,
+    testcases: str,
+    question_id: int,
+) -> tuple[str, dict]:
+    """
+    Send a 'Run Code' request without waiting for its result, so many runs can be polled together.
+
+    Args:
+        cookie (str): User's session cookie.
+        csrf_token (str): CSRF token for request validation.
+        title_slug (str): The slug of the problem title.
+        code (str): The user's code submission.
+        language (str): The programming language of the submission.
+        testcases (str): Testcases input as a string.
+        question_id (int): The unique identifier for the problem.
+
+    Returns:
+        tuple[str, dict]: The check URL of the run and the headers to poll it with.
+
+    Raises:
+        FetchingError: If the request fails or no interpretation id is returned.
+    """
+    submit_url = f"{BASE_URL}/problems/{title_slug}/interpret_solution/"
     payload = {
         "data_input": testcases,
         "lang": language,
@@ -44,18 +82,12 @@ def fetch_interpretation_result(
         "typed_code": code,
     }
 
-    headers = {
-        "Content-Type": "application/json",
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36",
-        "Cookie": cookie,
-        "x-csrftoken": csrf_token,
-        "Referer": f"https://leetcode.com/problems/{title_slug}/",
-    }
+    headers = build_auth_headers(cookie, csrf_token, referer=f"{BASE_URL}/problems/{title_slug}/")
 
     logger.info("Submitting interpretation for '%s' in '%s'.", title_slug, language)
 
     try:
-        response = requests.post(submit_url, json=payload, headers=headers, timeout=REQUEST_TIMEOUT)
+        response = get_http_client().post(submit_url, json=payload, headers=headers)
         response.raise_for_status()
         submission = response.json()
 
@@ -72,31 +104,5 @@ def fetch_interpretation_result(
         logger.error("No interpret_id received for '%s'.", title_slug)
         raise FetchingError("Interpretation ID not received.")
 
-    logger.debug("Got interpret_id=%s, polling for result.", interpret_id)
-
-    check_submission_url = f"https://leetcode.com/submissions/detail/{interpret_id}/check/"
-    deadline = time.monotonic() + POLL_TIMEOUT
-    while time.monotonic() < deadline:
-        try:
-            r = requests.get(check_submission_url, headers=headers, timeout=REQUEST_TIMEOUT)
-            r.raise_for_status()
-            result = r.json()
-
-        except requests.RequestException as e:
-            logger.error("Failed to poll interpretation result: %s", e)
-            raise FetchingError(f"Failed to check interpretation: {e}") from e
-
-        except ValueError:
-            logger.error("Invalid JSON while polling interpretation result.")
-            raise FetchingError("Invalid response format.") from None
-
-        state = result.get("state")
-        logger.debug("Interpretation poll state: %s", state)
-
-        if state == "SUCCESS":
-            logger.info("Interpretation completed for '%s'.", title_slug)
-            return result
-
-        time.sleep(0.10)
-
-    raise FetchingError(f"Interpretation polling timed out after {POLL_TIMEOUT}s.")
+    logger.debug("Got interpret_id=%s.", interpret_id)
+    return f"{BASE_URL}/submissions/detail/{interpret_id}/check/", headers
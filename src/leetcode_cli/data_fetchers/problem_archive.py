@@ -0,0 +1,220 @@
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from typing import TYPE_CHECKING, Any
+
+from leetcode_cli.exceptions.exceptions import ProblemSetError
+
+if TYPE_CHECKING:
+    import sqlite3
+
+logger = logging.getLogger(__name__)
+
+# File name of the archive database in the config directory.
+PROBLEM_ARCHIVE_FILENAME = "archive.db"
+
+# Every `question` field the single-problem queries ask for, fetched once per problem by
+# `download-problems --full` (codeSnippets includes the code, topicTags both name and slug).
+ARCHIVE_FIELDS = (
+    "categoryTitle",
+    "codeSnippets",
+    "content",
+    "difficulty",
+    "dislikes",
+    "exampleTestcases",
+    "isPaidOnly",
+    "likes",
+    "questionFrontendId",
+    "questionId",
+    "questionTitle",
+    "solution",
+    "stats",
+    "title",
+    "titleSlug",
+    "topicTags",
+)
+
+# Queries answered from the archive, with the `question` fields each of them needs.
+# `question_fields` needs the fields of its cache variant instead.
+ARCHIVED_QUERIES = {
+    "problem_detail": ARCHIVE_FIELDS,
+    "code_snippets": ("questionId", "titleSlug", "codeSnippets"),
+    "problem_testcases": ("exampleTestcases",),
+    "problem_id": ("questionId",),
+    "problem_frontend_id": ("questionFrontendId",),
+    "question_fields": (),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    title_slug    TEXT PRIMARY KEY,
+    data          BLOB NOT NULL,
+    fetched_at    REAL NOT NULL
+);
+"""
+
+
+class ProblemArchive:
+    """
+    Local archive of full problem data, filled by `download-problems --full`.
+
+    Each problem is stored once, as zlib-compressed JSON of its `question` object, in a SQLite
+    database. Single-problem queries (details, snippets, testcases, ids) are answered from it
+    before the response cache or the network, so commands that only read problems work offline.
+    Entries never expire: the archive is refreshed by downloading it again.
+
+    The connection is shared between the fetch pool threads and guarded by a lock. Reads never
+    create the database file, and sqlite3 is only imported once the file exists, so processes
+    that never downloaded an archive only pay for a stat.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        # When False, reads are skipped (`--no-cache`); writes still go through.
+        self.read_enabled = True
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    #
+    # ──────────────────────────────────────────────────────
+    #   PUBLIC METHODS
+    # ──────────────────────────────────────────────────────
+    #
+
+    def answer(self, query_name: str, variables: dict[str, Any], variant: str = "") -> dict | None:
+        """
+        Returns a GraphQL-shaped response for an archived single-problem query, or None if the
+        query is not archived, the problem is missing, or it lacks one of the requested fields.
+        """
+        if not self.read_enabled or query_name not in ARCHIVED_QUERIES:
+            return None
+
+        title_slug = variables.get("titleSlug")
+        if not title_slug:
+            return None
+
+        fields = variant.split(",") if query_name == "question_fields" else ARCHIVED_QUERIES[query_name]
+        question = self.get(title_slug)
+        if question is None or any(field not in question for field in fields):
+            return None
+
+        logger.debug(f"Answered '{query_name}' for '{title_slug}' from the problem archive.")
+        return {"data": {"question": question}}
+
+    def get(self, title_slug: str) -> dict | None:
+        """
+        Returns the archived `question` object of a problem, or None if it is not archived.
+        """
+        if not os.path.exists(self.db_path):
+            return None
+
+        import sqlite3
+
+        try:
+            with self._lock:
+                query = "SELECT data FROM questions WHERE title_slug = ?"
+                row = self._connect().execute(query, (title_slug,)).fetchone()
+
+            return json.loads(zlib.decompress(row[0])) if row else None
+
+        except (sqlite3.Error, zlib.error, ValueError) as e:
+            logger.warning(f"Ignoring unreadable archive entry for '{title_slug}': {e}")
+            return None
+
+    def archived_slugs(self) -> set[str]:
+        """
+        Returns the slugs of every archived problem.
+        """
+        if not os.path.exists(self.db_path):
+            return set()
+
+        import sqlite3
+
+        try:
+            with self._lock:
+                return {row[0] for row in self._connect().execute("SELECT title_slug FROM questions")}
+
+        except sqlite3.Error as e:
+            logger.warning(f"Problem archive is unreadable: {e}")
+            return set()
+
+    def put_many(self, questions: list[dict[str, Any]]) -> None:
+        """
+        Stores (or replaces) `question` objects, keyed by their titleSlug, in one transaction.
+        """
+        import sqlite3
+
+        now = time.time()
+        rows = [
+            (question["titleSlug"], zlib.compress(json.dumps(question, separators=(",", ":")).encode("utf-8")), now)
+            for question in questions
+        ]
+
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO questions (title_slug, data, fetched_at) VALUES (?, ?, ?)", rows
+                    )
+
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"Failed to write problem archive: {e}")
+            raise ProblemSetError(f"Failed to write problem archive: {e}") from e
+
+        logger.debug(f"Archived {len(rows)} problems in '{self.db_path}'.")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    #
+    # ──────────────────────────────────────────────────────
+    #   PRIVATE HELPERS
+    # ──────────────────────────────────────────────────────
+    #
+
+    def _connect(self) -> "sqlite3.Connection":
+        import sqlite3
+
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.executescript(SCHEMA)
+
+        return self._conn
+
+
+_archive: ProblemArchive | None = None
+
+
+def configure_problem_archive(db_path: str) -> ProblemArchive:
+    """
+    Enables the problem archive for this process, stored in `db_path`.
+    """
+    global _archive
+
+    if _archive is None or _archive.db_path != db_path:
+        _archive = ProblemArchive(db_path)
+
+    return _archive
+
+
+def bypass_problem_archive() -> None:
+    """
+    Makes this process ignore archived problems (`--no-cache`).
+    """
+    if _archive is not None:
+        _archive.read_enabled = False
+
+
+def get_problem_archive() -> ProblemArchive | None:
+    """
+    Returns the configured problem archive, or None if it was never configured.
+    """
+    return _archive
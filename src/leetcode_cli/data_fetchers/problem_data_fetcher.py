@@ -2,7 +2,9 @@ import logging
 
 import requests
 
-from leetcode_cli.data_fetchers.graphql_queries import GRAPHQL_QUERIES, GRAPHQL_URL, REQUEST_TIMEOUT
+from leetcode_cli.data_fetchers.graphql_client import execute_graphql
+from leetcode_cli.data_fetchers.graphql_queries import GRAPHQL_QUERIES, build_question_query
+from leetcode_cli.data_fetchers.problem_archive import ARCHIVE_FIELDS
 from leetcode_cli.exceptions.exceptions import FetchingError
 
 logger = logging.getLogger(__name__)
@@ -18,9 +20,7 @@ def fetch_problem_testcases(title_slug):
     }
 
     try:
-        response = requests.post(GRAPHQL_URL, json=payload, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        result = response.json()
+        result = execute_graphql("problem_testcases", payload)
 
     except requests.RequestException as e:
         logger.error("Network error fetching testcases for '%s': %s", title_slug, e)
@@ -44,9 +44,7 @@ def fetch_problem_id(title_slug):
     }
 
     try:
-        response = requests.post(GRAPHQL_URL, json=payload, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        result = response.json()
+        result = execute_graphql("problem_id", payload)
 
     except requests.RequestException as e:
         logger.error("Network error fetching problem ID for '%s': %s", title_slug, e)
@@ -70,9 +68,7 @@ def fetch_problem_frontend_id(title_slug):
     }
 
     try:
-        response = requests.post(GRAPHQL_URL, json=payload, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        result = response.json()
+        result = execute_graphql("problem_frontend_id", payload)
 
     except requests.RequestException as e:
         logger.error("Network error fetching frontend ID for '%s': %s", title_slug, e)
@@ -86,6 +82,54 @@ def fetch_problem_frontend_id(title_slug):
     return result
 
 
+def fetch_question_fields(title_slug, fields):
+    fields = sorted(set(fields))
+    logger.info("Fetching question fields %s for '%s'.", fields, title_slug)
+    payload = {
+        "query": build_question_query(fields),
+        "variables": {"titleSlug": title_slug},
+        "operationName": "questionFields",
+    }
+
+    try:
+        result = execute_graphql("question_fields", payload, cache_variant=",".join(fields))
+
+    except requests.RequestException as e:
+        logger.error("Network error fetching question fields for '%s': %s", title_slug, e)
+        raise FetchingError(f"Network error while fetching question data for {title_slug}: {e}") from e
+
+    except ValueError:
+        logger.error("Invalid JSON response for question fields of '%s'.", title_slug)
+        raise FetchingError("Failed to parse JSON response while fetching question data.") from None
+
+    logger.debug("Fetched question fields for '%s' successfully.", title_slug)
+    return result
+
+
+def fetch_archive_question(title_slug):
+    logger.info("Fetching full question data for '%s'.", title_slug)
+    payload = {
+        "query": build_question_query(ARCHIVE_FIELDS),
+        "variables": {"titleSlug": title_slug},
+        "operationName": "questionFields",
+    }
+
+    try:
+        # Its own query name: archive downloads bypass the response cache and the archive itself.
+        result = execute_graphql("question_archive", payload)
+
+    except requests.RequestException as e:
+        logger.error("Network error fetching full question data for '%s': %s", title_slug, e)
+        raise FetchingError(f"Network error while fetching question data for {title_slug}: {e}") from e
+
+    except ValueError:
+        logger.error("Invalid JSON response for full question data of '%s'.", title_slug)
+        raise FetchingError("Failed to parse JSON response while fetching question data.") from None
+
+    logger.debug("Fetched full question data for '%s' successfully.", title_slug)
+    return result
+
+
 def fetch_random_title_slug(difficulty, tags):
     logger.info("Fetching random title slug (difficulty=%s, tags=%s).", difficulty, tags)
     query = GRAPHQL_QUERIES["random_title_slug"]
@@ -102,9 +146,7 @@ def fetch_random_title_slug(difficulty, tags):
         payload["variables"]["filters"]["tags"] = tags
 
     try:
-        response = requests.post(GRAPHQL_URL, json=payload, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        result = response.json()
+        result = execute_graphql("random_title_slug", payload)
 
     except requests.RequestException as e:
         logger.error("Network error fetching random title slug: %s", e)
@@ -128,9 +170,7 @@ def fetch_problem_data(title_slug):
     }
 
     try:
-        response = requests.post(GRAPHQL_URL, json=payload, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        result = response.json()
+        result = execute_graphql("problem_detail", payload)
 
     except requests.RequestException as e:
         logger.error("Network error fetching problem data for '%s': %s", title_slug, e)
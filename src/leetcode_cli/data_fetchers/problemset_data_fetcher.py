@@ -1,14 +1,29 @@
 import logging
+import time
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 
 import requests
 
-from leetcode_cli.data_fetchers.graphql_queries import GRAPHQL_QUERIES, GRAPHQL_URL, REQUEST_TIMEOUT
+from leetcode_cli.data_fetchers.graphql_client import execute_graphql
+from leetcode_cli.data_fetchers.graphql_queries import BASE_URL, GRAPHQL_QUERIES
+from leetcode_cli.data_fetchers.http_client import build_auth_headers
 from leetcode_cli.exceptions.exceptions import FetchingError
 
 logger = logging.getLogger(__name__)
 
+# Questions per page when downloading the whole problemset.
+PROBLEMSET_PAGE_SIZE = 100
+# Pages of the problemset requested at once.
+PROBLEMSET_PAGE_WORKERS = 4
+# Tries per page before a download gives up, waiting PAGE_RETRY_DELAY * 2**n seconds in between.
+PAGE_ATTEMPTS = 3
+PAGE_RETRY_DELAY = 1.0
 
-def fetch_problemset(cookie=None, csrf_token=None, tags=None, difficulty=None, limit=50, skip=0):
+
+def fetch_problemset(
+    cookie=None, csrf_token=None, tags=None, difficulty=None, limit=50, skip=0, query_name="problemset_data"
+):
     logger.info(
         "Fetching problemset (limit=%d, skip=%d, difficulty=%s, tags=%s).",
         limit,
@@ -34,21 +49,14 @@ def fetch_problemset(cookie=None, csrf_token=None, tags=None, difficulty=None, l
     if difficulty:
         payload["variables"]["filters"]["difficulty"] = difficulty
 
-    headers = {
-        "Content-Type": "application/json",
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36",
-    }
+    headers = {}
 
     if cookie and csrf_token:
-        headers["Cookie"] = cookie
-        headers["x-csrftoken"] = csrf_token
-        headers["Referer"] = "https://leetcode.com/problemset/"
+        headers = build_auth_headers(cookie, csrf_token, referer=f"{BASE_URL}/problemset/")
         logger.debug("Using authenticated request for problemset.")
 
     try:
-        response = requests.post(GRAPHQL_URL, json=payload, headers=headers, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        result = response.json()
+        result = execute_graphql(query_name, payload, headers=headers)
 
     except requests.RequestException as e:
         logger.error("Network error fetching problemset: %s", e)
@@ -64,32 +72,68 @@ def fetch_problemset(cookie=None, csrf_token=None, tags=None, difficulty=None, l
     return result
 
 
-def fetch_problemset_metadata():
-    logger.info("Fetching full problemset metadata.")
-    query = GRAPHQL_QUERIES["problemset_metadata"]
-    payload = {
-        "query": query,
-        "variables": {
-            "categorySlug": "all-code-essentials",
-            "skip": 0,
-            "limit": 10000000,
-            "filters": {},
-        },
-        "operationName": "problemsetQuestionList",
-    }
+def fetch_problemset_pages(
+    cookie=None, csrf_token=None, page_size=PROBLEMSET_PAGE_SIZE, workers=PROBLEMSET_PAGE_WORKERS, start=0
+) -> Iterator[tuple[int, int, list[dict]]]:
+    """
+    Downloads the questions of the problemset from position `start` to the end page by page,
+    yielding (skip, total, questions) for each page as soon as it arrives.
 
-    try:
-        response = requests.post(GRAPHQL_URL, json=payload, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        result = response.json()
+    The first page is fetched alone to learn the total, and nothing else is requested until
+    the caller asks for the next page; the remaining pages are then requested `workers` at a
+    time on the shared pool and yielded in completion order, so only a few pages are ever held
+    in memory. Each page is retried on its own (PAGE_ATTEMPTS tries with exponential backoff)
+    before the download fails with a FetchingError.
+    """
+    from leetcode_cli.concurrency import get_executor
 
-    except requests.RequestException as e:
-        logger.error("Network error fetching problemset metadata: %s", e)
-        raise FetchingError(f"Network error while fetching problemset: {e}") from e
+    first = fetch_problemset_page(cookie, csrf_token, start, page_size)
+    total = first["total"]
+    yield start, total, first["questions"]
 
-    except ValueError:
-        logger.error("Invalid JSON response for problemset metadata.")
-        raise FetchingError("Failed to parse JSON response while fetching problemset.") from None
+    offsets = iter(range(start + page_size, total, page_size))
+    in_flight: dict[Future, int] = {}
 
-    logger.debug("Fetched problemset metadata successfully.")
-    return result
+    def submit_next() -> None:
+        skip = next(offsets, None)
+        if skip is not None:
+            in_flight[get_executor().submit(fetch_problemset_page, cookie, csrf_token, skip, page_size)] = skip
+
+    try:
+        for _ in range(workers):
+            submit_next()
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                skip = in_flight.pop(future)
+                submit_next()
+                yield skip, total, future.result()["questions"]
+
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+
+def fetch_problemset_page(cookie, csrf_token, skip, limit) -> dict:
+    """
+    Fetches one page of the problemset, retrying failed requests. Returns its
+    `problemsetQuestionList` object ("total" and "questions").
+    """
+    for attempt in range(PAGE_ATTEMPTS):
+        try:
+            result = fetch_problemset(cookie, csrf_token, limit=limit, skip=skip, query_name="problemset_page")
+            page = (result.get("data") or {}).get("problemsetQuestionList")
+            if not page or "questions" not in page or "total" not in page:
+                raise FetchingError(f"Invalid problemset page at offset {skip}: {result.get('errors') or result}")
+            return page
+
+        except FetchingError as e:
+            if attempt == PAGE_ATTEMPTS - 1:
+                raise
+
+            delay = PAGE_RETRY_DELAY * 2**attempt
+            logger.warning("Problemset page at offset %d failed (%s), retrying in %.1fs.", skip, e, delay)
+            time.sleep(delay)
+
+    raise FetchingError(f"Failed to fetch problemset page at offset {skip}.")
@@ -0,0 +1,45 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket allowing `rate_per_minute` actions per minute on average.
+
+    Tokens refill continuously; at most `burst` can be saved up, so with the default burst of 1
+    actions are spaced evenly and no sliding minute ever exceeds the budget.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int = 1):
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive.")
+
+        self.interval = 60.0 / rate_per_minute
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """
+        Takes a token if one is available, without waiting.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def next_available(self) -> float:
+        """
+        The monotonic time at which the next token will be available.
+        """
+        with self._lock:
+            self._refill()
+            return self._updated + max(1 - self._tokens, 0.0) * self.interval
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) / self.interval)
+        self._updated = now
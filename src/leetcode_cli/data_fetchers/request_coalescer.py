@@ -0,0 +1,74 @@
+import json
+import logging
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Queries whose answer is expected to differ between identical requests, or that are sent once
+# each by bulk downloads (memoising a whole download would keep all of it in memory).
+UNCOALESCED_QUERIES = frozenset({"random_title_slug", "question_archive", "problemset_page"})
+
+
+class RequestCoalescer:
+    """
+    De-duplicates identical GraphQL requests within one process.
+
+    The first caller for a key runs the request; concurrent callers with the same key wait on
+    its Future instead of sending their own. Successful results stay memoised for the rest of
+    the process, failures are not, so a later call retries. Memoised results are shared between
+    callers and must be treated as read-only.
+    """
+
+    def __init__(self):
+        self._futures: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def run(self, key: Hashable, request: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._futures.get(key)
+            owner = future is None
+
+            if owner:
+                future = Future()
+                self._futures[key] = future
+
+        if not owner:
+            logger.debug("Coalesced duplicate GraphQL request %s.", key[0])
+            return future.result()
+
+        try:
+            result = request()
+
+        except BaseException as e:
+            with self._lock:
+                self._futures.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        future.set_result(result)
+        return result
+
+
+def request_key(query_name: str, payload: dict, headers: dict | None = None, variant: str = "") -> tuple:
+    """
+    Identifies a GraphQL request by query, operation, variables and request headers
+    (which carry authentication, and so can change the answer).
+    """
+    return (
+        query_name,
+        payload.get("operationName"),
+        payload.get("query"),
+        json.dumps(payload.get("variables", {}), sort_keys=True),
+        tuple(sorted((headers or {}).items())),
+        variant,
+    )
+
+
+_coalescer = RequestCoalescer()
+
+
+def get_request_coalescer() -> RequestCoalescer:
+    return _coalescer
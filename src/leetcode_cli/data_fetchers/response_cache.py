@@ -0,0 +1,251 @@
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DAY = 24 * 60 * 60
+
+# Queries whose responses are cached on disk, and for how long (seconds).
+# Anything user-specific or fast-changing (stats, calendars, problemset status) is not listed.
+QUERY_TTLS = {
+    "problem_detail": 7 * DAY,
+    "code_snippets": 30 * DAY,
+    "problem_testcases": 30 * DAY,
+    "problem_id": 365 * DAY,
+    "problem_frontend_id": 365 * DAY,
+    # Composite queries may include problem detail fields, so use the shortest TTL of those.
+    "question_fields": 7 * DAY,
+}
+
+# Upper bound for the whole cache directory; least recently used entries are evicted beyond it.
+MAX_CACHE_BYTES = 50 * 1024 * 1024
+
+
+class ResponseCache:
+    """
+    Content-addressed on-disk cache for GraphQL responses.
+
+    Entries live in `cache_dir/<2 hex chars>/<sha256>.json`, keyed by the query name, its
+    variables and an optional variant (for queries whose text varies, like composite queries). Each query has its own TTL (QUERY_TTLS); reads refresh an entry's mtime so the
+    size cap evicts the least recently used entries first. Writes go through a temporary file
+    and `os.replace`, so readers never see a half-written entry.
+
+    The size of the cache is scanned once, on the first write, and then kept up to date as
+    entries are written and removed; the directory is only scanned again to evict.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = MAX_CACHE_BYTES, ttls: dict[str, int] | None = None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttls = QUERY_TTLS if ttls is None else ttls
+        # When False, reads are skipped but fresh responses are still written back.
+        self.read_enabled = True
+        # Running size of the cache directory in bytes, None until the first write scans it.
+        self._total_bytes: int | None = None
+        self._total_lock = threading.Lock()
+
+    #
+    # ──────────────────────────────────────────────────────
+    #   PUBLIC METHODS
+    # ──────────────────────────────────────────────────────
+    #
+
+    def is_cacheable(self, query_name: str) -> bool:
+        return query_name in self.ttls
+
+    def get(self, query_name: str, variables: dict[str, Any], variant: str = "") -> dict | None:
+        """
+        Returns the cached response for (query_name, variables, variant), or None on a miss or expired entry.
+        """
+        if not self.read_enabled or not self.is_cacheable(query_name):
+            return None
+
+        path = self._entry_path(query_name, variables, variant)
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+
+        except FileNotFoundError:
+            return None
+
+        except (OSError, ValueError) as e:
+            logger.debug(f"Discarding unreadable cache entry '{path}': {e}")
+            self._remove_entry(path)
+            return None
+
+        if time.time() - entry.get("stored_at", 0) > self.ttls[query_name]:
+            logger.debug(f"Cache entry for '{query_name}' {variables} expired.")
+            self._remove_entry(path)
+            return None
+
+        # Mark as recently used for LRU eviction.
+        with contextlib.suppress(OSError):
+            os.utime(path)
+
+        logger.debug(f"Cache hit for '{query_name}' {variables}.")
+        return entry.get("response")
+
+    def put(self, query_name: str, variables: dict[str, Any], response: dict, variant: str = "") -> None:
+        """
+        Stores a response atomically. Failures are logged and otherwise ignored.
+        """
+        if not self.is_cacheable(query_name):
+            return
+
+        path = self._entry_path(query_name, variables, variant)
+        entry = {
+            "query_name": query_name,
+            "variables": variables,
+            "stored_at": time.time(),
+            "response": response,
+        }
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f, separators=(",", ":"))
+                    size = f.tell()
+                replaced_size = self._entry_size(path)
+                os.replace(tmp_path, path)
+
+            except BaseException:
+                self._remove(tmp_path)
+                raise
+
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry for '{query_name}': {e}")
+            return
+
+        logger.debug(f"Cached response for '{query_name}' {variables}.")
+        if self._add_to_total(size - replaced_size) > self.max_bytes:
+            self._evict()
+
+    #
+    # ──────────────────────────────────────────────────────
+    #   PRIVATE HELPERS
+    # ──────────────────────────────────────────────────────
+    #
+
+    def _entry_path(self, query_name: str, variables: dict[str, Any], variant: str = "") -> str:
+        key_fields = {"query": query_name, "variables": variables}
+        if variant:
+            key_fields["variant"] = variant
+
+        key = json.dumps(key_fields, sort_keys=True, separators=(",", ":"))
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.json")
+
+    def _entries(self) -> list[tuple[str, float, int]]:
+        """
+        Lists (path, mtime, size) for every cache entry.
+        """
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+
+        for bucket in os.scandir(self.cache_dir):
+            if not bucket.is_dir():
+                continue
+
+            for entry in os.scandir(bucket.path):
+                if entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    entries.append((entry.path, stat.st_mtime, stat.st_size))
+
+        return entries
+
+    @staticmethod
+    def _entry_size(path: str) -> int:
+        try:
+            return os.stat(path).st_size
+        except OSError:
+            return 0
+
+    def _add_to_total(self, delta: int) -> int:
+        """
+        Adds `delta` bytes to the running cache size, scanning the directory on first use, and returns the new size.
+        """
+        with self._total_lock:
+            if self._total_bytes is None:
+                # The scan already sees the entry just written, so the delta is not added again.
+                self._total_bytes = sum(size for _, _, size in self._entries())
+            else:
+                self._total_bytes += delta
+
+            return self._total_bytes
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total = sum(size for _, _, size in entries)
+
+        # Evict down to 90% of the cap so the next few writes don't trigger another scan.
+        target = int(self.max_bytes * 0.9)
+        if total > self.max_bytes:
+            for path, _, size in sorted(entries, key=lambda e: e[1]):
+                if total <= target:
+                    break
+                self._remove(path)
+                total -= size
+
+            logger.debug(f"Evicted least recently used cache entries, cache is now {total} bytes.")
+
+        # Resynchronise with the directory, which other processes may also have written to.
+        with self._total_lock:
+            self._total_bytes = total
+
+    def _remove_entry(self, path: str) -> None:
+        size = self._entry_size(path)
+        try:
+            os.remove(path)
+        except OSError:
+            return
+
+        with self._total_lock:
+            if self._total_bytes is not None:
+                self._total_bytes -= size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        with contextlib.suppress(OSError):
+            os.remove(path)
+
+
+_cache: ResponseCache | None = None
+
+
+def configure_response_cache(cache_dir: str) -> ResponseCache:
+    """
+    Enables the on-disk response cache for this process, stored under `cache_dir`.
+    """
+    global _cache
+
+    if _cache is None or _cache.cache_dir != cache_dir:
+        _cache = ResponseCache(cache_dir)
+
+    return _cache
+
+
+def bypass_response_cache() -> None:
+    """
+    Makes this process ignore cached responses (`--no-cache`). Fresh responses still refresh the cache.
+    """
+    if _cache is not None:
+        _cache.read_enabled = False
+
+
+def get_response_cache() -> ResponseCache | None:
+    """
+    Returns the configured response cache, or None if caching was never configured.
+    """
+    return _cache
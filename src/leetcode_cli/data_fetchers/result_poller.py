@@ -0,0 +1,329 @@
+import logging
+import random
+import threading
+import time
+from collections.abc import Hashable, Iterator
+from concurrent.futures import as_completed
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+import requests
+
+from leetcode_cli.data_fetchers.graphql_queries import POLL_TIMEOUT
+from leetcode_cli.data_fetchers.http_client import get_http_client
+from leetcode_cli.exceptions.exceptions import FetchingError, PollCancelledError
+
+logger = logging.getLogger(__name__)
+
+# Status codes LeetCode uses to ask clients to slow down.
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+@dataclass
+class BackoffPolicy:
+    """
+    Exponential backoff with jitter for polling the submission check endpoint.
+
+    The first polls are fast so quick results are picked up immediately; the interval then
+    grows by `factor` on every poll until it reaches `ceiling`. Each delay is randomised by
+    +/- `jitter` (a fraction) so parallel pollers do not hit LeetCode in lockstep.
+    """
+
+    initial: float = 0.1
+    factor: float = 1.5
+    ceiling: float = 2.0
+    jitter: float = 0.2
+
+    def delay(self, attempt: int) -> float:
+        base = min(self.ceiling, self.initial * self.factor**attempt)
+        jittered = base * random.uniform(1 - self.jitter, 1 + self.jitter)
+        return min(self.ceiling, jittered)
+
+
+@dataclass
+class PollStats:
+    """
+    How many check requests a result took, how long it took, and which states it went through.
+    """
+
+    polls: int = 0
+    elapsed: float = 0.0
+    states: list[str] = field(default_factory=list)
+
+
+@dataclass
+class _PendingCheck:
+    """
+    Polling state of one check URL inside a CheckPoller.
+    """
+
+    check_url: str
+    headers: dict
+    started: float
+    deadline: float
+    stats: PollStats = field(default_factory=PollStats)
+    attempt: int = 0
+    last_state: str | None = None
+    due: float = 0.0
+
+
+def poll_check_result(
+    check_url: str,
+    headers: dict,
+    label: str,
+    timeout: float = POLL_TIMEOUT,
+    policy: BackoffPolicy | None = None,
+    cancel: threading.Event | None = None,
+) -> tuple[dict, PollStats]:
+    """
+    Polls a LeetCode `/submissions/detail/{id}/check/` URL until the result reaches SUCCESS.
+
+    The interval backs off exponentially while the judge reports the same state and resets to
+    the initial interval whenever the state changes (e.g. PENDING -> STARTED), since a running
+    judge usually finishes shortly after it starts. Throttling responses (429/503) are retried
+    after the server's Retry-After delay instead of failing the whole run.
+
+    Args:
+        check_url (str): The check URL for a submission or interpretation id.
+        headers (dict): Request headers (cookie, csrf token, referer).
+        label (str): What is being polled, used in logs and error messages (e.g. "submission").
+        timeout (float): Seconds to wait for a final result.
+        policy (BackoffPolicy | None): Backoff settings, defaults to BackoffPolicy().
+        cancel (threading.Event | None): Stops polling as soon as it is set.
+
+    Returns:
+        tuple[dict, PollStats]: The final check result and the polling statistics.
+
+    Raises:
+        PollCancelledError: If `cancel` was set before the result arrived.
+        FetchingError: If a poll fails or no result arrives before the timeout.
+    """
+    for _, outcome, stats in poll_many({check_url: (check_url, headers)}, label, timeout, policy, cancel):
+        if isinstance(outcome, FetchingError):
+            raise outcome
+        return outcome, stats
+
+    raise FetchingError(f"{label.capitalize()} polling ended without a result.")
+
+
+class CheckPoller:
+    """
+    Polls any number of check URLs in one shared loop; checks can be added while it runs.
+
+    Every check keeps its own backoff schedule and timeout, exactly as in poll_check_result.
+    Whenever checks are due, they are requested together on the shared fetch thread pool, so
+    one round costs about one request's latency however many checks are pending. A check that
+    fails or times out finishes with its FetchingError instead of stopping the others. Once the
+    optional `cancel` event is set, every pending check finishes with a PollCancelledError.
+    """
+
+    def __init__(
+        self,
+        label: str,
+        timeout: float = POLL_TIMEOUT,
+        policy: BackoffPolicy | None = None,
+        cancel: threading.Event | None = None,
+    ):
+        self.label = label
+        self.timeout = timeout
+        self.policy = policy or BackoffPolicy()
+        self.cancel = cancel or threading.Event()
+        self._pending: dict[Hashable, _PendingCheck] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, key: Hashable, check_url: str, headers: dict) -> None:
+        """
+        Starts polling a check URL under a caller-chosen key; its timeout starts now.
+        """
+        now = time.monotonic()
+        self._pending[key] = _PendingCheck(check_url, headers, started=now, deadline=now + self.timeout, due=now)
+
+    def next_event(self) -> float | None:
+        """
+        The monotonic time at which the next check is due or times out, or None when idle.
+        """
+        if not self._pending:
+            return None
+        return min(min(check.due, check.deadline) for check in self._pending.values())
+
+    def poll_due(self) -> Iterator[tuple[Hashable, dict | FetchingError, PollStats]]:
+        """
+        Polls every check that is due now, yielding (key, final result or FetchingError, stats)
+        for each one that finished, in completion order. Never sleeps.
+        """
+        from leetcode_cli.concurrency import get_executor
+
+        now = time.monotonic()
+        if self.cancel.is_set():
+            for key, check in self._pending.items():
+                check.stats.elapsed = now - check.started
+                yield key, PollCancelledError(f"{self.label.capitalize()} polling was cancelled."), check.stats
+            self._pending.clear()
+            return
+
+        for key, check in list(self._pending.items()):
+            if check.deadline <= now:
+                del self._pending[key]
+                check.stats.elapsed = now - check.started
+                yield (
+                    key,
+                    FetchingError(f"{self.label.capitalize()} polling timed out after {self.timeout}s."),
+                    check.stats,
+                )
+
+        due_keys = [key for key, check in self._pending.items() if check.due <= now]
+        if not due_keys:
+            return
+
+        client = get_http_client()
+        if len(due_keys) == 1:
+            key = due_keys[0]
+            completed = [(key, _poll_once(client, self._pending[key], self.label))]
+        else:
+            futures = {
+                get_executor().submit(_poll_once, client, self._pending[key], self.label): key for key in due_keys
+            }
+            completed = ((futures[future], future.result()) for future in as_completed(futures))
+
+        for key, response in completed:
+            check = self._pending[key]
+            outcome = _advance(check, response, self.label, self.policy)
+            if outcome is None:
+                continue
+
+            del self._pending[key]
+            check.stats.elapsed = time.monotonic() - check.started
+            if not isinstance(outcome, FetchingError):
+                logger.info(
+                    "%s result ready after %d polls in %.2fs.",
+                    self.label.capitalize(),
+                    check.stats.polls,
+                    check.stats.elapsed,
+                )
+            yield key, outcome, check.stats
+
+    def wait(self, until: float | None = None) -> None:
+        """
+        Sleeps until the next check is due, or until `until` (a monotonic time) if that is sooner.
+        Returns early when polling is cancelled.
+        """
+        events = [t for t in (self.next_event(), until) if t is not None]
+        if events:
+            self.cancel.wait(max(min(events) - time.monotonic(), 0.0))
+
+
+def poll_many(
+    checks: dict[Hashable, tuple[str, dict]],
+    label: str,
+    timeout: float = POLL_TIMEOUT,
+    policy: BackoffPolicy | None = None,
+    cancel: threading.Event | None = None,
+) -> Iterator[tuple[Hashable, dict | FetchingError, PollStats]]:
+    """
+    Polls many check URLs with one CheckPoller, yielding each result as soon as it is final.
+
+    Args:
+        checks (dict): Maps a caller-chosen key to (check_url, headers).
+        label (str): What is being polled, used in logs and error messages.
+        timeout (float): Seconds to wait for each result, counted from the first poll.
+        policy (BackoffPolicy | None): Backoff settings, defaults to BackoffPolicy().
+        cancel (threading.Event | None): Stops polling as soon as it is set.
+
+    Yields:
+        tuple: (key, final check result or FetchingError, PollStats), in completion order.
+    """
+    poller = CheckPoller(label, timeout, policy, cancel)
+    for key, (check_url, headers) in checks.items():
+        poller.add(key, check_url, headers)
+
+    while poller:
+        yield from poller.poll_due()
+        poller.wait()
+
+
+def _poll_once(client, check: _PendingCheck, label: str) -> requests.Response | FetchingError:
+    """
+    Sends one check request. Errors are returned, not raised, so a batch of polls can
+    report them per check.
+    """
+    try:
+        response = client.get(check.check_url, headers=check.headers)
+        check.stats.polls += 1
+        return response
+
+    except requests.RequestException as e:
+        logger.error("Failed to poll %s result: %s", label, e)
+        return FetchingError(f"Failed to check {label}: {e}")
+
+
+def _advance(
+    check: _PendingCheck, response: requests.Response | FetchingError, label: str, policy: BackoffPolicy
+) -> dict | FetchingError | None:
+    """
+    Applies one poll response to a check: returns the final result (or error), or None after
+    scheduling the next poll.
+    """
+    if isinstance(response, FetchingError):
+        return response
+
+    if response.status_code in THROTTLE_STATUS_CODES:
+        wait = max(_retry_after_seconds(response), policy.delay(check.attempt))
+        logger.warning(
+            "%s poll throttled (HTTP %d), retrying in %.2fs.", label.capitalize(), response.status_code, wait
+        )
+        check.due = time.monotonic() + wait
+        check.attempt += 1
+        return None
+
+    try:
+        response.raise_for_status()
+        result = response.json()
+
+    except requests.RequestException as e:
+        logger.error("Failed to poll %s result: %s", label, e)
+        return FetchingError(f"Failed to check {label}: {e}")
+
+    except ValueError:
+        logger.error("Invalid JSON while polling %s result.", label)
+        return FetchingError("Invalid response format.")
+
+    state = result.get("state")
+    if state != check.last_state:
+        logger.debug("%s poll state: %s -> %s", label.capitalize(), check.last_state, state)
+        check.stats.states.append(state)
+        check.last_state = state
+        check.attempt = 0
+
+    if state == "SUCCESS":
+        return result
+
+    check.due = time.monotonic() + policy.delay(check.attempt)
+    check.attempt += 1
+    return None
+
+
+def _retry_after_seconds(response: requests.Response) -> float:
+    """
+    Parses the Retry-After header, which is either a number of seconds or an HTTP date.
+    Returns 0.0 when the header is missing or malformed.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return 0.0
+
+    try:
+        return max(float(value), 0.0)
+
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max((retry_at - datetime.now(UTC)).total_seconds(), 0.0)
+
+    except (TypeError, ValueError):
+        logger.debug("Ignoring malformed Retry-After header: %s", value)
+        return 0.0
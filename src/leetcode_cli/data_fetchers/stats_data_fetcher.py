@@ -2,7 +2,8 @@ import logging
 
 import requests
 
-from leetcode_cli.data_fetchers.graphql_queries import GRAPHQL_QUERIES, GRAPHQL_URL, REQUEST_TIMEOUT
+from leetcode_cli.data_fetchers.graphql_client import execute_graphql
+from leetcode_cli.data_fetchers.graphql_queries import GRAPHQL_QUERIES
 from leetcode_cli.exceptions.exceptions import FetchingError
 
 logger = logging.getLogger(__name__)
@@ -18,9 +19,7 @@ def fetch_user_stats(username):
     }
 
     try:
-        response = requests.post(GRAPHQL_URL, json=payload, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        result = response.json()
+        result = execute_graphql("user_problem_stats", payload)
 
     except requests.RequestException as e:
         logger.error("Network error fetching stats for '%s': %s", username, e)
@@ -44,9 +43,7 @@ def fetch_user_activity(username, year):
     }
 
     try:
-        response = requests.post(GRAPHQL_URL, json=payload, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        result = response.json()
+        result = execute_graphql("user_calendar", payload)
 
     except requests.RequestException as e:
         logger.error("Network error fetching activity for '%s' in %s: %s", username, year, e)
@@ -1,9 +1,10 @@
 import logging
-import time
 
 import requests
 
-from leetcode_cli.data_fetchers.graphql_queries import POLL_TIMEOUT, REQUEST_TIMEOUT
+from leetcode_cli.data_fetchers.graphql_queries import BASE_URL
+from leetcode_cli.data_fetchers.http_client import build_auth_headers, get_http_client
+from leetcode_cli.data_fetchers.result_poller import poll_check_result
 from leetcode_cli.exceptions.exceptions import FetchingError
 
 logger = logging.getLogger(__name__)
@@ -34,25 +35,50 @@ def fetch_submission_result(
     Raises:
         FetchingError: If any step in the process fails.
     """
-    submit_url = f"https://leetcode.com/problems/{title_slug}/submit/"
+    check_url, headers = start_submission(cookie, csrf_token, title_slug, code, language, question_id)
+    result, _ = poll_check_result(check_url, headers, label="submission")
+    logger.info("Submission completed for '%s'.", title_slug)
+    return result
+
+
+def start_submission(
+    cookie: str,
+    csrf_token: str,
+    title_slug: str,
+    code: str,
+    language: str,
+    question_id: int,
+) -> tuple[str, dict]:
+    """
+    Submits a solution without waiting for its result, so many submissions can be polled together.
+
+    Args:
+        cookie (str): User's session cookie.
+        csrf_token (str): CSRF token for request validation.
+        title_slug (str): The slug of the problem title.
+        code (str): The user's code submission.
+        language (str): The programming language of the submission.
+        question_id (int): The unique identifier for the problem.
+
+    Returns:
+        tuple[str, dict]: The check URL of the submission and the headers to poll it with.
+
+    Raises:
+        FetchingError: If the request fails or no submission id is returned.
+    """
+    submit_url = f"{BASE_URL}/problems/{title_slug}/submit/"
     payload = {
         "lang": language,
         "question_id": str(question_id),
         "typed_code": code,
     }
 
-    headers = {
-        "Content-Type": "application/json",
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36",
-        "Cookie": cookie,
-        "x-csrftoken": csrf_token,
-        "Referer": f"https://leetcode.com/problems/{title_slug}/",
-    }
+    headers = build_submission_headers(cookie, csrf_token, title_slug)
 
     logger.info("Submitting solution for '%s' in '%s'.", title_slug, language)
 
     try:
-        response = requests.post(submit_url, json=payload, headers=headers, timeout=REQUEST_TIMEOUT)
+        response = get_http_client().post(submit_url, json=payload, headers=headers)
         response.raise_for_status()
         submission = response.json()
 
@@ -69,31 +95,12 @@ def fetch_submission_result(
         logger.error("No submission_id received for '%s'.", title_slug)
         raise FetchingError("Submission ID not received.")
 
-    logger.debug("Got submission_id=%s, polling for result.", submission_id)
+    logger.debug("Got submission_id=%s.", submission_id)
+    return f"{BASE_URL}/submissions/detail/{submission_id}/check/", headers
 
-    check_submission_url = f"https://leetcode.com/submissions/detail/{submission_id}/check/"
-    deadline = time.monotonic() + POLL_TIMEOUT
-    while time.monotonic() < deadline:
-        try:
-            r = requests.get(check_submission_url, headers=headers, timeout=REQUEST_TIMEOUT)
-            r.raise_for_status()
-            result = r.json()
 
-        except requests.RequestException as e:
-            logger.error("Failed to poll submission result: %s", e)
-            raise FetchingError(f"Failed to check submission: {e}") from e
-
-        except ValueError:
-            logger.error("Invalid JSON while polling submission result.")
-            raise FetchingError("Invalid response format.") from None
-
-        state = result.get("state")
-        logger.debug("Submission poll state: %s", state)
-
-        if state == "SUCCESS":
-            logger.info("Submission completed for '%s'.", title_slug)
-            return result
-
-        time.sleep(0.10)
-
-    raise FetchingError(f"Submission polling timed out after {POLL_TIMEOUT}s.")
+def build_submission_headers(cookie: str, csrf_token: str, title_slug: str) -> dict:
+    """
+    Headers for submitting a solution to a problem and polling its result.
+    """
+    return build_auth_headers(cookie, csrf_token, referer=f"{BASE_URL}/problems/{title_slug}/")
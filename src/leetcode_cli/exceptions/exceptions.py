@@ -4,6 +4,12 @@ class FetchingError(Exception):
     pass
 
 
+class PollCancelledError(FetchingError):
+    """Raised when polling for a result is cancelled before the result arrived."""
+
+    pass
+
+
 class ParsingError(Exception):
     """Raised when there is an error parsing the fetched data into the desired models."""
 
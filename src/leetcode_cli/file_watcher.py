@@ -0,0 +1,70 @@
+import os
+import threading
+import time
+
+# Seconds between two looks at the watched files.
+WATCH_INTERVAL = 0.2
+# Seconds the files must stay unchanged before a change is reported, so editors that
+# write a file in several steps (or rapid repeated saves) trigger a single run.
+WATCH_DEBOUNCE = 0.3
+
+
+class FileWatcher:
+    """
+    Watches files for changes by polling their modification time and size.
+
+    Polling a handful of files a few times per second is cheap and works the same on every
+    platform and filesystem, without a native file notification dependency.
+    """
+
+    def __init__(self, paths: list[str], interval: float = WATCH_INTERVAL, debounce: float = WATCH_DEBOUNCE):
+        self.paths = list(paths)
+        self.interval = interval
+        self.debounce = debounce
+        self._snapshot = self._take_snapshot()
+
+    def changed(self) -> list[str]:
+        """
+        Returns the watched paths that changed since the last call (or since creation).
+        """
+        snapshot = self._take_snapshot()
+        changed = [path for path in self.paths if snapshot[path] != self._snapshot[path]]
+        self._snapshot = snapshot
+        return changed
+
+    def wait_for_change(self, stop: threading.Event | None = None) -> list[str]:
+        """
+        Blocks until at least one watched file changed and then stayed quiet for `debounce`
+        seconds. Returns the changed paths, or an empty list if `stop` was set first.
+        """
+        stop = stop or threading.Event()
+
+        changed = []
+        while not changed:
+            if stop.wait(self.interval):
+                return []
+            changed = self.changed()
+
+        quiet_since = time.monotonic()
+        while time.monotonic() - quiet_since < self.debounce:
+            if stop.wait(self.interval):
+                return []
+
+            more = self.changed()
+            if more:
+                changed.extend(path for path in more if path not in changed)
+                quiet_since = time.monotonic()
+
+        return changed
+
+    def _take_snapshot(self) -> dict[str, tuple[int, int] | None]:
+        snapshot = {}
+        for path in self.paths:
+            try:
+                st = os.stat(path)
+                snapshot[path] = (st.st_mtime_ns, st.st_size)
+
+            except OSError:
+                snapshot[path] = None
+
+        return snapshot
@@ -1,7 +1,5 @@
 import logging
 
-from bs4 import BeautifulSoup, NavigableString, Tag
-
 from leetcode_cli.exceptions.exceptions import ThemeError
 from leetcode_cli.managers.theme_manager import ThemeManager
 from leetcode_cli.models.problem import Problem
@@ -123,6 +121,8 @@ class ProblemFormatter:
         if not html_content:
             return ""
 
+        from bs4 import BeautifulSoup, NavigableString, Tag
+
         soup = BeautifulSoup(html_content, "html.parser")
 
         desc_ansi, _ = self.theme_manager.get_styling("text", "description")
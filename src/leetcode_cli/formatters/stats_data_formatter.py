@@ -3,6 +3,7 @@ import logging
 import re
 from datetime import UTC, datetime
 
+from leetcode_cli.exceptions.exceptions import StatsError
 from leetcode_cli.managers.theme_manager import ThemeManager
 from leetcode_cli.models.stats import UserActivityModel, UserStatsModel
 
@@ -121,12 +122,77 @@ class StatsFormatter:
         lines.extend(final_rows)
         return "\n".join(lines)
 
+    def format_users_table(
+        self,
+        results: dict[str, tuple[UserStatsModel | StatsError, UserActivityModel | StatsError | None]],
+    ) -> str:
+        """
+        One row per user: accepted problems per difficulty and in total, plus submissions and
+        active days over the calendar period when activity was fetched. Rows are ranked by total
+        accepted problems; users that failed to load are listed last with their error.
+        """
+        show_activity = any(activity is not None for _, activity in results.values())
+
+        headers = ["#", "USER", *DIFFICULTIES, "TOTAL"]
+        if show_activity:
+            headers += ["SUBMISSIONS", "ACTIVE DAYS"]
+
+        ranked, failed = [], []
+        for username, (stats, activity) in results.items():
+            if isinstance(stats, StatsError):
+                failed.append((username, str(stats)))
+                continue
+
+            row = [username, *(str(stats.accepted.get(diff, 0)) for diff in DIFFICULTIES)]
+            row.append(str(sum(stats.accepted.get(diff, 0) for diff in DIFFICULTIES)))
+            if show_activity:
+                if isinstance(activity, UserActivityModel):
+                    counts = activity.daily_activity.values()
+                    row += [str(sum(counts)), str(sum(1 for c in counts if c > 0))]
+                else:
+                    row += ["-", "-"]
+            ranked.append(row)
+
+        ranked.sort(key=lambda row: int(row[len(DIFFICULTIES) + 1]), reverse=True)
+        rows = [[str(rank), *row] for rank, row in enumerate(ranked, start=1)]
+
+        widths = [len(h) for h in headers]
+        for row in rows:
+            widths = [max(w, len(cell)) for w, cell in zip(widths, row, strict=True)]
+        for username, _ in failed:
+            widths[1] = max(widths[1], len(username))
+
+        heading_ansi, _ = self.theme_manager.get_styling("text", "heading")
+        header_styles = [heading_ansi] * len(headers)
+        for i, diff in enumerate(DIFFICULTIES, start=2):
+            header_styles[i], _ = self.theme_manager.get_styling("difficulty", diff.lower())
+        lines = [self._format_table_row(headers, widths, header_styles)]
+        lines += [self._format_table_row(row, widths) for row in rows]
+
+        for username, error in failed:
+            prefix = self._format_table_row(["-", username], widths[:2])
+            lines.append(f"{prefix}  Failed to fetch stats: {error}")
+
+        return "\n".join(lines)
+
     #
     # ──────────────────────────────────────────────────────
     #   PRIVATE METHODS
     # ──────────────────────────────────────────────────────
     #
 
+    def _format_table_row(self, cells: list[str], widths: list[int], styles: list[str] | None = None) -> str:
+        """
+        Pads each cell to its column width (the user column left-aligned, numbers right-aligned)
+        before applying styles, so ANSI codes don't break the alignment.
+        """
+        parts = []
+        for i, (cell, width) in enumerate(zip(cells, widths, strict=False)):
+            padded = cell.ljust(width) if i == 1 else cell.rjust(width)
+            style = styles[i] if styles and i < len(styles) else ""
+            parts.append(f"{style}{padded}{self.ANSI_RESET}" if style else padded)
+        return "  ".join(parts)
+
     def _build_color_gradient(self, ansi_min, ansi_max) -> list[str]:
         min_rgb = self._extract_rgb(ansi_min)
         max_rgb = self._extract_rgb(ansi_max)
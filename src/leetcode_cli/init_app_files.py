@@ -3,8 +3,7 @@ import logging
 import os
 from typing import Any
 
-import yaml
-
+from leetcode_cli import __version__
 from leetcode_cli.constants.default_config import DEFAULT_CONFIG_VALUES
 from leetcode_cli.constants.default_formatting_config import (
     DEFAULT_FORMATTING_CONFIG_YAML,
@@ -14,11 +13,22 @@ from leetcode_cli.managers.theme_manager import ThemeManager
 
 logger = logging.getLogger(__name__)
 
+# Records the state of ~/.leetcode after the last full initialization.
+INIT_STAMP_FILENAME = ".init_stamp.json"
+
+# Bump when initialization starts creating or validating something new, so existing installs re-run it.
+INIT_STAMP_FORMAT = 1
+
 
-def initialize_leetcode_cli():
+def initialize_leetcode_cli() -> ConfigManager:
     """
     Main entry point to ensure all necessary files and folders exist in ~/.leetcode/.
     This function is idempotent—safe to call multiple times without harm.
+
+    The full validation only runs when the package version or one of the files it checks
+    changed since the last run (see INIT_STAMP_FILENAME); otherwise it is skipped.
+
+    Returns the ConfigManager used for initialization.
     """
     try:
         # Instantiate the config_manager
@@ -26,6 +36,11 @@ def initialize_leetcode_cli():
         # Grab the paths
         config_dir = config_manager.config_dir
         config_path = config_manager.config_path
+        stamp_path = os.path.join(config_dir, INIT_STAMP_FILENAME)
+
+        if _read_init_stamp(stamp_path) == _current_init_stamp(config_dir):
+            logger.debug("Initialization stamp is up to date; skipping validation.")
+            return config_manager
 
         _ensure_config_directory(config_dir)
         _ensure_config_file_exists(config_path)
@@ -43,6 +58,10 @@ def initialize_leetcode_cli():
         for theme_name in available_themes:
             _ensure_theme_folder(theme_name, theme_manager)
 
+        _write_init_stamp(stamp_path, _current_init_stamp(config_dir))
+
+        return config_manager
+
     except Exception as e:
         logger.error(f"Failed to initialize LeetCode CLI: {e}", exc_info=True)
         raise
@@ -119,6 +138,8 @@ def _ensure_formatting_config_file_exists(config_dir: str):
         return
 
     # If it already exists, verify it's valid YAML
+    import yaml
+
     try:
         with open(formatting_path, encoding="utf-8") as f:
             data = yaml.safe_load(f)
@@ -148,6 +169,8 @@ def _ensure_minimum_formatting_config_fields(config_dir: str):
     """
     formatting_path = os.path.join(config_dir, "formatting_config.yaml")
 
+    import yaml
+
     try:
         with open(formatting_path, encoding="utf-8") as f:
             user_data = yaml.safe_load(f) or {}
@@ -284,3 +307,60 @@ def _extract_yaml_from_py(file_path: str, variable_name: str) -> str:
         logger.error(f"Error extracting '{variable_name}' from '{file_path}': {e}")
 
         return ""
+
+
+def _current_init_stamp(config_dir: str) -> dict[str, Any]:
+    """
+    Builds the stamp describing the current state: the package version and the mtimes of
+    everything initialization creates or validates.
+    """
+    watched = {
+        "config": os.path.join(config_dir, "config.json"),
+        "formatting_config": os.path.join(config_dir, "formatting_config.yaml"),
+        "themes": os.path.join(config_dir, "themes"),
+    }
+
+    # Theme folders too, since deleting a theme file does not touch the themes directory itself.
+    try:
+        with os.scandir(watched["themes"]) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    watched[f"themes/{entry.name}"] = entry.path
+
+    except OSError:
+        pass
+
+    mtimes = {}
+    for name, path in watched.items():
+        try:
+            mtimes[name] = os.stat(path).st_mtime_ns
+        except OSError:
+            mtimes[name] = None
+
+    return {"format": INIT_STAMP_FORMAT, "version": __version__, "mtimes": mtimes}
+
+
+def _read_init_stamp(stamp_path: str) -> dict[str, Any] | None:
+    """
+    Returns the stored stamp, or None if it is missing or unreadable.
+    """
+    try:
+        with open(stamp_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    except (OSError, ValueError):
+        return None
+
+
+def _write_init_stamp(stamp_path: str, stamp: dict[str, Any]):
+    """
+    Stores the stamp. Failing to write it only means the next run validates again.
+    """
+    try:
+        with open(stamp_path, "w", encoding="utf-8") as f:
+            json.dump(stamp, f)
+
+        logger.debug(f"Wrote initialization stamp to '{stamp_path}'.")
+
+    except OSError as e:
+        logger.warning(f"Failed to write initialization stamp '{stamp_path}': {e}")
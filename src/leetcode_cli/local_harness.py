@@ -0,0 +1,237 @@
+"""
+Runs one testcase of a Python `Solution` in a separate interpreter, for `leetcode test --local`.
+
+Started by LocalRunner as `python -I local_harness.py` with a JSON job on stdin:
+    {"code", "method", "param_types", "return_type", "args", "limits": {"cpu", "memory", "file_size"}}
+and answers with one JSON line on stdout:
+    {"ok": true, "answer": <JSON value>, "stdout": str, "elapsed_ms": float}
+    {"ok": false, "kind": "runtime_error" | "memory_limit", "error": str, "traceback": str, "stdout": str}
+
+It only uses the standard library and must stay importable on its own: the package is not on
+sys.path of the isolated interpreter.
+"""
+
+import io
+import json
+import sys
+import time
+import traceback
+from contextlib import redirect_stdout, suppress
+
+SOLUTION_FILENAME = "solution.py"
+
+# Seconds between the soft and the hard CPU limit.
+CPU_HARD_LIMIT_GRACE = 1
+
+# ListNode / TreeNode as defined by the prelude, the classes the solution code sees.
+_NODE_CLASSES: dict[str, type] = {}
+
+# What LeetCode's Python environment imports for every solution.
+PRELUDE = """
+from typing import *
+import bisect, collections, functools, heapq, itertools, math, operator, random, re, string
+from collections import *
+from functools import *
+from heapq import *
+from itertools import *
+from math import *
+from bisect import *
+
+
+class ListNode:
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
+
+
+class TreeNode:
+    def __init__(self, val=0, left=None, right=None):
+        self.val = val
+        self.left = left
+        self.right = right
+"""
+
+
+def main() -> None:
+    job = json.loads(sys.stdin.read())
+    _apply_limits(job.get("limits", {}))
+
+    namespace: dict = {"__name__": "solution"}
+    exec(compile(PRELUDE, "<prelude>", "exec"), namespace)
+    _NODE_CLASSES.update(ListNode=namespace["ListNode"], TreeNode=namespace["TreeNode"])
+
+    captured = io.StringIO()
+    try:
+        with redirect_stdout(captured):
+            exec(compile(job["code"], SOLUTION_FILENAME, "exec"), namespace)
+            args = [_to_python(arg, type_) for arg, type_ in zip(job["args"], job["param_types"], strict=False)]
+            method = getattr(namespace["Solution"](), job["method"])
+
+            start = time.perf_counter()
+            result = method(*args)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+        # In-place problems ("do not return anything") are judged on their first argument.
+        if job.get("return_type") == "None" and args:
+            answer = _to_json(args[0], job["param_types"][0])
+        else:
+            answer = _to_json(result, job.get("return_type") or "")
+
+        _reply({"ok": True, "answer": answer, "stdout": captured.getvalue(), "elapsed_ms": elapsed_ms})
+
+    except MemoryError:
+        _reply({"ok": False, "kind": "memory_limit", "error": "MemoryError", "traceback": "", "stdout": ""})
+
+    except BaseException as e:
+        _reply(
+            {
+                "ok": False,
+                "kind": "runtime_error",
+                "error": f"{type(e).__name__}: {e}",
+                "traceback": _solution_traceback(e),
+                "stdout": captured.getvalue(),
+            }
+        )
+
+
+def _apply_limits(limits: dict) -> None:
+    """
+    Caps CPU time, address space and written file size, where the platform supports it.
+
+    The CPU hard limit is one second above the soft one, so the soft limit delivers SIGXCPU
+    (reported as a time limit) instead of the kernel killing the process outright.
+    """
+    try:
+        import resource
+
+    except ImportError:
+        return
+
+    for name, key in (("RLIMIT_CPU", "cpu"), ("RLIMIT_AS", "memory"), ("RLIMIT_FSIZE", "file_size")):
+        value = limits.get(key)
+        limit = getattr(resource, name, None)
+        if value is None or limit is None:
+            continue
+
+        with suppress(ValueError, OSError):
+            hard = int(value) + CPU_HARD_LIMIT_GRACE if key == "cpu" else int(value)
+            resource.setrlimit(limit, (int(value), hard))
+
+
+def _to_python(value, type_: str):
+    """
+    Converts a JSON testcase argument to what the annotated parameter expects
+    (linked lists and binary trees are given in LeetCode's list form).
+    """
+    type_ = _unwrap_optional(type_)
+
+    if type_.startswith("List[") and isinstance(value, list):
+        inner = type_[len("List[") : -1]
+        if "ListNode" in inner or "TreeNode" in inner:
+            return [_to_python(item, inner) for item in value]
+        return value
+
+    if type_ == "ListNode":
+        return _build_list(value)
+
+    if type_ == "TreeNode":
+        return _build_tree(value)
+
+    return value
+
+
+def _to_json(value, type_: str):
+    """
+    Converts a return value back to LeetCode's JSON form.
+    """
+    if isinstance(value, list | tuple):
+        return [_to_json(item, "") for item in value]
+
+    if isinstance(value, _NODE_CLASSES["ListNode"]):
+        items = []
+        while value is not None:
+            items.append(value.val)
+            value = value.next
+        return items
+
+    if isinstance(value, _NODE_CLASSES["TreeNode"]):
+        return _serialize_tree(value)
+
+    if value is None and _unwrap_optional(type_) in ("ListNode", "TreeNode"):
+        return []
+
+    return value
+
+
+def _unwrap_optional(type_: str) -> str:
+    type_ = type_.replace(" ", "")
+    while type_.startswith("Optional[") and type_.endswith("]"):
+        type_ = type_[len("Optional[") : -1]
+    return type_
+
+
+def _build_list(values):
+    if values is None:
+        return None
+
+    list_node = _NODE_CLASSES["ListNode"]
+    head = None
+    for val in reversed(values):
+        head = list_node(val, head)
+    return head
+
+
+def _build_tree(values):
+    if not values or values[0] is None:
+        return None
+
+    tree_node = _NODE_CLASSES["TreeNode"]
+    nodes = iter(values)
+    root = tree_node(next(nodes))
+    queue = [root]
+
+    for parent in queue:
+        for side in ("left", "right"):
+            try:
+                val = next(nodes)
+            except StopIteration:
+                return root
+
+            if val is not None:
+                child = tree_node(val)
+                setattr(parent, side, child)
+                queue.append(child)
+
+    return root
+
+
+def _serialize_tree(root) -> list:
+    items, queue = [], [root]
+    for node in queue:
+        if node is None:
+            items.append(None)
+            continue
+        items.append(node.val)
+        queue.extend((node.left, node.right))
+
+    while items and items[-1] is None:
+        items.pop()
+    return items
+
+
+def _solution_traceback(error: BaseException) -> str:
+    """
+    The traceback of an error, limited to frames in the solution code.
+    """
+    frames = [frame for frame in traceback.extract_tb(error.__traceback__) if frame.filename == SOLUTION_FILENAME]
+    lines = traceback.format_list(frames) + traceback.format_exception_only(type(error), error)
+    return "".join(lines).rstrip()
+
+
+def _reply(message: dict) -> None:
+    sys.__stdout__.write(json.dumps(message, default=repr))
+    sys.__stdout__.flush()
+
+
+if __name__ == "__main__":
+    main()
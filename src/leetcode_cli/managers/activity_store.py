@@ -0,0 +1,99 @@
+import contextlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from datetime import UTC, datetime
+
+logger = logging.getLogger(__name__)
+
+# Submissions near midnight on Dec 31 can land in the calendar a little later depending on the
+# user's timezone, so a year is only treated as final once it was fetched this long after it ended.
+YEAR_SETTLE_SECONDS = 2 * 24 * 60 * 60
+
+
+class ActivityStore:
+    """
+    Per-user store of daily submission counts, one JSON file per user under `store_dir`.
+
+    Each year is kept as {timestamp: count} together with the time it was fetched. A year
+    fetched after it was over (plus YEAR_SETTLE_SECONDS) never changes again, so it can be
+    served from disk; only the current year has to be refetched.
+    """
+
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+
+    #
+    # ──────────────────────────────────────────────────────
+    #   PUBLIC METHODS
+    # ──────────────────────────────────────────────────────
+    #
+
+    def get_final_year(self, username: str, year: int) -> dict[int, int] | None:
+        """
+        Returns the stored daily counts of `year` if they are final, else None.
+        """
+        entry = self._load(username).get(str(year))
+        if not entry or not self._is_final(year, entry.get("fetched_at", 0)):
+            return None
+
+        logger.debug(f"Serving {year} activity of '{username}' from the local store.")
+        return {int(ts): count for ts, count in entry.get("days", {}).items()}
+
+    def save_year(self, username: str, year: int, daily_activity: dict[int, int]) -> None:
+        """
+        Stores the daily counts of `year`. Failures are logged and otherwise ignored.
+        """
+        years = self._load(username)
+        years[str(year)] = {
+            "fetched_at": time.time(),
+            "days": {str(ts): count for ts, count in daily_activity.items()},
+        }
+
+        path = self._user_path(username)
+        try:
+            os.makedirs(self.store_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.store_dir, suffix=".tmp")
+
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"years": years}, f, separators=(",", ":"))
+                os.replace(tmp_path, path)
+
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
+                raise
+
+        except OSError as e:
+            logger.warning(f"Failed to save activity of '{username}': {e}")
+
+    #
+    # ──────────────────────────────────────────────────────
+    #   PRIVATE HELPERS
+    # ──────────────────────────────────────────────────────
+    #
+
+    def _user_path(self, username: str) -> str:
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", username.lower())
+        return os.path.join(self.store_dir, f"{safe_name}.json")
+
+    def _load(self, username: str) -> dict:
+        try:
+            with open(self._user_path(username), encoding="utf-8") as f:
+                return json.load(f).get("years", {})
+
+        except FileNotFoundError:
+            return {}
+
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable activity store of '{username}': {e}")
+            return {}
+
+    @staticmethod
+    def _is_final(year: int, fetched_at: float) -> bool:
+        year_end = datetime(year + 1, 1, 1, tzinfo=UTC).timestamp()
+        return fetched_at >= year_end + YEAR_SETTLE_SECONDS
@@ -1,3 +1,4 @@
+import glob
 import logging
 import os
 
@@ -57,6 +58,36 @@ class CodeManager:
             logger.error(f"Failed to read file '{file_path}': {e}")
             raise CodeError(f"Failed to read file '{file_path}': {e}") from e
 
+    def expand_solution_paths(self, paths: tuple[str, ...] | list[str]) -> list[str]:
+        """
+        Resolves files, directories (their solution files, non-recursive) and glob patterns
+        (e.g. "*.py") into a list of unique file paths, keeping the order given.
+
+        Raises:
+            CodeError: If a path does not exist or nothing matches.
+        """
+        solution_paths = []
+
+        for path in paths:
+            if os.path.isdir(path):
+                solution_paths.extend(
+                    os.path.join(path, name)
+                    for name in sorted(os.listdir(path))
+                    if len(name.split(".")) == 3 and os.path.isfile(os.path.join(path, name))
+                )
+            elif os.path.exists(path):
+                solution_paths.append(path)
+            elif glob.has_magic(path):
+                solution_paths.extend(sorted(p for p in glob.glob(path) if os.path.isfile(p)))
+            else:
+                logger.error(f"Path '{path}' does not exist.")
+                raise CodeError(f"Path '{path}' does not exist.")
+
+        if not solution_paths:
+            raise CodeError("No solution files found.")
+
+        return list(dict.fromkeys(solution_paths))
+
     def determine_language_from_extension(self, file_extension: str) -> str:
         """
         Determines the programming language based on the file extension.
@@ -122,9 +153,42 @@ class CodeManager:
         # Else, fallback to the default from config
         return self.get_default_lang_and_ext()
 
+    def get_code_snippet(self, title_slug: str, lang_slug: str) -> str:
+        """
+        Fetches the starting code of a problem in the given language.
+
+        Args:
+            title_slug (str): The title slug of the problem.
+            lang_slug (str): The language slug.
+
+        Returns:
+            str: The code snippet, or a comment saying there is none for that language.
+
+        Raises:
+            CodeError: If fetching the code snippet fails.
+        """
+        try:
+            code_data = fetch_code_snippet(title_slug, lang_slug)
+
+        except Exception as e:
+            logger.error(f"Failed to fetch code snippet: {e}")
+            raise CodeError(f"Failed to fetch code snippet: {e}") from e
+
+        snippet_list = code_data.get("data", {}).get("question", {}).get("codeSnippets", [])
+        for sn in snippet_list:
+            if sn.get("langSlug") == lang_slug and sn.get("code"):
+                return sn["code"]
+
+        return f"# That problem does not have a code snippet for {lang_slug} and is probably not submittable in that language.\n\n"
+
     def create_solution_file_with_snippet(
-        self, frontend_id: str, title_slug: str, lang_slug: str, file_extension: str
-    ) -> None:
+        self,
+        frontend_id: str,
+        title_slug: str,
+        lang_slug: str,
+        file_extension: str,
+        code_snippet: str | None = None,
+    ) -> str:
         """
         Fetches the code snippet and creates the solution file.
 
@@ -133,25 +197,22 @@ class CodeManager:
             title_slug (str): The title slug of the problem.
             lang_slug (str): The language slug.
             file_extension (str): The file extension.
+            code_snippet (str | None): The snippet, if the caller already fetched it with get_code_snippet.
+
+        Returns:
+            str: The name of the created file.
 
         Raises:
             CodeError: If fetching the code snippet or creating the file fails.
         """
-        try:
-            code_data = fetch_code_snippet(title_slug, lang_slug)
-            snippet_list = code_data.get("data", {}).get("question", {}).get("codeSnippets", [])
-            code_str = ""
-            for sn in snippet_list:
-                if sn.get("langSlug") == lang_slug:
-                    code_str = sn.get("code", "")
-                    break
-
-            if not code_str:
-                code_str = f"# That problem does not have a code snippet for {lang_slug} and is probably not submittable in that language.\n\n"
+        if code_snippet is None:
+            code_snippet = self.get_code_snippet(title_slug, lang_slug)
 
-            self._create_solution_file(frontend_id, title_slug, file_extension, code_str)
+        try:
+            self._create_solution_file(frontend_id, title_slug, file_extension, code_snippet)
             file_name = f"{frontend_id}.{title_slug}.{file_extension}"
             logger.debug(f"Solution file '{file_name}' has been created successfully.")
+            return file_name
 
         except Exception as e:
             logger.error(f"Failed to create solution file with snippet: {e}")
@@ -1,8 +1,6 @@
 import logging
 import os
 
-import yaml
-
 from leetcode_cli.exceptions.exceptions import ConfigError
 from leetcode_cli.managers.config_manager import ConfigManager
 from leetcode_cli.models.formatting_config import FormattingConfig
@@ -39,6 +37,8 @@ class FormattingConfigManager:
             logger.error(f"Formatting configuration file '{self.formatting_config_path}' not found.")
             raise ConfigError(f"Formatting configuration file '{self.formatting_config_path}' not found.")
 
+        import yaml
+
         try:
             with open(self.formatting_config_path, encoding="utf-8") as f:
                 data = yaml.safe_load(f)
@@ -0,0 +1,399 @@
+import ast
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+from collections.abc import Iterator
+from concurrent.futures import as_completed
+from dataclasses import dataclass
+
+from leetcode_cli.concurrency import get_executor, run_concurrently
+from leetcode_cli.exceptions.exceptions import CodeError, FetchingError, ParsingError
+from leetcode_cli.managers.problem_manager import ProblemManager
+from leetcode_cli.models.interpretation import InterpretationResult, InterpretationRun
+
+logger = logging.getLogger(__name__)
+
+# Languages that can be run locally, and the language reported for local runs. ".py" files
+# map to LeetCode's "python" (Python 2); they are run on Python 3 like ".py3" files.
+LOCAL_LANG_SLUGS = ("python3", "python")
+LOCAL_PRETTY_LANG = "Python3 (local)"
+
+# Limits of one testcase process.
+LOCAL_RUN_TIMEOUT = 5.0  # seconds of wall-clock time
+LOCAL_RUN_MEMORY = 1024 * 1024 * 1024  # bytes of address space
+LOCAL_RUN_FILE_SIZE = 1024 * 1024  # bytes a solution may write to a file
+
+# Float answers within this distance of the expected value count as correct, like on LeetCode.
+FLOAT_TOLERANCE = 1e-5
+
+HARNESS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "local_harness.py")
+
+# Status codes and messages of LeetCode's interpretation results.
+STATUS_ACCEPTED = (10, "Accepted")
+STATUS_MEMORY_LIMIT = (12, "Memory Limit Exceeded")
+STATUS_TIME_LIMIT = (14, "Time Limit Exceeded")
+STATUS_RUNTIME_ERROR = (15, "Runtime Error")
+STATUS_COMPILE_ERROR = (20, "Compile Error")
+
+
+@dataclass
+class LocalProblemSpec:
+    """
+    What running a problem locally needs: the method to call, its parameter and return
+    annotations, the example testcases (raw and decoded) and the expected outputs.
+    """
+
+    method: str
+    param_types: list[str]
+    return_type: str
+    testcases: str
+    cases: list[list]
+    expected_outputs: list[str]
+
+
+class LocalRunner:
+    """
+    Runs Python solutions against the example testcases on this machine, without LeetCode.
+
+    The method signature comes from the problem's Python 3 code snippet, the testcases from
+    `exampleTestcases` and the expected outputs from the examples in the description (as
+    extracted by parse_problem_data); all three are fetched once and cached. Every testcase
+    runs in its own isolated interpreter (`python -I`, a scratch working directory, a minimal
+    environment, CPU/memory/file-size limits and a timeout), on the shared worker pool.
+
+    The limits protect the machine from runaway solutions; they are not a security sandbox
+    for untrusted code. Answers are compared exactly (floats within FLOAT_TOLERANCE), so
+    problems that accept answers in any order can report a wrong answer locally.
+    """
+
+    def __init__(self, problem_manager: ProblemManager):
+        self.problem_manager = problem_manager
+        self._specs: dict[str, LocalProblemSpec] = {}
+        self._specs_lock = threading.Lock()
+
+    #
+    # ──────────────────────────────────────────────────────
+    #   PUBLIC METHODS
+    # ──────────────────────────────────────────────────────
+    #
+
+    @staticmethod
+    def supports(lang_slug: str) -> bool:
+        return lang_slug in LOCAL_LANG_SLUGS
+
+    def run(self, title_slug: str, code: str, lang_slug: str) -> tuple[InterpretationResult, str]:
+        """
+        Runs one solution locally and returns (InterpretationResult, example testcases).
+
+        Raises:
+            CodeError: If the language or the problem cannot be run locally.
+            FetchingError: If the problem data cannot be fetched.
+        """
+        run = next(self.run_many([InterpretationRun("", title_slug, code, lang_slug)]))
+        if run.error is not None:
+            raise run.error
+        return run.result, run.testcases
+
+    def run_many(self, runs: list[InterpretationRun]) -> Iterator[InterpretationRun]:
+        """
+        Runs many solutions locally, yielding each run as soon as all its testcases finished.
+        The testcases of all runs share the worker pool.
+        """
+        pending: dict = {}
+        futures = {}
+
+        specs = run_concurrently(*(lambda run=run: self._try_get_spec(run) for run in runs))
+        for index, (run, spec) in enumerate(zip(runs, specs, strict=True)):
+            if spec is None:
+                yield run
+                continue
+
+            run.testcases = spec.testcases
+            try:
+                compile(run.code, "solution.py", "exec")
+
+            except SyntaxError as e:
+                run.result = _compile_error_result(e)
+                yield run
+                continue
+
+            pending[index] = (run, spec, [None] * len(spec.cases))
+            for case_index, args in enumerate(spec.cases):
+                future = get_executor().submit(self._run_case, spec, run.code, args)
+                futures[future] = (index, case_index)
+
+        for future in as_completed(futures):
+            index, case_index = futures[future]
+            run, spec, outcomes = pending[index]
+            outcomes[case_index] = future.result()
+
+            if all(outcome is not None for outcome in outcomes):
+                run.result = _build_result(spec, outcomes)
+                del pending[index]
+                yield run
+
+    #
+    # ──────────────────────────────────────────────────────
+    #   PRIVATE HELPERS
+    # ──────────────────────────────────────────────────────
+    #
+
+    def _try_get_spec(self, run: InterpretationRun) -> LocalProblemSpec | None:
+        """
+        The spec of a run's problem, or None after storing the error on the run.
+        """
+        try:
+            if not self.supports(run.lang_slug):
+                raise CodeError(f"Local runs support {', '.join(LOCAL_LANG_SLUGS)} only, not '{run.lang_slug}'.")
+            return self._get_spec(run.title_slug)
+
+        except (CodeError, FetchingError, ParsingError) as e:
+            run.error = e
+            return None
+
+    def _get_spec(self, title_slug: str) -> LocalProblemSpec:
+        with self._specs_lock:
+            spec = self._specs.get(title_slug)
+        if spec is not None:
+            return spec
+
+        from leetcode_cli.parsers.problem_data_parser import parse_problem_data
+
+        question = self.problem_manager.get_question_fields(title_slug, ["codeSnippets", "content", "exampleTestcases"])
+
+        snippet = next(
+            (s.get("code", "") for s in question.get("codeSnippets") or [] if s.get("langSlug") == "python3"), None
+        )
+        if not snippet:
+            raise CodeError(f"'{title_slug}' has no Python 3 code snippet, so it cannot be run locally.")
+
+        method, param_types, return_type = _parse_signature(snippet, title_slug)
+
+        testcases = question.get("exampleTestcases") or ""
+        lines = testcases.split("\n") if testcases else []
+        if not param_types or len(lines) % len(param_types):
+            raise CodeError(f"Cannot split the example testcases of '{title_slug}' into {len(param_types)} arguments.")
+
+        try:
+            cases = [
+                [json.loads(line) for line in lines[i : i + len(param_types)]]
+                for i in range(0, len(lines), len(param_types))
+            ]
+        except ValueError as e:
+            raise CodeError(f"Cannot decode the example testcases of '{title_slug}': {e}") from e
+
+        examples = parse_problem_data({"data": {"question": question}}).examples
+        expected_outputs = [_canonical(example.get("output", "")) for example in examples]
+        if len(expected_outputs) < len(cases) or not all(expected_outputs[: len(cases)]):
+            raise CodeError(
+                f"'{title_slug}' lists no expected output for some example testcases, so it cannot be judged locally."
+            )
+
+        spec = LocalProblemSpec(method, param_types, return_type, testcases, cases, expected_outputs)
+        with self._specs_lock:
+            self._specs[title_slug] = spec
+        return spec
+
+    def _run_case(self, spec: LocalProblemSpec, code: str, args: list) -> dict:
+        """
+        Runs one testcase in a fresh isolated interpreter and returns the harness reply.
+        """
+        job = {
+            "code": code,
+            "method": spec.method,
+            "param_types": spec.param_types,
+            "return_type": spec.return_type,
+            "args": args,
+            "limits": {
+                "cpu": int(LOCAL_RUN_TIMEOUT) + 1,
+                "memory": LOCAL_RUN_MEMORY,
+                "file_size": LOCAL_RUN_FILE_SIZE,
+            },
+        }
+
+        with tempfile.TemporaryDirectory(prefix="leetcode-run-") as scratch_dir:
+            try:
+                proc = subprocess.run(
+                    [sys.executable, "-I", HARNESS_PATH],
+                    input=json.dumps(job),
+                    capture_output=True,
+                    text=True,
+                    timeout=LOCAL_RUN_TIMEOUT,
+                    cwd=scratch_dir,
+                    env=_sandbox_env(),
+                )
+
+            except subprocess.TimeoutExpired:
+                return {"ok": False, "kind": "time_limit", "error": "", "traceback": "", "stdout": ""}
+
+        try:
+            return json.loads(proc.stdout)
+
+        except ValueError:
+            # Killed by a resource limit (SIGXCPU at the soft CPU limit, SIGKILL at the hard one)
+            # or crashed before replying.
+            logger.debug(f"Local run exited with {proc.returncode}: {proc.stderr[-500:]}")
+            kind = "time_limit" if proc.returncode in (-24, -9, 152, 137) else "runtime_error"
+            error = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"Exit code {proc.returncode}"
+            return {"ok": False, "kind": kind, "error": error, "traceback": proc.stderr.strip(), "stdout": ""}
+
+
+def _parse_signature(snippet: str, title_slug: str) -> tuple[str, list[str], str]:
+    """
+    Finds the public method of `class Solution` in a code snippet and returns
+    (method name, parameter annotations, return annotation).
+    """
+    # Snippets end with an empty method body (at most a docstring); give the last method a
+    # statement so the snippet parses.
+    def_lines = [line for line in snippet.splitlines() if line.lstrip().startswith("def ")]
+    def_indent = len(def_lines[-1]) - len(def_lines[-1].lstrip()) if def_lines else 0
+    body_indent = " " * (def_indent + 4)
+
+    try:
+        tree = ast.parse(f"{snippet.rstrip()}\n{body_indent}pass\n")
+
+    except SyntaxError as e:
+        raise CodeError(f"Cannot parse the Python 3 snippet of '{title_slug}': {e}") from e
+
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == "Solution":
+            for item in node.body:
+                if isinstance(item, ast.FunctionDef) and not item.name.startswith("_"):
+                    params = item.args.args[1:]
+                    param_types = [ast.unparse(p.annotation) if p.annotation else "" for p in params]
+                    return_type = ast.unparse(item.returns) if item.returns else ""
+                    return item.name, param_types, return_type
+
+    raise CodeError(f"'{title_slug}' is not a 'class Solution' problem, so it cannot be run locally.")
+
+
+def _sandbox_env() -> dict[str, str]:
+    """
+    A minimal environment for testcase processes, so no user settings or secrets leak in.
+    """
+    env = {"PYTHONIOENCODING": "utf-8", "PYTHONHASHSEED": "0"}
+    if "SYSTEMROOT" in os.environ:  # Windows needs it to start Python at all
+        env["SYSTEMROOT"] = os.environ["SYSTEMROOT"]
+    return env
+
+
+def _canonical(text: str) -> str:
+    """
+    Normalises an answer shown on LeetCode (e.g. "[1, 2]") to compact JSON ("[1,2]").
+    """
+    try:
+        return _dumps(json.loads(text))
+    except (ValueError, TypeError):
+        return text.strip()
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=repr)
+
+
+def _answers_match(actual, expected) -> bool:
+    if isinstance(actual, bool) or isinstance(expected, bool):
+        return type(actual) is type(expected) and actual == expected
+
+    if isinstance(actual, int | float) and isinstance(expected, int | float):
+        return abs(actual - expected) <= FLOAT_TOLERANCE
+
+    if isinstance(actual, list) and isinstance(expected, list):
+        return len(actual) == len(expected) and all(_answers_match(a, e) for a, e in zip(actual, expected, strict=True))
+
+    return actual == expected
+
+
+def _build_result(spec: LocalProblemSpec, outcomes: list[dict]) -> InterpretationResult:
+    """
+    Turns the harness replies of all testcases into an InterpretationResult shaped like
+    LeetCode's. Like LeetCode, a failing testcase makes the whole run fail with its status.
+    """
+    code_answer, std_output_list, runtimes = [], [], []
+    total_correct = 0
+
+    for i, outcome in enumerate(outcomes):
+        std_output_list.append(outcome.get("stdout", ""))
+
+        if not outcome.get("ok"):
+            status = {"time_limit": STATUS_TIME_LIMIT, "memory_limit": STATUS_MEMORY_LIMIT}.get(
+                outcome.get("kind"), STATUS_RUNTIME_ERROR
+            )
+            return _interpretation_result(
+                status,
+                code_answer=code_answer,
+                std_output_list=std_output_list,
+                expected_code_answer=spec.expected_outputs,
+                runtime_error=outcome.get("error") or None,
+                full_runtime_error=outcome.get("traceback") or None,
+                correct_answer=False,
+                total_correct=total_correct,
+                total_testcases=len(outcomes),
+            )
+
+        answer = outcome.get("answer")
+        display = _dumps(answer)
+        # A testcase without an expected output is never counted as correct.
+        expected = spec.expected_outputs[i] if i < len(spec.expected_outputs) else ""
+
+        if expected:
+            try:
+                matches = _answers_match(answer, json.loads(expected))
+            except ValueError:
+                matches = display == expected
+
+            if matches:
+                # Show the expected form, so the formatter's string comparison agrees.
+                display = expected
+                total_correct += 1
+
+        code_answer.append(display)
+        runtimes.append(outcome.get("elapsed_ms", 0.0))
+
+    runtime = f"{max(runtimes, default=0.0):.0f} ms"
+    return _interpretation_result(
+        STATUS_ACCEPTED,
+        code_answer=code_answer,
+        std_output_list=std_output_list,
+        expected_code_answer=spec.expected_outputs,
+        correct_answer=total_correct == len(outcomes),
+        total_correct=total_correct,
+        total_testcases=len(outcomes),
+        status_runtime=runtime,
+        display_runtime=runtime,
+    )
+
+
+def _compile_error_result(error: SyntaxError) -> InterpretationResult:
+    message = f"{type(error).__name__}: {error.msg} (line {error.lineno})"
+    return _interpretation_result(
+        STATUS_COMPILE_ERROR,
+        compile_error=message,
+        full_compile_error=message,
+        correct_answer=False,
+    )
+
+
+def _interpretation_result(status: tuple[int, str], **fields) -> InterpretationResult:
+    status_code, status_msg = status
+    values = {
+        "status_code": status_code,
+        "status_msg": status_msg,
+        "lang": LOCAL_LANG_SLUGS[0],
+        "pretty_lang": LOCAL_PRETTY_LANG,
+        "run_success": status_code == STATUS_ACCEPTED[0],
+        "state": "SUCCESS",
+        "status_runtime": "",
+        "display_runtime": "",
+        "memory": 0,
+        "code_answer": [],
+        "code_output": [],
+        "std_output_list": [],
+        **fields,
+    }
+    optional = {name: None for name in InterpretationResult.__dataclass_fields__ if name not in values}
+    return InterpretationResult(**values, **optional)
@@ -0,0 +1,365 @@
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from leetcode_cli.exceptions.exceptions import ProblemSetError
+from leetcode_cli.models.problemset import ProblemSet, ProblemSummary
+
+logger = logging.getLogger(__name__)
+
+# How long a downloaded catalogue is trusted before `list` goes back to the network.
+CATALOGUE_MAX_AGE = 7 * 24 * 60 * 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    question_id   TEXT PRIMARY KEY,
+    frontend_id   TEXT NOT NULL,
+    title         TEXT NOT NULL,
+    title_slug    TEXT NOT NULL UNIQUE,
+    difficulty    TEXT NOT NULL COLLATE NOCASE,
+    ac_rate       REAL NOT NULL,
+    paid_only     INTEGER NOT NULL,
+    status        TEXT,
+    position      INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_questions_position ON questions (position);
+CREATE INDEX IF NOT EXISTS idx_questions_difficulty ON questions (difficulty, position);
+
+CREATE TABLE IF NOT EXISTS question_tags (
+    tag           TEXT NOT NULL,
+    question_id   TEXT NOT NULL,
+    PRIMARY KEY (tag, question_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_question_tags_question ON question_tags (question_id);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key           TEXT PRIMARY KEY,
+    value         TEXT NOT NULL
+);
+"""
+
+
+class ProblemCatalogue:
+    """
+    SQLite copy of the full problemset, populated by `download-problems`.
+
+    Stores every field of the `problemset_data` query (acRate, difficulty, tags, paidOnly,
+    status, ...) so `list` can answer difficulty/tag/page filters with indexed queries
+    instead of a GraphQL round trip.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+
+    #
+    # ──────────────────────────────────────────────────────
+    #   PUBLIC METHODS
+    # ──────────────────────────────────────────────────────
+    #
+
+    def replace_pages(self, pages: Iterable[tuple[int, list[dict[str, Any]]]]) -> int:
+        """
+        Replaces the whole catalogue with pages of raw `problemset_data` questions, given as
+        (position of the first question, questions) in any order, and returns how many
+        questions were stored.
+
+        Pages are written as they are consumed, so a download can stream into the catalogue.
+        Everything happens in one transaction: if consuming `pages` raises, the previous
+        catalogue is kept. The sync watermark is recorded with the new content.
+        """
+        count = 0
+        try:
+            with self.connection as conn:
+                conn.execute("DELETE FROM question_tags")
+                conn.execute("DELETE FROM questions")
+                for start_position, questions in pages:
+                    self._insert_questions(conn, questions, start_position)
+                    count += len(questions)
+                self._record_sync(conn)
+
+            logger.info(f"Problem catalogue saved to '{self.db_path}' ({count} questions).")
+            return count
+
+        except sqlite3.Error as e:
+            logger.error(f"Failed to write problem catalogue: {e}")
+            raise ProblemSetError(f"Failed to write problem catalogue: {e}") from e
+
+    def merge_pages(self, pages: Iterable[tuple[int, list[dict[str, Any]]]]) -> int:
+        """
+        Inserts or updates pages of raw `problemset_data` questions at their positions, keeping
+        every other question, and returns how many questions were written.
+
+        Like replace_pages, pages are written as they are consumed in one transaction that is
+        rolled back if consuming `pages` raises, and the sync watermark is recorded.
+        """
+        count = 0
+        try:
+            with self.connection as conn:
+                for start_position, questions in pages:
+                    positions = (start_position, start_position + len(questions))
+                    conn.execute(
+                        "DELETE FROM question_tags WHERE question_id IN "
+                        "(SELECT question_id FROM questions WHERE position >= ? AND position < ?)",
+                        positions,
+                    )
+                    conn.execute("DELETE FROM questions WHERE position >= ? AND position < ?", positions)
+                    self._insert_questions(conn, questions, start_position)
+                    count += len(questions)
+                self._record_sync(conn)
+
+            logger.info(f"Merged {count} questions into problem catalogue '{self.db_path}'.")
+            return count
+
+        except sqlite3.Error as e:
+            logger.error(f"Failed to write problem catalogue: {e}")
+            raise ProblemSetError(f"Failed to write problem catalogue: {e}") from e
+
+    def get_watermark(self) -> dict[str, Any] | None:
+        """
+        Returns what the last download or sync saw: {"total", "newest_frontend_id", "synced_at"},
+        or None if the catalogue was never synced (or is unreadable).
+        """
+        try:
+            watermark = self._get_meta("sync_watermark")
+            return json.loads(watermark) if watermark else None
+
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Ignoring unreadable problem catalogue watermark: {e}")
+            return None
+
+    def get_slug_at(self, position: int) -> str | None:
+        """
+        Returns the titleSlug of the question at a problemset position, or None.
+        """
+        try:
+            row = self.connection.execute("SELECT title_slug FROM questions WHERE position = ?", (position,)).fetchone()
+            return row[0] if row else None
+
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to query problem catalogue: {e}")
+            return None
+
+    def iter_questions(self) -> Iterator[dict[str, Any]]:
+        """
+        Yields every question as a raw `problemset_data` question dict, in problemset order,
+        reading the catalogue row by row.
+        """
+        try:
+            cursor = self.connection.execute(
+                """
+                SELECT q.question_id, q.frontend_id, q.title, q.title_slug, q.difficulty,
+                       q.ac_rate, q.paid_only, q.status,
+                       (SELECT group_concat(t.tag) FROM question_tags t WHERE t.question_id = q.question_id)
+                FROM questions q
+                ORDER BY q.position
+                """
+            )
+            for question_id, frontend_id, title, title_slug, difficulty, ac_rate, paid_only, status, tags in cursor:
+                yield {
+                    "acRate": ac_rate,
+                    "difficulty": difficulty,
+                    "questionId": question_id,
+                    "topicTags": [{"slug": tag} for tag in tags.split(",")] if tags else [],
+                    "frontendQuestionId": frontend_id,
+                    "paidOnly": bool(paid_only),
+                    "status": status,
+                    "title": title,
+                    "titleSlug": title_slug,
+                }
+
+        except sqlite3.Error as e:
+            logger.error(f"Failed to read problem catalogue: {e}")
+            raise ProblemSetError(f"Failed to read problem catalogue: {e}") from e
+
+    def is_fresh(self, max_age: float = CATALOGUE_MAX_AGE) -> bool:
+        """
+        True if the catalogue has been downloaded and is younger than `max_age` seconds.
+        """
+        try:
+            updated_at = self._get_meta("updated_at")
+
+        except sqlite3.Error as e:
+            logger.warning(f"Problem catalogue is unreadable: {e}")
+            return False
+
+        if updated_at is None:
+            return False
+
+        return time.time() - float(updated_at) < max_age
+
+    def query(
+        self,
+        tags: list[str] | tuple[str, ...] | None = None,
+        difficulty: str | None = None,
+        limit: int = 50,
+        page: int = 1,
+    ) -> ProblemSet:
+        """
+        Returns one page of questions matching the difficulty and all of the given tags,
+        in the same order as LeetCode's problemset listing.
+        """
+        where, params = self._build_filters(tags, difficulty)
+
+        try:
+            conn = self.connection
+            total = conn.execute(f"SELECT COUNT(*) FROM questions q {where}", params).fetchone()[0]
+            rows = conn.execute(
+                f"""
+                SELECT q.question_id, q.frontend_id, q.title, q.title_slug, q.difficulty,
+                       q.ac_rate, q.paid_only, q.status,
+                       (SELECT group_concat(t.tag) FROM question_tags t WHERE t.question_id = q.question_id)
+                FROM questions q {where}
+                ORDER BY q.position
+                LIMIT ? OFFSET ?
+                """,
+                [*params, limit, (page - 1) * limit],
+            ).fetchall()
+
+        except sqlite3.Error as e:
+            logger.error(f"Failed to query problem catalogue: {e}")
+            raise ProblemSetError(f"Failed to query problem catalogue: {e}") from e
+
+        questions = [
+            ProblemSummary(
+                ac_rate=ac_rate,
+                difficulty=difficulty_value,
+                question_id=question_id,
+                topic_tags=tag_list.split(",") if tag_list else [],
+                frontend_question_id=frontend_id,
+                paid_only=bool(paid_only),
+                status=status,
+                title=title,
+                title_slug=title_slug,
+            )
+            for (
+                question_id,
+                frontend_id,
+                title,
+                title_slug,
+                difficulty_value,
+                ac_rate,
+                paid_only,
+                status,
+                tag_list,
+            ) in rows
+        ]
+
+        logger.debug(f"Answered problemset query from local catalogue ({len(questions)} of {total}).")
+        return ProblemSet(total=total, questions=questions)
+
+    def record_submission(self, title_slug: str, accepted: bool) -> None:
+        """
+        Updates the cached status of a question after a submission: 'ac' if accepted,
+        otherwise 'notac' unless it was already solved.
+        """
+        try:
+            with self.connection as conn:
+                if accepted:
+                    conn.execute("UPDATE questions SET status = 'ac' WHERE title_slug = ?", (title_slug,))
+                else:
+                    conn.execute(
+                        "UPDATE questions SET status = 'notac' WHERE title_slug = ? AND status IS NOT 'ac'",
+                        (title_slug,),
+                    )
+
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to update status of '{title_slug}' in problem catalogue: {e}")
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.executescript(SCHEMA)
+
+        return self._conn
+
+    #
+    # ──────────────────────────────────────────────────────
+    #   PRIVATE HELPERS
+    # ──────────────────────────────────────────────────────
+    #
+
+    def _insert_questions(self, conn: sqlite3.Connection, questions: list[dict[str, Any]], start_position: int) -> None:
+        conn.executemany(
+            "DELETE FROM question_tags WHERE question_id = ?",
+            [(str(q["questionId"]),) for q in questions],
+        )
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO questions
+                (question_id, frontend_id, title, title_slug, difficulty, ac_rate, paid_only, status, position)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    str(q["questionId"]),
+                    str(q["frontendQuestionId"]),
+                    q.get("title", ""),
+                    q["titleSlug"],
+                    q.get("difficulty", ""),
+                    float(q.get("acRate") or 0.0),
+                    int(bool(q.get("paidOnly"))),
+                    q.get("status"),
+                    start_position + offset,
+                )
+                for offset, q in enumerate(questions)
+            ],
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO question_tags (tag, question_id) VALUES (?, ?)",
+            [
+                (tag["slug"].lower(), str(q["questionId"]))
+                for q in questions
+                for tag in q.get("topicTags") or []
+                if tag.get("slug")
+            ],
+        )
+
+    def _build_filters(self, tags, difficulty) -> tuple[str, list]:
+        clauses = []
+        params: list = []
+
+        if difficulty:
+            clauses.append("q.difficulty = ?")
+            params.append(difficulty)
+
+        unique_tags = sorted({t.lower() for t in tags or []})
+        if unique_tags:
+            placeholders = ", ".join("?" for _ in unique_tags)
+            clauses.append(
+                f"q.question_id IN (SELECT question_id FROM question_tags WHERE tag IN ({placeholders}) "
+                "GROUP BY question_id HAVING COUNT(*) = ?)"
+            )
+            params.extend(unique_tags)
+            params.append(len(unique_tags))
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def _record_sync(self, conn: sqlite3.Connection) -> None:
+        """
+        Stores the sync watermark (question count and newest frontend ID) and the update time.
+        """
+        total = conn.execute("SELECT COUNT(*) FROM questions").fetchone()[0]
+        newest = conn.execute("SELECT frontend_id FROM questions ORDER BY position DESC LIMIT 1").fetchone()
+        now = time.time()
+
+        watermark = {"total": total, "newest_frontend_id": newest[0] if newest else None, "synced_at": now}
+        self._set_meta(conn, "sync_watermark", json.dumps(watermark))
+        self._set_meta(conn, "updated_at", str(now))
+
+    def _get_meta(self, key: str) -> str | None:
+        row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, conn: sqlite3.Connection, key: str, value: str) -> None:
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
@@ -1,23 +1,42 @@
 import logging
+import os
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, as_completed, wait
 
+from leetcode_cli.constants.batch_constants import DEFAULT_SUBMISSIONS_PER_MINUTE, DEFAULT_TEST_PARALLELISM
 from leetcode_cli.data_fetchers.interpretation_result_fetcher import (
     fetch_interpretation_result,
+    start_interpretation,
 )
+from leetcode_cli.data_fetchers.problem_archive import ProblemArchive
 
 # Import fetchers + parsers needed
 from leetcode_cli.data_fetchers.problem_data_fetcher import (
+    fetch_archive_question,
     fetch_problem_data,
     fetch_problem_frontend_id,
     fetch_problem_id,
     fetch_problem_testcases,
+    fetch_question_fields,
     fetch_random_title_slug,
 )
-from leetcode_cli.data_fetchers.submission_result_fetcher import fetch_submission_result
-from leetcode_cli.exceptions.exceptions import FetchingError, ProblemError
+from leetcode_cli.data_fetchers.rate_limiter import TokenBucket
+from leetcode_cli.data_fetchers.result_poller import CheckPoller, poll_many
+from leetcode_cli.data_fetchers.submission_result_fetcher import (
+    build_submission_headers,
+    fetch_submission_result,
+    start_submission,
+)
+from leetcode_cli.exceptions.exceptions import FetchingError, ParsingError, ProblemError, ProblemSetError
 from leetcode_cli.managers.auth_service import AuthService
 from leetcode_cli.managers.config_manager import ConfigManager
 from leetcode_cli.managers.problemset_manager import ProblemSetManager
+from leetcode_cli.managers.submission_journal import ACCEPTED, FAILED, PENDING, REJECTED, SubmissionJournal
+from leetcode_cli.models.interpretation import InterpretationRun
 from leetcode_cli.models.problem import Problem
+from leetcode_cli.models.submission import SubmissionRun
 from leetcode_cli.parsers.interpretation_result_parser import (
     parse_interpretation_result,
 )
@@ -26,6 +45,12 @@ from leetcode_cli.parsers.submission_result_parser import parse_submission_resul
 
 logger = logging.getLogger(__name__)
 
+SUBMISSION_JOURNAL_FILENAME = "submit_journal.json"
+# Default number of problems `download-problems --full` fetches at once.
+DEFAULT_ARCHIVE_WORKERS = 4
+# Archived problems are written in transactions of this many, so an interruption loses little.
+ARCHIVE_COMMIT_EVERY = 50
+
 
 class ProblemManager:
     """
@@ -43,10 +68,15 @@ class ProblemManager:
         config_manager: ConfigManager,
         auth_service: AuthService,
         problemset_manager: ProblemSetManager,
+        problem_archive: ProblemArchive | None = None,
     ):
         self.config_manager = config_manager
         self.auth_service = auth_service
         self.problemset_manager = problemset_manager
+        self.submission_journal = SubmissionJournal(
+            os.path.join(config_manager.config_dir, SUBMISSION_JOURNAL_FILENAME)
+        )
+        self.problem_archive = problem_archive
 
     #
     # ──────────────────────────────────────────────────────
@@ -155,10 +185,52 @@ class ProblemManager:
 
         raise ProblemError(f"Title slug for frontend ID '{frontend_id}' not found in local metadata.")
 
-    def get_interpretation_result(self, title_slug: str, code: str, lang_slug: str, testcases: str):
+    def get_question_fields(self, title_slug: str, fields: list[str]) -> dict:
+        """
+        Return the requested `question` fields for a slug, fetched in one GraphQL round trip.
+        """
+        raw = fetch_question_fields(title_slug, fields)
+        question = (raw.get("data") or {}).get("question")
+
+        if not question:
+            raise FetchingError(f"Unable to find question data for slug: '{title_slug}'")
+
+        return question
+
+    def get_test_prerequisites(self, title_slug: str) -> tuple[str, int]:
+        """
+        Return (example_testcases, question_id) for a 'Run Code' action.
+        The question id comes from local metadata when available; otherwise it is
+        requested together with the testcases in a single query.
+        """
+        local_id = self._try_local_id_by_slug(title_slug)
+        fields = ["exampleTestcases"] if local_id else ["exampleTestcases", "questionId"]
+
+        question = self.get_question_fields(title_slug, fields)
+        question_id = local_id or question.get("questionId")
+
+        if not question_id:
+            raise FetchingError(f"Unable to find questionId for slug: '{title_slug}'")
+
+        return question.get("exampleTestcases", ""), int(question_id)
+
+    def get_interpretation_result(
+        self,
+        title_slug: str,
+        code: str,
+        lang_slug: str,
+        testcases: str,
+        question_id: int | None = None,
+        cancel: threading.Event | None = None,
+    ):
         """
         Return a fully parsed InterpretationResult for 'Run Code' action.
+        `question_id` is looked up when not given. Setting `cancel` abandons the wait for
+        the result with a PollCancelledError.
         """
+        if question_id is None:
+            question_id = self.get_problem_id(title_slug)
+
         raw = fetch_interpretation_result(
             cookie=self.auth_service.get_cookie(),
             csrf_token=self.auth_service.get_csrf_token(),
@@ -166,10 +238,55 @@ class ProblemManager:
             code=code,
             language=lang_slug,
             testcases=testcases,
-            question_id=self.get_problem_id(title_slug),
+            question_id=question_id,
+            cancel=cancel,
         )
         return parse_interpretation_result(raw)
 
+    def run_interpretations(
+        self, runs: list[InterpretationRun], parallel: int = DEFAULT_TEST_PARALLELISM
+    ) -> Iterator[InterpretationRun]:
+        """
+        Runs many solutions with their example testcases, `parallel` at a time, yielding each
+        run as soon as it has a result or an error.
+
+        Within a batch, testcases are fetched and the runs are started concurrently, then all
+        of them are polled in one shared loop, so a batch takes about as long as its slowest run.
+        """
+        from leetcode_cli.concurrency import get_executor
+
+        cookie = self.auth_service.get_cookie()
+        csrf_token = self.auth_service.get_csrf_token()
+
+        for batch_start in range(0, len(runs), parallel):
+            batch = dict(enumerate(runs[batch_start : batch_start + parallel], start=batch_start))
+
+            checks = {}
+            futures = {
+                get_executor().submit(self._start_interpretation_run, run, cookie, csrf_token): index
+                for index, run in batch.items()
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    checks[index] = future.result()
+
+                except (FetchingError, ProblemError) as e:
+                    batch[index].error = e
+                    yield batch[index]
+
+            for index, outcome, _ in poll_many(checks, label="interpretation"):
+                run = batch[index]
+                try:
+                    if isinstance(outcome, FetchingError):
+                        raise outcome
+                    run.result = parse_interpretation_result(outcome)
+
+                except (FetchingError, ParsingError) as e:
+                    run.error = e
+
+                yield run
+
     def get_submission_result(self, title_slug: str, code: str, lang_slug: str):
         """
         Return a fully parsed SubmissionResult for the final 'submit' action.
@@ -182,7 +299,155 @@ class ProblemManager:
             language=lang_slug,
             question_id=self.get_problem_id(title_slug),
         )
-        return parse_submission_result(raw)
+        result = parse_submission_result(raw)
+        self.problemset_manager.update_local_status(title_slug, accepted=result.status_msg == "Accepted")
+        return result
+
+    def run_submissions(
+        self, runs: list[SubmissionRun], per_minute: float = DEFAULT_SUBMISSIONS_PER_MINUTE, resume: bool = True
+    ) -> Iterator[SubmissionRun]:
+        """
+        Submits many solutions, at most `per_minute` per minute, yielding each run as soon as it
+        has a result or an error.
+
+        All outstanding submissions are polled in one CheckPoller while the next ones wait for
+        the rate limit. Progress is kept in the submission journal: with `resume`, unchanged
+        files already accepted are skipped (yielded with `skipped` set) and submissions left
+        pending by an interrupted run are polled instead of being sent again.
+        """
+        journal = self.submission_journal
+        if not resume:
+            journal.forget([run.file_path for run in runs])
+
+        cookie = self.auth_service.get_cookie()
+        csrf_token = self.auth_service.get_csrf_token()
+
+        limiter = TokenBucket(per_minute)
+        poller = CheckPoller(label="submission")
+        queue = deque()
+
+        for index, run in enumerate(runs):
+            entry = journal.get(run.file_path, run.code, run.lang_slug) or {}
+
+            if entry.get("state") == ACCEPTED:
+                run.skipped = True
+                yield run
+
+            elif entry.get("state") == PENDING and entry.get("check_url"):
+                logger.info(f"Resuming pending submission of '{run.file_path}'.")
+                headers = build_submission_headers(cookie, csrf_token, run.title_slug)
+                poller.add(index, entry["check_url"], headers)
+
+            else:
+                queue.append(index)
+
+        while queue or poller:
+            if queue and limiter.try_acquire():
+                index = queue.popleft()
+                run = runs[index]
+                try:
+                    check_url, headers = start_submission(
+                        cookie=cookie,
+                        csrf_token=csrf_token,
+                        title_slug=run.title_slug,
+                        code=run.code,
+                        language=run.lang_slug,
+                        question_id=self.get_problem_id(run.title_slug),
+                    )
+                    journal.record(run.file_path, run.code, run.lang_slug, PENDING, check_url=check_url)
+                    poller.add(index, check_url, headers)
+
+                except FetchingError as e:
+                    run.error = e
+                    journal.record(run.file_path, run.code, run.lang_slug, FAILED, error=str(e))
+                    yield run
+
+            for index, outcome, _ in poller.poll_due():
+                run = runs[index]
+                try:
+                    if isinstance(outcome, FetchingError):
+                        raise outcome
+                    run.result = parse_submission_result(outcome)
+
+                except (FetchingError, ParsingError) as e:
+                    run.error = e
+                    journal.record(run.file_path, run.code, run.lang_slug, FAILED, error=str(e))
+                    yield run
+                    continue
+
+                accepted = run.result.status_msg == "Accepted"
+                journal.record(
+                    run.file_path,
+                    run.code,
+                    run.lang_slug,
+                    ACCEPTED if accepted else REJECTED,
+                    status_msg=run.result.status_msg,
+                )
+                self.problemset_manager.update_local_status(run.title_slug, accepted=accepted)
+                yield run
+
+            poller.wait(until=limiter.next_available() if queue else None)
+
+    def get_unarchived_slugs(self, title_slugs: list[str]) -> list[str]:
+        """
+        Returns the slugs that are not in the problem archive yet, in their original order.
+        """
+        archived = self._require_archive().archived_slugs()
+        return [slug for slug in title_slugs if slug not in archived]
+
+    def archive_problems(
+        self, title_slugs: list[str], workers: int = DEFAULT_ARCHIVE_WORKERS
+    ) -> Iterator[tuple[str, FetchingError | None]]:
+        """
+        Fetches the full data of every problem into the problem archive, yielding
+        (title_slug, error) as each fetch finishes (error is None on success).
+
+        At most `workers` fetches are in flight at once on the shared pool. Fetched problems are
+        written every ARCHIVE_COMMIT_EVERY problems and when the generator is closed, so an
+        interrupted download keeps what it fetched and can resume with get_unarchived_slugs.
+        """
+        from leetcode_cli.concurrency import get_executor
+
+        archive = self._require_archive()
+        pending = iter(title_slugs)
+        in_flight: dict[Future, str] = {}
+        fetched: list[dict] = []
+
+        def submit_next() -> None:
+            title_slug = next(pending, None)
+            if title_slug is not None:
+                in_flight[get_executor().submit(self._fetch_archive_question, title_slug)] = title_slug
+
+        try:
+            for _ in range(workers):
+                submit_next()
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    title_slug = in_flight.pop(future)
+                    submit_next()
+
+                    try:
+                        fetched.append(future.result())
+                        error = None
+
+                    except FetchingError as e:
+                        logger.warning(f"Failed to archive '{title_slug}': {e}")
+                        error = e
+
+                    if len(fetched) >= ARCHIVE_COMMIT_EVERY:
+                        archive.put_many(fetched)
+                        fetched.clear()
+
+                    yield title_slug, error
+
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+            if fetched:
+                archive.put_many(fetched)
 
     def get_example_testcases(self, title_slug: str) -> str:
         """
@@ -202,8 +467,6 @@ class ProblemManager:
 
         Raises ProblemError if format is invalid.
         """
-        import os
-
         filename = os.path.basename(filepath)
         parts = filename.split(".")
 
@@ -219,6 +482,37 @@ class ProblemManager:
     # ──────────────────────────────────────────────────────
     #
 
+    def _start_interpretation_run(self, run: InterpretationRun, cookie: str, csrf_token: str) -> tuple[str, dict]:
+        """
+        Fetches the run's testcases and question id, then starts it. Returns the check URL
+        and headers to poll.
+        """
+        run.testcases, question_id = self.get_test_prerequisites(run.title_slug)
+        return start_interpretation(
+            cookie=cookie,
+            csrf_token=csrf_token,
+            title_slug=run.title_slug,
+            code=run.code,
+            language=run.lang_slug,
+            testcases=run.testcases,
+            question_id=question_id,
+        )
+
+    def _require_archive(self) -> ProblemArchive:
+        if self.problem_archive is None:
+            raise ProblemSetError("The problem archive is not configured.")
+
+        return self.problem_archive
+
+    def _fetch_archive_question(self, title_slug: str) -> dict:
+        raw = fetch_archive_question(title_slug)
+        question = (raw.get("data") or {}).get("question")
+
+        if not question:
+            raise FetchingError(f"Unable to find question data for slug: '{title_slug}'")
+
+        return question
+
     def _try_local_frontend_id_by_slug(self, title_slug: str) -> str:
         """
         Attempt to find front-end ID by searching local metadata.
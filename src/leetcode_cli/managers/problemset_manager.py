@@ -1,17 +1,27 @@
+import contextlib
+import itertools
 import json
 import logging
 import os
-import random
+import struct
+import tempfile
+import threading
 from typing import Any
 
-from leetcode_cli.data_fetchers.problemset_data_fetcher import fetch_problemset
 from leetcode_cli.exceptions.exceptions import ProblemSetError
 from leetcode_cli.managers.auth_service import AuthService
 from leetcode_cli.managers.config_manager import ConfigManager
+from leetcode_cli.managers.problem_catalogue import ProblemCatalogue
+from leetcode_cli.managers.problemset_snapshot import ProblemSetSnapshot, build_snapshot, write_snapshot
 from leetcode_cli.parsers.problemset_data_parser import parse_problemset_data
 
 logger = logging.getLogger(__name__)
 
+# Snapshots already mapped in this process, keyed by the metadata file path.
+_LOADED_SNAPSHOTS: dict[str, ProblemSetSnapshot] = {}
+# Guards loading and replacing snapshots; fetch pool threads look problems up concurrently.
+_SNAPSHOTS_LOCK = threading.RLock()
+
 
 class ProblemSetManager:
     """
@@ -22,6 +32,8 @@ class ProblemSetManager:
         self.config_manager = config_manager
         self.auth_service = auth_service
         self.problems_data_path = self.get_problems_data_path()
+        self.problems_snapshot_path = self.get_problems_snapshot_path()
+        self.catalogue = ProblemCatalogue(self.get_catalogue_path())
 
     #
     # ──────────────────────────────────────────────────────
@@ -29,11 +41,20 @@ class ProblemSetManager:
     # ──────────────────────────────────────────────────────
     #
 
-    def get_problemset(self, tags=None, difficulty=None, limit=50, page=1):
+    def get_problemset(self, tags=None, difficulty=None, limit=50, page=1, online=False):
         """
         High-level method to fetch problemset from the GraphQL API,
         parse it, and return the structured result.
+
+        Served from the local catalogue when `download-problems` has populated it recently,
+        unless `online` is set.
         """
+        if not online and self.catalogue.is_fresh():
+            return self.catalogue.query(tags=tags, difficulty=difficulty, limit=limit, page=page)
+
+        # Imported here so offline lookups never pay for loading requests.
+        from leetcode_cli.data_fetchers.problemset_data_fetcher import fetch_problemset
+
         try:
             raw = fetch_problemset(
                 cookie=self.auth_service.get_cookie(),
@@ -56,6 +77,78 @@ class ProblemSetManager:
             logger.error(e)
             raise e
 
+    def download_problemset(self) -> int:
+        """
+        Downloads the full problemset (including per-user status when authenticated) page by
+        page into the local catalogue, then rewrites problems_metadata.json from it.
+        Returns the number of questions.
+
+        Pages are fetched concurrently and written to the catalogue as they arrive, so memory
+        stays flat however large the problemset is. A page that keeps failing aborts the
+        download and leaves the previous catalogue and metadata in place.
+
+        Raises:
+            FetchingError: If a page cannot be fetched.
+            ProblemSetError: If the local files cannot be written.
+        """
+        from leetcode_cli.data_fetchers.problemset_data_fetcher import fetch_problemset_pages
+
+        pages = fetch_problemset_pages(
+            cookie=self.auth_service.get_cookie(),
+            csrf_token=self.auth_service.get_csrf_token(),
+        )
+        count = self.catalogue.replace_pages((skip, questions) for skip, _, questions in pages)
+        self._export_metadata(count)
+        return count
+
+    def sync_problemset(self) -> tuple[int, int]:
+        """
+        Brings the local catalogue up to date by fetching only the pages it is missing, and
+        returns (new questions, total questions).
+
+        The first request starts at the last question the catalogue has, so it returns the
+        current total and the newest questions while checking that the local copy still lines
+        up with the problemset (same slug at that position). If it does, only the pages after
+        it are fetched and merged in place, usually just that first request; otherwise, or if
+        the catalogue was never downloaded, the whole problemset is downloaded again. The
+        watermark of what was synced is recorded in the catalogue.
+
+        Raises:
+            FetchingError: If a page cannot be fetched.
+            ProblemSetError: If the local files cannot be written.
+        """
+        from leetcode_cli.data_fetchers.problemset_data_fetcher import fetch_problemset_pages
+
+        watermark = self.catalogue.get_watermark()
+        local_total = watermark["total"] if watermark else 0
+        last_slug = self.catalogue.get_slug_at(local_total - 1) if local_total else None
+
+        if not last_slug:
+            logger.info("No synced problem catalogue yet, downloading the whole problemset.")
+            total = self.download_problemset()
+            return total, total
+
+        pages = fetch_problemset_pages(
+            cookie=self.auth_service.get_cookie(),
+            csrf_token=self.auth_service.get_csrf_token(),
+            start=local_total - 1,
+        )
+        start, total, questions = next(pages)
+
+        if total < local_total or not questions or questions[0].get("titleSlug") != last_slug:
+            pages.close()
+            logger.info("The problemset changed order since the last sync, downloading it again.")
+            total = self.download_problemset()
+            return max(total - local_total, 0), total
+
+        first_page = [(start, questions)]
+        rest = ((skip, page_questions) for skip, _, page_questions in pages)
+        self.catalogue.merge_pages(itertools.chain(first_page, rest))
+        self._export_metadata(total)
+
+        logger.debug(f"Synced problemset: {total - local_total} new questions, {total} in total.")
+        return total - local_total, total
+
     def load_problemset_metadata(self) -> dict[str, Any]:
         """
         Loads the local JSON file that caches problem set data.
@@ -85,27 +178,38 @@ class ProblemSetManager:
             logger.warning(f"problems_metadata.json not found at '{self.problems_data_path}'.")
             return {}
 
-    def save_problemset_metadata(self, data: dict[str, Any]) -> None:
+    def update_local_status(self, title_slug: str, accepted: bool) -> None:
+        """
+        Records the outcome of a submission in the local catalogue so offline listings stay current.
         """
-        Saves the problem set metadata to the local JSON file.
+        self.catalogue.record_submission(title_slug, accepted)
 
-        Args:
-            data (Dict[str, Any]): The problem set data to save.
+    def get_snapshot(self) -> ProblemSetSnapshot:
+        """
+        Returns the columnar snapshot of the cached problem set, mapped at most once per process.
 
-        Raises:
-            ProblemSetError: If the file cannot be written.
+        problems_snapshot.bin is written with the metadata by `download-problems`; if it is
+        missing or does not match the current problems_metadata.json, it is rebuilt from the
+        JSON once and persisted again.
         """
-        try:
-            os.makedirs(os.path.dirname(self.problems_data_path), exist_ok=True)
+        snapshot = _LOADED_SNAPSHOTS.get(self.problems_data_path)
+        if snapshot is not None:
+            return snapshot
 
-            with open(self.problems_data_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
+        with _SNAPSHOTS_LOCK:
+            # Another thread may have loaded it while this one waited for the lock.
+            snapshot = _LOADED_SNAPSHOTS.get(self.problems_data_path)
+            if snapshot is not None:
+                return snapshot
 
-            logger.info(f"Problem set data saved to '{self.problems_data_path}'.")
+            signature = self._metadata_signature()
+            snapshot = self._open_snapshot(signature)
 
-        except OSError as e:
-            logger.error(f"Failed to save problems_metadata.json: {e}")
-            raise ProblemSetError("Failed to save problems_metadata.json.") from e
+            if snapshot is None:
+                snapshot = self._rebuild_snapshot(signature)
+
+            _LOADED_SNAPSHOTS[self.problems_data_path] = snapshot
+            return snapshot
 
     def get_problem_by_key_value(self, key: str, value: str) -> dict[str, Any]:
         """
@@ -121,13 +225,10 @@ class ProblemSetManager:
         Raises:
             ProblemSetError: If the problem cannot be found.
         """
-        problems_data = self.load_problemset_metadata()
-        questions = problems_data.get("data", {}).get("problemsetQuestionList", {}).get("questions", [])
-
-        for problem in questions:
-            if str(problem.get(key, "")).lower() == str(value).lower():
-                logger.debug(f"Found problem with {key}='{value}'.")
-                return problem
+        problem = self.get_snapshot().get(key, value)
+        if problem:
+            logger.debug(f"Found problem with {key}='{value}'.")
+            return problem
 
         logger.warning(f"Problem with {key}='{value}' not found in cached data.")
         return {}
@@ -137,26 +238,13 @@ class ProblemSetManager:
         Randomly select a local problem that matches the given difficulty and tag filters.
         Returns its 'titleSlug', or None if no match found.
         """
-        data = self.load_problemset_metadata()
-        questions = data.get("data", {}).get("problemsetQuestionList", {}).get("questions", [])
-
-        # Filter by difficulty & tags if provided
-        filtered = []
-        for q in questions:
-            if difficulty and q.get("difficulty", "").lower() != difficulty.lower():
-                continue
+        snapshot = self.get_snapshot()
+        index = snapshot.random_index(difficulty, tags)
 
-            if tags and not self._matches_tags(q, tags):
-                continue
-
-            filtered.append(q)
-
-        if not filtered:
+        if index is None:
             return None
 
-        # Randomly choose one from the filtered list
-        chosen = random.choice(filtered)
-        return chosen.get("titleSlug")
+        return snapshot.title_slug(index)
 
     def get_problems_data_path(self) -> str:
         """
@@ -165,17 +253,128 @@ class ProblemSetManager:
         config_dir = self.config_manager.config_dir
         return os.path.join(config_dir, "problems_metadata.json")
 
+    def get_catalogue_path(self) -> str:
+        """
+        Construct the path to the problems.db SQLite catalogue in config_dir.
+        """
+        config_dir = self.config_manager.config_dir
+        return os.path.join(config_dir, "problems.db")
+
+    def get_problems_snapshot_path(self) -> str:
+        """
+        Construct the path to problems_snapshot.bin in config_dir.
+        """
+        config_dir = self.config_manager.config_dir
+        return os.path.join(config_dir, "problems_snapshot.bin")
+
     #
     # ──────────────────────────────────────────────────────
     #   PRIVATE HELPERS
     # ──────────────────────────────────────────────────────
     #
 
-    def _matches_tags(self, question: dict, required_tags: list[str]) -> bool:
+    def _export_metadata(self, count: int) -> None:
         """
-        Helper to check if the question has all the required tags.
-        'topicTags' is typically a list of dicts with 'slug' keys.
+        Writes problems_metadata.json (in the `problemset_data` response shape) from the
+        catalogue one question at a time, then the snapshot matching it.
         """
-        question_tags = [t.get("slug", "").lower() for t in question.get("topicTags", [])]
+        directory = os.path.dirname(self.problems_data_path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(f'{{"data":{{"problemsetQuestionList":{{"total":{count},"questions":[')
+                    for position, question in enumerate(self.catalogue.iter_questions()):
+                        if position:
+                            f.write(",")
+                        f.write(json.dumps(question, separators=(",", ":")))
+                    f.write("]}}}")
+                os.replace(tmp_path, self.problems_data_path)
+
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
+                raise
+
+            logger.info(f"Problem set data saved to '{self.problems_data_path}'.")
+
+        except OSError as e:
+            logger.error(f"Failed to save problems_metadata.json: {e}")
+            raise ProblemSetError("Failed to save problems_metadata.json.") from e
+
+        self._save_snapshot(self.catalogue.iter_questions(), self._metadata_signature())
+
+    def _metadata_signature(self) -> tuple | None:
+        """
+        Identifies the current problems_metadata.json by modification time and size.
+        Returns None if the file does not exist.
+        """
+        try:
+            stat = os.stat(self.problems_data_path)
+            return (stat.st_mtime_ns, stat.st_size)
+
+        except OSError:
+            return None
+
+    def _open_snapshot(self, signature: tuple | None) -> ProblemSetSnapshot | None:
+        """
+        Maps problems_snapshot.bin if it was built from the metadata file identified by `signature`.
+        Returns None if the snapshot is missing, stale or unreadable.
+        """
+        if signature is None or not os.path.exists(self.problems_snapshot_path):
+            return None
+
+        try:
+            snapshot = ProblemSetSnapshot.open(self.problems_snapshot_path)
+
+        except (OSError, ValueError, struct.error) as e:
+            logger.warning(f"problems_snapshot.bin is unreadable, rebuilding: {e}")
+            return None
+
+        if snapshot.source_signature != signature:
+            logger.debug("problems_snapshot.bin is stale, rebuilding.")
+            snapshot.close()
+            return None
+
+        logger.debug("Mapped problem set snapshot from problems_snapshot.bin.")
+        return snapshot
+
+    def _rebuild_snapshot(self, signature: tuple | None) -> ProblemSetSnapshot:
+        """
+        Builds the snapshot from problems_metadata.json, persists it and maps it.
+        Falls back to an in-memory snapshot if it cannot be written.
+        """
+        data = self.load_problemset_metadata()
+        questions = data.get("data", {}).get("problemsetQuestionList", {}).get("questions", [])
+        return self._save_snapshot(questions, signature)
+
+    def _save_snapshot(self, questions, signature: tuple | None) -> ProblemSetSnapshot:
+        """
+        Encodes questions as the snapshot of the metadata file identified by `signature`, writes
+        it when the metadata exists, and makes it the snapshot used by the rest of this process.
+
+        The previous snapshot is not closed: callers may still be reading it, so it is released
+        when the last reference goes away.
+        """
+        with _SNAPSHOTS_LOCK:
+            try:
+                data = build_snapshot(questions, signature)
+
+            except (KeyError, ValueError, TypeError) as e:
+                logger.warning(f"Problem set metadata cannot be indexed, ignoring it: {e}")
+                data = build_snapshot([])
+
+            snapshot = ProblemSetSnapshot(data)
+            if signature is not None:
+                try:
+                    write_snapshot(self.problems_snapshot_path, data)
+                    snapshot = ProblemSetSnapshot.open(self.problems_snapshot_path)
+                    logger.debug(f"Problem set snapshot saved to '{self.problems_snapshot_path}'.")
+
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Failed to save problems_snapshot.bin: {e}")
 
-        return all(required_tag.lower() in question_tags for required_tag in required_tags)
+            _LOADED_SNAPSHOTS[self.problems_data_path] = snapshot
+            return snapshot
@@ -0,0 +1,354 @@
+import contextlib
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Iterable
+from typing import Any
+
+MAGIC = b"LCPS"
+FORMAT_VERSION = 2
+
+# Difficulty and status columns store small codes; index 0 is "unknown" / no status.
+DIFFICULTIES = ("", "Easy", "Medium", "Hard")
+STATUSES = (None, "ac", "notac")
+
+# (name, array typecode) of every section, in file order. Offsets tables have count + 1 entries.
+SECTIONS = (
+    ("question_ids", "I"),
+    ("frontend_ids", "I"),
+    ("difficulties", "B"),
+    ("ac_rates", "d"),
+    ("paid_only", "B"),
+    ("statuses", "B"),
+    ("slug_offsets", "I"),
+    ("slug_data", "B"),
+    ("title_offsets", "I"),
+    ("title_data", "B"),
+    ("tag_name_offsets", "I"),
+    ("tag_name_data", "B"),
+    ("tag_offsets", "I"),
+    ("tag_ids", "H"),
+    ("by_slug", "I"),
+    ("by_frontend_id", "I"),
+    ("by_question_id", "I"),
+    ("difficulty_bits", "B"),
+    ("tag_bits", "B"),
+)
+
+# magic, version, little-endian flag, question count, source mtime_ns, source size
+HEADER = struct.Struct("<4sHHIqq")
+# offset, number of items of one section
+SECTION_ENTRY = struct.Struct("<QQ")
+# Sections start on this boundary so every column can be viewed with its item size.
+ALIGNMENT = 8
+
+
+class ProblemSetSnapshot:
+    """
+    Columnar, memory-mapped snapshot of the cached problemset.
+
+    Numeric fields (ids, difficulty, acRate, paid-only flag, status) are fixed-width arrays and
+    slugs, titles and tag names are interned string tables (an offsets array plus one UTF-8
+    blob). Sorted permutations by slug, frontend ID and question ID answer lookups by binary
+    search. Nothing is decoded up front: a lookup or random pick only touches the pages of the
+    columns it reads, and a question dict is only built for the questions that are returned.
+
+    Every difficulty and every tag also has a bitset row (bit i set if question i matches), so
+    difficulty and multi-tag filters are a few bitwise ANDs of Python ints.
+
+    The header records the modification time and size of the problems_metadata.json the
+    snapshot was built from, so a stale snapshot can be detected without reading it.
+    """
+
+    def __init__(self, buffer: bytes | bytearray | mmap.mmap):
+        self._buffer = buffer
+        self._view = view = memoryview(buffer)
+
+        magic, version, little_endian, self._count, mtime_ns, size = HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != FORMAT_VERSION or bool(little_endian) != (sys.byteorder == "little"):
+            raise ValueError("Not a problemset snapshot of this version.")
+
+        self.source_signature = (mtime_ns, size)
+        self._row_bytes = _bitset_row_bytes(self._count)
+        self._tag_ids: dict[str, int] | None = None
+        self._columns: dict[str, memoryview] = {}
+
+        for position, (name, typecode) in enumerate(SECTIONS):
+            offset, length = SECTION_ENTRY.unpack_from(view, HEADER.size + position * SECTION_ENTRY.size)
+            itemsize = array(typecode).itemsize
+            self._columns[name] = view[offset : offset + length * itemsize].cast(typecode)
+
+    @classmethod
+    def open(cls, path: str) -> "ProblemSetSnapshot":
+        """
+        Memory-maps a snapshot file. Raises OSError or ValueError if it is unreadable.
+        """
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self) -> int:
+        return self._count
+
+    #
+    # ──────────────────────────────────────────────────────
+    #   PUBLIC METHODS
+    # ──────────────────────────────────────────────────────
+    #
+
+    def get(self, key: str, value: str) -> dict[str, Any]:
+        """
+        Returns the question whose `key` equals `value` (case-insensitive), or {} if none matches.
+        titleSlug, frontendQuestionId and questionId are binary searches; other keys scan.
+        """
+        needle = str(value).lower()
+
+        if key == "titleSlug":
+            index = self._search("by_slug", needle, lambda i: self.title_slug(i).lower())
+        elif key in ("frontendQuestionId", "questionId"):
+            column = "frontend_ids" if key == "frontendQuestionId" else "question_ids"
+            ids = self._columns[column]
+            permutation = "by_frontend_id" if key == "frontendQuestionId" else "by_question_id"
+            index = self._search(permutation, int(needle), ids.__getitem__) if needle.isdigit() else None
+        else:
+            index = next((i for i in range(self._count) if str(self.question(i).get(key, "")).lower() == needle), None)
+
+        return self.question(index) if index is not None else {}
+
+    def question(self, index: int) -> dict[str, Any]:
+        """
+        Builds the raw `problemset_data` question dict of one question.
+        """
+        columns = self._columns
+        tag_offsets = columns["tag_offsets"]
+        tag_ids = columns["tag_ids"][tag_offsets[index] : tag_offsets[index + 1]]
+
+        return {
+            "acRate": columns["ac_rates"][index],
+            "difficulty": DIFFICULTIES[columns["difficulties"][index]],
+            "questionId": str(columns["question_ids"][index]),
+            "topicTags": [{"slug": self.tag_name(tag_id)} for tag_id in tag_ids],
+            "frontendQuestionId": str(columns["frontend_ids"][index]),
+            "paidOnly": bool(columns["paid_only"][index]),
+            "status": STATUSES[columns["statuses"][index]],
+            "title": self._string("title", index),
+            "titleSlug": self.title_slug(index),
+        }
+
+    def title_slug(self, index: int) -> str:
+        return self._string("slug", index)
+
+    def title_slugs(self) -> list[str]:
+        return [self.title_slug(index) for index in range(self._count)]
+
+    def tag_name(self, tag_id: int) -> str:
+        return self._string("tag_name", tag_id)
+
+    def match(self, difficulty: str | None = None, tags: list[str] | None = None) -> int:
+        """
+        Returns the bitset (bit i for question i) of the questions with the given difficulty and
+        all of the given tags (case-insensitive). No filter matches every question.
+        """
+        bits = (1 << self._count) - 1
+
+        if difficulty:
+            code = _difficulty_code(difficulty)
+            bits &= self._bitset_row("difficulty_bits", code - 1) if code else 0
+
+        for tag in tags or []:
+            tag_id = self._get_tag_ids().get(tag.lower())
+            bits &= self._bitset_row("tag_bits", tag_id) if tag_id is not None else 0
+            if not bits:
+                break
+
+        return bits
+
+    def random_index(self, difficulty: str | None = None, tags: list[str] | None = None) -> int | None:
+        """
+        Returns the index of a uniformly random question matching the filters, or None.
+        """
+        bits = self.match(difficulty, tags)
+        count = bits.bit_count()
+        if not count:
+            return None
+
+        return _nth_set_bit(bits, random.randrange(count), self._row_bytes)
+
+    def close(self) -> None:
+        """
+        Releases the memory map (if any). The snapshot must not be used afterwards.
+        """
+        for column in self._columns.values():
+            column.release()
+        self._columns.clear()
+        self._view.release()
+
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    #
+    # ──────────────────────────────────────────────────────
+    #   PRIVATE HELPERS
+    # ──────────────────────────────────────────────────────
+    #
+
+    def _string(self, table: str, index: int) -> str:
+        offsets = self._columns[f"{table}_offsets"]
+        return self._columns[f"{table}_data"][offsets[index] : offsets[index + 1]].tobytes().decode("utf-8")
+
+    def _bitset_row(self, section: str, row: int) -> int:
+        start = row * self._row_bytes
+        return int.from_bytes(self._columns[section][start : start + self._row_bytes], "little")
+
+    def _get_tag_ids(self) -> dict[str, int]:
+        if self._tag_ids is None:
+            tag_count = len(self._columns["tag_name_offsets"]) - 1
+            self._tag_ids = {self.tag_name(tag_id): tag_id for tag_id in range(tag_count)}
+        return self._tag_ids
+
+    def _search(self, permutation: str, needle, key_of) -> int | None:
+        """
+        Binary search over a sorted permutation of question indices, comparing `key_of(index)`.
+        """
+        order = self._columns[permutation]
+        low, high = 0, len(order)
+        while low < high:
+            middle = (low + high) // 2
+            if key_of(order[middle]) < needle:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < len(order) and key_of(order[low]) == needle:
+            return order[low]
+        return None
+
+
+def build_snapshot(questions: Iterable[dict[str, Any]], source_signature: tuple | None = None) -> bytes:
+    """
+    Encodes raw `problemset_data` question dicts in the snapshot format.
+
+    Raises:
+        ValueError: If a question or frontend ID is not numeric.
+    """
+    columns = {name: array(typecode) for name, typecode in SECTIONS}
+    slugs: list[str] = []
+    titles: list[str] = []
+    tag_names: dict[str, int] = {}
+    columns["tag_offsets"].append(0)
+
+    for question in questions:
+        columns["question_ids"].append(int(question["questionId"]))
+        columns["frontend_ids"].append(int(question["frontendQuestionId"]))
+        columns["difficulties"].append(_difficulty_code(question.get("difficulty") or ""))
+        columns["ac_rates"].append(float(question.get("acRate") or 0.0))
+        columns["paid_only"].append(int(bool(question.get("paidOnly"))))
+        status = question.get("status")
+        columns["statuses"].append(STATUSES.index(status) if status in STATUSES else 0)
+        slugs.append(question.get("titleSlug", ""))
+        titles.append(question.get("title", ""))
+
+        for tag in question.get("topicTags") or []:
+            if tag.get("slug"):
+                columns["tag_ids"].append(tag_names.setdefault(tag["slug"].lower(), len(tag_names)))
+        columns["tag_offsets"].append(len(columns["tag_ids"]))
+
+    _fill_string_table(columns, "slug", slugs)
+    _fill_string_table(columns, "title", titles)
+    _fill_string_table(columns, "tag_name", list(tag_names))
+
+    count = len(slugs)
+    row_bytes = _bitset_row_bytes(count)
+    difficulty_bits = bytearray(row_bytes * (len(DIFFICULTIES) - 1))
+    tag_bits = bytearray(row_bytes * len(tag_names))
+
+    for index in range(count):
+        byte, bit = divmod(index, 8)
+        code = columns["difficulties"][index]
+        if code:
+            difficulty_bits[(code - 1) * row_bytes + byte] |= 1 << bit
+        for tag_id in columns["tag_ids"][columns["tag_offsets"][index] : columns["tag_offsets"][index + 1]]:
+            tag_bits[tag_id * row_bytes + byte] |= 1 << bit
+
+    columns["difficulty_bits"].frombytes(bytes(difficulty_bits))
+    columns["tag_bits"].frombytes(bytes(tag_bits))
+
+    lowered = [slug.lower() for slug in slugs]
+    columns["by_slug"].extend(sorted(range(count), key=lowered.__getitem__))
+    columns["by_frontend_id"].extend(sorted(range(count), key=columns["frontend_ids"].__getitem__))
+    columns["by_question_id"].extend(sorted(range(count), key=columns["question_ids"].__getitem__))
+
+    mtime_ns, size = source_signature or (0, 0)
+    header_size = HEADER.size + len(SECTIONS) * SECTION_ENTRY.size
+    body = bytearray()
+    entries = []
+
+    for name, _ in SECTIONS:
+        body.extend(bytes(-(header_size + len(body)) % ALIGNMENT))
+        entries.append(SECTION_ENTRY.pack(header_size + len(body), len(columns[name])))
+        body.extend(columns[name].tobytes())
+
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, int(sys.byteorder == "little"), count, mtime_ns, size)
+    return header + b"".join(entries) + bytes(body)
+
+
+def write_snapshot(path: str, data: bytes) -> None:
+    """
+    Writes an encoded snapshot atomically, so a process mapping the old file never sees a torn one.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def _difficulty_code(difficulty: str) -> int:
+    lowered = difficulty.lower()
+    return next((code for code, name in enumerate(DIFFICULTIES) if code and name.lower() == lowered), 0)
+
+
+def _bitset_row_bytes(count: int) -> int:
+    """
+    Bytes per bitset row: one bit per question, padded to whole 64-bit words.
+    """
+    return (count + 63) // 64 * 8
+
+
+def _nth_set_bit(bits: int, n: int, row_bytes: int) -> int:
+    """
+    Position of the n-th (0-based) set bit, counting whole 64-bit words before looking inside one.
+    """
+    data = bits.to_bytes(row_bytes, "little")
+    for word_index in range(row_bytes // 8):
+        word = int.from_bytes(data[word_index * 8 : word_index * 8 + 8], "little")
+        ones = word.bit_count()
+        if n < ones:
+            for bit in range(64):
+                if word >> bit & 1:
+                    if n == 0:
+                        return word_index * 64 + bit
+                    n -= 1
+        n -= ones
+
+    raise ValueError("Bitset has fewer set bits than requested.")
+
+
+def _fill_string_table(columns: dict[str, array], table: str, strings: list[str]) -> None:
+    offsets = columns[f"{table}_offsets"]
+    data = columns[f"{table}_data"]
+    offsets.append(0)
+    for string in strings:
+        data.frombytes(string.encode("utf-8"))
+        offsets.append(len(data))
@@ -1,11 +1,17 @@
+import asyncio
 import logging
+import os
+import time
+from collections.abc import Awaitable
 from datetime import UTC, datetime, timedelta
 
-from leetcode_cli.data_fetchers.stats_data_fetcher import (
-    fetch_user_activity,
-    fetch_user_stats,
+from leetcode_cli.data_fetchers.async_fetchers import (
+    fetch_user_activity_async,
+    fetch_user_stats_async,
 )
+from leetcode_cli.data_fetchers.graphql_queries import POOL_SIZE
 from leetcode_cli.exceptions.exceptions import FetchingError, ParsingError, StatsError
+from leetcode_cli.managers.activity_store import ActivityStore
 from leetcode_cli.managers.auth_service import AuthService
 from leetcode_cli.managers.config_manager import ConfigManager
 from leetcode_cli.models.stats import UserActivityModel, UserStatsModel
@@ -16,6 +22,10 @@ from leetcode_cli.parsers.stats_data_parser import (
 
 logger = logging.getLogger(__name__)
 
+ACTIVITY_STORE_DIRNAME = "activity"
+# Users whose stats and calendars are fetched at the same time in multi-user mode.
+MAX_CONCURRENT_USERS = POOL_SIZE
+
 
 class StatsManager:
     """
@@ -26,6 +36,10 @@ class StatsManager:
     def __init__(self, config_manager: ConfigManager, auth_service: AuthService):
         self.config_manager = config_manager
         self.auth_service = auth_service
+        # Wall-clock seconds of each network request made by this manager, keyed by a label
+        # such as "user_calendar(alice, 2024)". Also logged at debug level.
+        self.request_timings: dict[str, float] = {}
+        self.activity_store = ActivityStore(os.path.join(config_manager.config_dir, ACTIVITY_STORE_DIRNAME))
 
     #
     # ──────────────────────────────────────────────────────
@@ -37,31 +51,117 @@ class StatsManager:
         """
         Fetch + parse user stats from LeetCode, returning a UserStatsModel.
         """
+        return asyncio.run(self.get_user_stats_async(username))
+
+    def get_joined_activity(self, username: str, prev_year: int, curr_year: int) -> UserActivityModel:
+        """
+        Fetch raw calendar data for two years, parse them, then join + slice + fill to produce a final UserActivityModel.
+        """
+        return asyncio.run(self.get_joined_activity_async(username, prev_year, curr_year))
+
+    def get_stats_and_activity(
+        self, username: str, prev_year: int, curr_year: int, include_activity: bool = True
+    ) -> tuple[UserStatsModel | StatsError, UserActivityModel | StatsError | None]:
+        """
+        Fetch user stats and (optionally) both calendar years with all requests in flight at once.
+
+        Failures are returned instead of raised, so the caller can still use one result when the
+        other failed. The activity is None when include_activity is False.
+        """
+        return asyncio.run(self.get_stats_and_activity_async(username, prev_year, curr_year, include_activity))
+
+    async def get_stats_and_activity_async(
+        self, username: str, prev_year: int, curr_year: int, include_activity: bool = True
+    ) -> tuple[UserStatsModel | StatsError, UserActivityModel | StatsError | None]:
+        """
+        Coroutine version of get_stats_and_activity.
+        """
+        start = time.perf_counter()
+        calls = [self.get_user_stats_async(username)]
+        if include_activity:
+            calls.append(self.get_joined_activity_async(username, prev_year, curr_year))
+
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, StatsError):
+                raise result
+
+        user_request_time = sum(
+            elapsed
+            for label, elapsed in self.request_timings.items()
+            if label.endswith(f"({username})") or f"({username}, " in label
+        )
+        logger.debug(
+            f"Fetched stats for '{username}' in {time.perf_counter() - start:.3f}s "
+            f"(sum of requests {user_request_time:.3f}s)."
+        )
+
+        user_stats = results[0]
+        user_activity = results[1] if include_activity else None
+        return user_stats, user_activity
+
+    def get_many_stats_and_activity(
+        self, usernames: list[str], prev_year: int, curr_year: int, include_activity: bool = True
+    ) -> dict[str, tuple[UserStatsModel | StatsError, UserActivityModel | StatsError | None]]:
+        """
+        get_stats_and_activity for many users at once, keyed by username in the given order.
+
+        At most MAX_CONCURRENT_USERS users are in flight at a time; their requests share the
+        fetch thread pool, so hundreds of users cost roughly (users / pool size) round trips.
+        """
+        return asyncio.run(self.get_many_stats_and_activity_async(usernames, prev_year, curr_year, include_activity))
+
+    async def get_many_stats_and_activity_async(
+        self, usernames: list[str], prev_year: int, curr_year: int, include_activity: bool = True
+    ) -> dict[str, tuple[UserStatsModel | StatsError, UserActivityModel | StatsError | None]]:
+        """
+        Coroutine version of get_many_stats_and_activity.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_USERS)
+
+        async def fetch_one(username: str):
+            async with semaphore:
+                return await self.get_stats_and_activity_async(username, prev_year, curr_year, include_activity)
+
+        start = time.perf_counter()
+        unique_usernames = list(dict.fromkeys(usernames))
+        results = await asyncio.gather(*(fetch_one(username) for username in unique_usernames))
+
+        logger.debug(
+            f"Fetched stats for {len(unique_usernames)} users in {time.perf_counter() - start:.3f}s "
+            f"(sum of requests {sum(self.request_timings.values()):.3f}s)."
+        )
+        return dict(zip(unique_usernames, results, strict=True))
+
+    async def get_user_stats_async(self, username: str) -> UserStatsModel:
+        """
+        Coroutine version of get_user_stats, so many users can be gathered at once.
+        """
         try:
-            raw = fetch_user_stats(username)
+            raw = await self._timed(f"user_problem_stats({username})", fetch_user_stats_async(username))
             return parse_user_stats_data(raw)
 
         except (FetchingError, ParsingError) as e:
             logger.error(f"Failed to get_user_stats: {e}")
             raise StatsError(str(e)) from e
 
-    def get_joined_activity(self, username: str, prev_year: int, curr_year: int) -> UserActivityModel:
+    async def get_joined_activity_async(self, username: str, prev_year: int, curr_year: int) -> UserActivityModel:
         """
-        Fetch raw calendar data for two years, parse them, then join + slice + fill to produce a final UserActivityModel.
+        Coroutine version of get_joined_activity. A finished previous year is served from the
+        local activity store; whatever has to be fetched is fetched concurrently.
         """
         try:
-            # 1) fetch for each year
-            raw_prev = fetch_user_activity(username, prev_year)
-            raw_curr = fetch_user_activity(username, curr_year)
-            # 2) parse each
-            prev_dict = parse_single_year_calendar(raw_prev)  # Dict[int, int]
-            curr_dict = parse_single_year_calendar(raw_curr)  # Dict[int, int]
-
-            # 3) merge + slice + fill
+            # 1) fetch (or load) each year
+            prev_dict, curr_dict = await asyncio.gather(
+                self._get_year_activity_async(username, prev_year, use_store=True),
+                self._get_year_activity_async(username, curr_year, use_store=False),
+            )
+
+            # 2) merge + slice + fill
             joined = self._join_and_slice_calendars(prev_dict, curr_dict)
             filled = self._fill_daily_activity(joined)
 
-            # 4) return final model
+            # 3) return final model
             return UserActivityModel(daily_activity=filled)
 
         except (FetchingError, ParsingError) as e:
@@ -74,6 +174,35 @@ class StatsManager:
     # ──────────────────────────────────────────────────────
     #
 
+    async def _get_year_activity_async(self, username: str, year: int, use_store: bool) -> dict[int, int]:
+        """
+        Returns {timestamp -> submissionCount} for one year, from the activity store when
+        `use_store` is set and the stored year is final, otherwise from LeetCode.
+        Fetched years are written back to the store.
+        """
+        if use_store:
+            stored = self.activity_store.get_final_year(username, year)
+            if stored is not None:
+                return stored
+
+        raw = await self._timed(f"user_calendar({username}, {year})", fetch_user_activity_async(username, year))
+        daily_activity = parse_single_year_calendar(raw)
+        self.activity_store.save_year(username, year, daily_activity)
+        return daily_activity
+
+    async def _timed(self, label: str, request: Awaitable):
+        """
+        Awaits a request and records how long it took in request_timings.
+        """
+        start = time.perf_counter()
+        try:
+            return await request
+
+        finally:
+            elapsed = time.perf_counter() - start
+            self.request_timings[label] = elapsed
+            logger.debug(f"Request {label} took {elapsed:.3f}s.")
+
     def _join_and_slice_calendars(self, prev_data: dict[int, int], curr_data: dict[int, int]) -> dict[int, int]:
         """
         Merges two dicts of {timestamp -> submissionCount}, then slices to the last 365 days.
@@ -0,0 +1,112 @@
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+logger = logging.getLogger(__name__)
+
+# Journal states of a solution file in batch submissions.
+PENDING = "pending"
+ACCEPTED = "accepted"
+REJECTED = "rejected"
+FAILED = "failed"
+
+
+class SubmissionJournal:
+    """
+    Records the progress of batch submissions in one JSON file, keyed by absolute file path.
+
+    Every entry holds a hash of the submitted code and language, so a file is only considered
+    done while it is unchanged. The file is rewritten atomically after each change, so an
+    interrupted run can resume: accepted files are skipped and pending submissions are polled
+    again instead of being resubmitted.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entries: dict[str, dict] | None = None
+
+    #
+    # ──────────────────────────────────────────────────────
+    #   PUBLIC METHODS
+    # ──────────────────────────────────────────────────────
+    #
+
+    def get(self, file_path: str, code: str, lang_slug: str) -> dict | None:
+        """
+        Returns the entry of a file if it was recorded for this exact code, else None.
+        """
+        entry = self._load().get(os.path.abspath(file_path))
+        if not entry or entry.get("code_hash") != self.code_hash(code, lang_slug):
+            return None
+        return entry
+
+    def record(self, file_path: str, code: str, lang_slug: str, state: str, **details) -> None:
+        """
+        Sets the state of a file (with extra details such as the check URL) and saves the journal.
+        """
+        self._load()[os.path.abspath(file_path)] = {
+            "code_hash": self.code_hash(code, lang_slug),
+            "state": state,
+            "updated_at": time.time(),
+            **details,
+        }
+        self._save()
+
+    def forget(self, file_paths: list[str]) -> None:
+        """
+        Drops the entries of the given files, so they are submitted again.
+        """
+        entries = self._load()
+        for file_path in file_paths:
+            entries.pop(os.path.abspath(file_path), None)
+        self._save()
+
+    @staticmethod
+    def code_hash(code: str, lang_slug: str) -> str:
+        return hashlib.sha256(f"{lang_slug}\0{code}".encode()).hexdigest()
+
+    #
+    # ──────────────────────────────────────────────────────
+    #   PRIVATE HELPERS
+    # ──────────────────────────────────────────────────────
+    #
+
+    def _load(self) -> dict[str, dict]:
+        if self._entries is not None:
+            return self._entries
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._entries = json.load(f).get("entries", {})
+
+        except FileNotFoundError:
+            self._entries = {}
+
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable submission journal '{self.path}': {e}")
+            self._entries = {}
+
+        return self._entries
+
+    def _save(self) -> None:
+        directory = os.path.dirname(self.path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"entries": self._entries}, f, indent=2)
+                os.replace(tmp_path, self.path)
+
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
+                raise
+
+        except OSError as e:
+            logger.warning(f"Failed to save submission journal '{self.path}': {e}")
@@ -1,14 +1,18 @@
 import logging
 import os
-
-import yaml
+import pickle
 
 from leetcode_cli.exceptions.exceptions import ThemeError
 from leetcode_cli.managers.config_manager import ConfigManager
-from leetcode_cli.models.theme import ThemeData
+from leetcode_cli.models.theme import CompiledTheme, ThemeData
 
 logger = logging.getLogger(__name__)
 
+THEME_FILES = ("ansi_codes.yaml", "symbols.yaml", "styles.yaml")
+
+# Bump when CompiledTheme changes shape, so pickles written by older versions are rebuilt.
+COMPILED_THEME_FORMAT = 1
+
 
 class ThemeManager:
     """
@@ -23,15 +27,20 @@ class ThemeManager:
 
     Private helpers:
       - _get_themes_dir()
+      - _compile_theme()
       - _parse_ansi_codes()
       - _parse_symbols()
       - _load_yaml_file()
+
+    Themes are compiled once into a flat (section, key) -> (ansi, icon) table, which is
+    pickled under ~/.leetcode/compiled_themes/ and reused until a theme YAML file changes.
     """
 
     def __init__(self, config_manager: ConfigManager):
         self.config_manager = config_manager
         self.themes_dir = self.get_themes_dir()
         self.theme_data: ThemeData | None = None
+        self.compiled_theme: CompiledTheme | None = None
         self.raw_style: bool = False
 
     #
@@ -76,36 +85,33 @@ class ThemeManager:
             return False
 
         self.config_manager.set_theme(theme_name)
+        self.theme_data = None
+        self.compiled_theme = None
         logger.info(f"Theme set to '{theme_name}'.")
 
         return True
 
     def load_theme_data(self) -> ThemeData:
         """
-        Loads the theme data from local YAML files into a ThemeData object.
+        Loads the current theme, compiling it if the YAML files changed since it was last compiled.
+        Subsequent calls return the already loaded ThemeData.
         Raises ThemeError if mandatory fields or files are missing.
         """
         theme_name = self.get_current_theme()
         if not theme_name:
             raise ThemeError("No theme is set in config.json. (key='theme')")
 
-        ansi_data = self._load_yaml_file(theme_name, "ansi_codes.yaml")
-        symbols_data = self._load_yaml_file(theme_name, "symbols.yaml")
-        styles_data = self._load_yaml_file(theme_name, "styles.yaml")
+        if self.compiled_theme is not None:
+            return self.compiled_theme.theme_data
 
-        if "ANSI_CODES" not in ansi_data:
-            raise ThemeError(f"'ANSI_CODES' missing in ansi_codes.yaml for theme '{theme_name}'.")
-
-        if "SYMBOLS" not in symbols_data:
-            raise ThemeError(f"'SYMBOLS' missing in symbols.yaml for theme '{theme_name}'.")
+        signature = self._theme_signature(theme_name)
+        compiled = self._load_compiled_theme(theme_name, signature)
 
-        logger.debug(f"Theme data loaded for '{theme_name}'.")
+        if compiled is None:
+            compiled = self._compile_theme(theme_name, signature)
 
-        self.theme_data = ThemeData(
-            ANSI_CODES=ansi_data["ANSI_CODES"],
-            SYMBOLS=symbols_data["SYMBOLS"],
-            styles=styles_data,
-        )
+        self.compiled_theme = compiled
+        self.theme_data = compiled.theme_data
         return self.theme_data
 
     def get_styling(self, section: str, key: str) -> tuple:
@@ -113,44 +119,134 @@ class ThemeManager:
         Returns (combined_ansi_code, icon_string).
         E.g., ("\033[32m\033[1m", "✔")
         """
-        if not self.theme_data:
-            self.theme_data = self.load_theme_data()
+        if self.compiled_theme is None:
+            self.load_theme_data()
 
-        section_data = self.theme_data.styles.get(section)
-        if section_data is None:
-            raise ThemeError(f"Section '{section}' not found in theme styles.")
-
-        raw_mapping = section_data.get(key)
-        if raw_mapping is None:
+        styling = self.compiled_theme.styles.get((section, key))
+        if styling is None:
+            if section not in self.theme_data.styles:
+                raise ThemeError(f"Section '{section}' not found in theme styles.")
             raise ThemeError(f"Key '{key}' not found in section '{section}'.")
 
         if self.raw_style:
             return (f"[{section}.{key}]", "")
 
-        combined_ansi = self._parse_ansi_codes(raw_mapping.get("style", ""))
-        icon = self._parse_symbols(raw_mapping.get("icon", ""))
-
-        return (combined_ansi, icon)
+        return styling
 
     def get_layout_value(self, key: str, default=None):
         """
         Returns a value from the 'layout' section of the theme styles.
         """
         if not self.theme_data:
-            self.theme_data = self.load_theme_data()
+            self.load_theme_data()
 
         layout = self.theme_data.styles.get("layout", {})
         return layout.get(key, default)
 
+    def get_compiled_theme_path(self, theme_name: str) -> str:
+        """
+        Construct the path to the compiled pickle of `theme_name` in config_dir.
+        """
+        return os.path.join(self.config_manager.config_dir, "compiled_themes", f"{theme_name}.pickle")
+
     #
     # ──────────────────────────────────────────────────────
     #   PRIVATE METHODS
     # ──────────────────────────────────────────────────────
     #
 
-    def _parse_ansi_codes(self, ansi_field: str) -> str:
+    def _theme_signature(self, theme_name: str) -> tuple:
+        """
+        Identifies the current YAML files of a theme by modification time and size.
+        Raises ThemeError if one of them is missing.
+        """
+        stamps = []
+        for filename in THEME_FILES:
+            try:
+                stat = os.stat(os.path.join(self.themes_dir, theme_name, filename))
+            except OSError:
+                raise ThemeError(f"File '{filename}' is missing for theme '{theme_name}'.") from None
+
+            stamps.append((stat.st_mtime_ns, stat.st_size))
+
+        return (COMPILED_THEME_FORMAT, theme_name, *stamps)
+
+    def _load_compiled_theme(self, theme_name: str, signature: tuple) -> CompiledTheme | None:
+        """
+        Loads the pickled CompiledTheme if it was built from the files identified by `signature`.
+        Returns None if the pickle is missing, stale or unreadable.
+        """
+        path = self.get_compiled_theme_path(theme_name)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                compiled = pickle.load(f)
+
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+            logger.warning(f"Compiled theme '{path}' is unreadable, recompiling: {e}")
+            return None
+
+        if not isinstance(compiled, CompiledTheme) or compiled.source_signature != signature:
+            logger.debug(f"Compiled theme for '{theme_name}' is stale, recompiling.")
+            return None
+
+        logger.debug(f"Loaded compiled theme for '{theme_name}'.")
+        return compiled
+
+    def _compile_theme(self, theme_name: str, signature: tuple) -> CompiledTheme:
+        """
+        Parses the theme YAML files, resolves every style entry to its final ANSI/icon strings
+        and persists the result for later runs.
+        """
+        ansi_data = self._load_yaml_file(theme_name, "ansi_codes.yaml")
+        symbols_data = self._load_yaml_file(theme_name, "symbols.yaml")
+        styles_data = self._load_yaml_file(theme_name, "styles.yaml")
+
+        if "ANSI_CODES" not in ansi_data:
+            raise ThemeError(f"'ANSI_CODES' missing in ansi_codes.yaml for theme '{theme_name}'.")
+
+        if "SYMBOLS" not in symbols_data:
+            raise ThemeError(f"'SYMBOLS' missing in symbols.yaml for theme '{theme_name}'.")
+
+        theme_data = ThemeData(
+            ANSI_CODES=ansi_data["ANSI_CODES"],
+            SYMBOLS=symbols_data["SYMBOLS"],
+            styles=styles_data,
+        )
+
+        styles = {}
+        for section, entries in styles_data.items():
+            if not isinstance(entries, dict):
+                continue
+
+            for key, raw_mapping in entries.items():
+                # Non-mapping entries (e.g. layout.section_spacing) are plain values, not styles.
+                if isinstance(raw_mapping, dict):
+                    styles[(section, key)] = (
+                        self._parse_ansi_codes(theme_data, raw_mapping.get("style", "")),
+                        self._parse_symbols(theme_data, raw_mapping.get("icon", "")),
+                    )
+
+        compiled = CompiledTheme(theme_data=theme_data, styles=styles, source_signature=signature)
+        logger.debug(f"Theme '{theme_name}' compiled ({len(styles)} styles).")
+
+        path = self.get_compiled_theme_path(theme_name)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        except OSError as e:
+            logger.warning(f"Failed to save compiled theme '{path}': {e}")
+
+        return compiled
+
+    @staticmethod
+    def _parse_ansi_codes(theme_data: ThemeData, ansi_field: str) -> str:
         """
-        Convert "green,bold" -> combined ANSI codes from self.theme_data.ANSI_CODES.
+        Convert "green,bold" -> combined ANSI codes from theme_data.ANSI_CODES.
         Raises ThemeError if a code isn't found in 'ANSI_CODES'.
         """
         if not ansi_field:
@@ -160,15 +256,16 @@ class ThemeManager:
         final = ""
         for code_key in codes:
             code_key = code_key.strip().lower()
-            if code_key not in self.theme_data.ANSI_CODES:
+            if code_key not in theme_data.ANSI_CODES:
                 raise ThemeError(
                     f"ANSI code '{code_key}' not found in 'ANSI_CODES' mapping. Theme configuration is malformed."
                 )
-            final += self.theme_data.ANSI_CODES[code_key]
+            final += theme_data.ANSI_CODES[code_key]
 
         return final
 
-    def _parse_symbols(self, symbol_field: str) -> str:
+    @staticmethod
+    def _parse_symbols(theme_data: ThemeData, symbol_field: str) -> str:
         """
         Convert "checkmark,space" -> "✔ ".
         Raises ThemeError if symbol isn't found in 'SYMBOLS'.
@@ -180,9 +277,9 @@ class ThemeManager:
         final = ""
         for p in parts:
             p = p.strip().lower()
-            if p not in self.theme_data.SYMBOLS:
+            if p not in theme_data.SYMBOLS:
                 raise ThemeError(f"Symbol '{p}' not found in 'SYMBOLS' mapping. Theme configuration is malformed.")
-            final += self.theme_data.SYMBOLS[p]
+            final += theme_data.SYMBOLS[p]
         return final
 
     def _load_yaml_file(self, theme_name: str, filename: str) -> dict:
@@ -194,6 +291,8 @@ class ThemeManager:
         if not os.path.exists(file_path):
             raise ThemeError(f"File '{filename}' is missing for theme '{theme_name}'.")
 
+        import yaml
+
         try:
             with open(file_path, encoding="utf-8") as f:
                 data = yaml.safe_load(f)
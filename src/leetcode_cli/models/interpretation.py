@@ -42,3 +42,19 @@ class InterpretationResult:
     submission_id: str | None
     status_msg: str
     state: str
+
+
+@dataclass
+class InterpretationRun:
+    """
+    One 'Run Code' job of a batch test: the solution to run and, once finished, either its
+    result (with the example testcases it ran against) or the error that stopped it.
+    """
+
+    file_path: str
+    title_slug: str
+    code: str
+    lang_slug: str
+    testcases: str = ""
+    result: InterpretationResult | None = None
+    error: Exception | None = None
@@ -34,3 +34,19 @@ class SubmissionResult:
     input: str | None
     status_msg: str
     state: str
+
+
+@dataclass
+class SubmissionRun:
+    """
+    One solution file of a batch submission and, once finished, its result or the error
+    that stopped it. `skipped` marks files the journal already records as accepted.
+    """
+
+    file_path: str
+    title_slug: str
+    code: str
+    lang_slug: str
+    result: SubmissionResult | None = None
+    error: Exception | None = None
+    skipped: bool = False
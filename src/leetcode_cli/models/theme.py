@@ -12,3 +12,16 @@ class ThemeData:
     ANSI_CODES: dict[str, str] = field(default_factory=dict)
     SYMBOLS: dict[str, str] = field(default_factory=dict)
     styles: dict[str, dict[str, dict[str, str]]] = field(default_factory=dict)
+
+
+@dataclass
+class CompiledTheme:
+    """
+    A theme resolved for fast lookups: `styles` maps (section, key) to the final
+    (combined_ansi_code, icon_string) pair, so styling needs no string parsing.
+    source_signature identifies the YAML files it was compiled from.
+    """
+
+    theme_data: ThemeData
+    styles: dict[tuple[str, str], tuple[str, str]] = field(default_factory=dict)
+    source_signature: tuple | None = None
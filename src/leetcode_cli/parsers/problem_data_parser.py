@@ -1,9 +1,11 @@
 import json
-
-from bs4 import BeautifulSoup, NavigableString, Tag
+from typing import TYPE_CHECKING
 
 from leetcode_cli.models.problem import Problem
 
+if TYPE_CHECKING:
+    from bs4 import Tag
+
 
 def parse_problem_data(json_data: dict) -> Problem:
     """
@@ -15,6 +17,9 @@ def parse_problem_data(json_data: dict) -> Problem:
     Returns:
         Problem: An instance of the Problem dataclass populated with parsed data.
     """
+    # bs4 is slow to import, so it is only loaded once a problem is actually parsed.
+    from bs4 import BeautifulSoup, Tag
+
     question = json_data.get("data", {}).get("question", {})
 
     # Extract basic fields
@@ -130,7 +135,7 @@ def parse_problem_data(json_data: dict) -> Problem:
     return problem
 
 
-def _parse_div_example_block(example_title: str, example_div: Tag) -> dict:
+def _parse_div_example_block(example_title: str, example_div: "Tag") -> dict:
     """
     Handles the 'newer' style examples that look like:
       <div class="example-block">
@@ -142,6 +147,8 @@ def _parse_div_example_block(example_title: str, example_div: Tag) -> dict:
 
     Returns a dict { "title", "input", "output", "explanation" }
     """
+    from bs4 import NavigableString, Tag
+
     example = {
         "title": example_title,
         "input": [],
@@ -190,7 +197,7 @@ def _parse_div_example_block(example_title: str, example_div: Tag) -> dict:
     return example
 
 
-def _parse_pre_example_block(example_title: str, pre_tag: Tag) -> dict:
+def _parse_pre_example_block(example_title: str, pre_tag: "Tag") -> dict:
     """
     Handles the 'old' style example using <pre> with multiple <strong> sections
     for "Input", "Output", "Explanation".
@@ -44,7 +44,7 @@ def parse_user_stats_data(json_data: dict[str, Any]) -> UserStatsModel:
     except KeyError as e:
         logger.error(f"Missing key in stats data: {e}")
         raise ParsingError(f"Missing key in stats data: {e}") from e
-    except TypeError as e:
+    except (TypeError, AttributeError) as e:
         logger.error(f"Invalid structure in stats data: {e}")
         raise ParsingError(f"Invalid structure in stats data: {e}") from e
 